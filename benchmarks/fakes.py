@@ -0,0 +1,251 @@
+"""Local stand-ins for Miniflux, article origins and an OpenAI-compatible LLM API."""
+
+import json
+import random
+import re
+import threading
+import time
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, ClassVar
+from urllib.parse import urlparse
+
+LOREM = (
+    "Minigist benchmark paragraph with enough prose to look like a real article to the extractor. "
+    "It mentions dates such as 2024 and numbers such as 42 percent so that summaries have material. "
+)
+
+
+class FakeServer:
+    """Run a threading HTTP server in the background."""
+
+    handler_class: ClassVar[type[BaseHTTPRequestHandler]]
+
+    def __init__(self, host: str = "127.0.0.1") -> None:
+        """Bind the server to an ephemeral port on the given loopback address."""
+        self.httpd = ThreadingHTTPServer((host, 0), self.handler_class)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self  # type: ignore[attr-defined]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Return the base URL of the server."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def __enter__(self) -> "FakeServer":
+        """Start serving requests."""
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> bool:
+        """Stop serving requests."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        return False
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    @property
+    def fake(self) -> Any:
+        return self.server.fake  # type: ignore[attr-defined]
+
+    def _send_json(self, status: int, payload: object) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length", "0"))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+
+class _MinifluxHandler(_JSONHandler):
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        if parsed.path == "/v1/feeds":
+            self._send_json(200, self.fake.feeds())
+            return
+
+        if parsed.path == "/v1/entries":
+            self._send_json(200, self.fake.entries_response(None))
+            return
+
+        match = re.fullmatch(r"/v1/feeds/(\d+)/entries", parsed.path)
+        if match:
+            self._send_json(200, self.fake.entries_response(int(match.group(1))))
+            return
+
+        self._send_json(404, {"error_message": "not found"})
+
+    def do_PUT(self) -> None:
+        match = re.fullmatch(r"/v1/entries/(\d+)", urlparse(self.path).path)
+        if not match:
+            self._send_json(404, {"error_message": "not found"})
+            return
+
+        entry = self.fake.update_entry(int(match.group(1)), self._read_json().get("content", ""))
+        if entry is None:
+            self._send_json(404, {"error_message": "entry not found"})
+            return
+        self._send_json(201, entry)
+
+
+class FakeMiniflux(FakeServer):
+    """Serve a fixed set of unread entries and record content updates."""
+
+    handler_class = _MinifluxHandler
+
+    def __init__(self, article_urls: list[str], feed_count: int, latency_seconds: float = 0.0) -> None:
+        """Create one unread entry per article URL, spread across feeds."""
+        super().__init__()
+        self.latency_seconds = latency_seconds
+        self.updated_entry_ids: list[int] = []
+        self._lock = threading.Lock()
+        now = datetime.now(UTC).isoformat()
+        self._entries = {
+            entry_id: {
+                "id": entry_id,
+                "user_id": 1,
+                "feed_id": (entry_id % feed_count) + 1,
+                "title": f"Benchmark entry {entry_id}",
+                "url": url,
+                "content": f"<p>Teaser for entry {entry_id}.</p>",
+                "hash": f"hash-{entry_id}",
+                "published_at": now,
+                "created_at": now,
+                "status": "unread",
+            }
+            for entry_id, url in enumerate(article_urls, start=1)
+        }
+        self.feed_count = feed_count
+
+    def feeds(self) -> list[dict[str, object]]:
+        """Return feed metadata."""
+        time.sleep(self.latency_seconds)
+        return [
+            {"id": feed_id, "title": f"Feed {feed_id}", "category": {"id": 1, "title": "Benchmark"}}
+            for feed_id in range(1, self.feed_count + 1)
+        ]
+
+    def entries_response(self, feed_id: int | None) -> dict[str, object]:
+        """Return the entries of one feed or of all feeds."""
+        time.sleep(self.latency_seconds)
+        with self._lock:
+            entries = [
+                dict(entry) for entry in self._entries.values() if feed_id is None or entry["feed_id"] == feed_id
+            ]
+        return {"total": len(entries), "entries": entries}
+
+    def update_entry(self, entry_id: int, content: str) -> dict[str, object] | None:
+        """Replace the content of an entry."""
+        time.sleep(self.latency_seconds)
+        with self._lock:
+            entry = self._entries.get(entry_id)
+            if entry is None:
+                return None
+            entry["content"] = content
+            self.updated_entry_ids.append(entry_id)
+            return dict(entry)
+
+
+class _ArticleHandler(BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        fake: FakeArticleSite = self.server.fake  # type: ignore[attr-defined]
+        time.sleep(fake.latency_seconds)
+        body = fake.render_article(self.path).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeArticleSite(FakeServer):
+    """Serve generated HTML articles of a configurable size after a configurable delay."""
+
+    handler_class = _ArticleHandler
+
+    def __init__(self, host: str = "127.0.0.1", latency_seconds: float = 0.0, article_bytes: int = 8_000) -> None:
+        """Configure the per-request latency and approximate article size."""
+        super().__init__(host)
+        self.latency_seconds = latency_seconds
+        self.article_bytes = article_bytes
+
+    def render_article(self, path: str) -> str:
+        """Render an HTML page for the given path."""
+        paragraph_count = max(1, self.article_bytes // len(LOREM))
+        paragraphs = "\n".join(f"<p>{LOREM}</p>" for _ in range(paragraph_count))
+        return (
+            f"<html><head><title>Article {path}</title></head><body>"
+            f"<article><h1>Article {path}</h1>{paragraphs}</article></body></html>"
+        )
+
+
+class _LLMHandler(_JSONHandler):
+    def do_POST(self) -> None:
+        fake: FakeLLM = self.fake
+        if not self.path.endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        request = self._read_json()
+        time.sleep(fake.sample_latency())
+
+        if fake.should_fail():
+            self._send_json(500, {"error": {"message": "injected failure"}})
+            return
+
+        summary = json.dumps({"summary_markdown": "- **Benchmark** summary", "error": False})
+        self._send_json(
+            200,
+            {
+                "id": "chatcmpl-benchmark",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "benchmark-model"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": summary},
+                    }
+                ],
+                "usage": {"prompt_tokens": 1000, "completion_tokens": 100, "total_tokens": 1100},
+            },
+        )
+
+
+class FakeLLM(FakeServer):
+    """Answer chat completions with a canned structured summary, injecting latency and errors."""
+
+    handler_class = _LLMHandler
+
+    def __init__(self, latency_seconds: float = 0.5, jitter_seconds: float = 0.0, error_rate: float = 0.0) -> None:
+        """Configure latency, latency jitter and the fraction of failed requests."""
+        super().__init__()
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.error_rate = error_rate
+        self._random = random.Random(0)  # nosec B311
+        self._lock = threading.Lock()
+
+    def sample_latency(self) -> float:
+        """Return the latency of the next request."""
+        with self._lock:
+            return self.latency_seconds + self._random.uniform(0, self.jitter_seconds)
+
+    def should_fail(self) -> bool:
+        """Decide whether the next request fails."""
+        with self._lock:
+            return self._random.random() < self.error_rate
@@ -0,0 +1,116 @@
+"""Drive Processor.run end to end against local fakes and report throughput and per-stage latencies.
+
+Usage: python -m benchmarks.pipeline --entries 200 --hosts 4 --llm-latency 0.5
+"""
+
+import argparse
+import json
+import resource
+import time
+from contextlib import ExitStack
+
+from minigist.config import AppConfig
+from minigist.logging import configure_logging
+from minigist.processor import Processor
+
+from .fakes import FakeArticleSite, FakeLLM, FakeMiniflux
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 4) if value is not None else None
+
+
+def build_config(miniflux_url: str, llm_url: str, args: argparse.Namespace) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "miniflux": {"url": miniflux_url, "api_key": "benchmark", "timeout_seconds": 10},
+            "llm": {
+                "api_key": "benchmark",
+                "base_url": llm_url,
+                "model": "benchmark-model",
+                "concurrency": args.llm_concurrency,
+            },
+            "prompts": [{"id": "default", "prompt": "Summarize."}],
+            "fetch": {"limit": args.entries},
+            "scraping": {
+                "timeout_seconds": 10,
+                "concurrency": args.fetch_concurrency,
+                "per_host_delay_seconds": args.per_host_delay,
+            },
+        }
+    )
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, object]:
+    with ExitStack() as stack:
+        sites = [
+            stack.enter_context(
+                FakeArticleSite(
+                    host=f"127.0.0.{index + 1}",
+                    latency_seconds=args.slow_host_latency if index == 0 else args.article_latency,
+                    article_bytes=args.article_bytes,
+                )
+            )
+            for index in range(args.hosts)
+        ]
+        article_urls = [f"{sites[i % len(sites)].base_url}/articles/{i}" for i in range(args.entries)]
+        miniflux = stack.enter_context(FakeMiniflux(article_urls, feed_count=args.feeds))
+        llm = stack.enter_context(
+            FakeLLM(
+                latency_seconds=args.llm_latency,
+                jitter_seconds=args.llm_jitter,
+                error_rate=args.llm_error_rate,
+            )
+        )
+
+        config = build_config(miniflux.base_url, f"{llm.base_url}/v1", args)
+        started_at = time.monotonic()
+        with Processor(config) as processor:
+            stats = processor.run()
+            metrics = processor.metrics.to_dict()
+        elapsed = time.monotonic() - started_at
+
+    histograms = metrics["histograms"]
+    stages = {
+        "|".join(f"{key}={value}" for key, value in series["labels"].items()): {
+            "count": series["count"],
+            "p50_seconds": _round(series["p50"]),
+            "p95_seconds": _round(series["p95"]),
+        }
+        for series in histograms.get("stage_duration_seconds", [])  # type: ignore[union-attr]
+    }
+
+    return {
+        "entries": args.entries,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_entries_per_second": round(stats.processed_successfully / elapsed, 3) if elapsed else None,
+        "processed": stats.processed_successfully,
+        "failed": stats.failed_processing,
+        "peak_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "stages": stages,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=100, help="Number of unread entries.")
+    parser.add_argument("--feeds", type=int, default=5, help="Number of feeds the entries are spread across.")
+    parser.add_argument("--hosts", type=int, default=4, help="Number of distinct article hosts (127.0.0.N).")
+    parser.add_argument("--article-latency", type=float, default=0.05, help="Article response delay in seconds.")
+    parser.add_argument("--slow-host-latency", type=float, default=0.05, help="Response delay of the first host.")
+    parser.add_argument("--article-bytes", type=int, default=8_000, help="Approximate article size in bytes.")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Base LLM response delay in seconds.")
+    parser.add_argument("--llm-jitter", type=float, default=0.1, help="Additional random LLM delay in seconds.")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="Fraction of failed LLM requests.")
+    parser.add_argument("--fetch-concurrency", type=int, default=8, help="Configured article fetch concurrency.")
+    parser.add_argument("--per-host-delay", type=float, default=0.0, help="Politeness delay per host in seconds.")
+    parser.add_argument("--llm-concurrency", type=int, default=5, help="Configured LLM concurrency.")
+    parser.add_argument("--log-level", default="WARNING", help="Log level of the pipeline.")
+    args = parser.parse_args()
+
+    configure_logging(args.log_level)
+    print(json.dumps(run_benchmark(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Circuit breakers that stop calling dependencies which keep failing."""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CircuitBreaker:
+    """Open after `failure_threshold` failures within `window_seconds` and reject calls for `cooldown_seconds`.
+
+    Once the cooldown is over, calls are let through again. If the next outcome is a failure, the
+    breaker opens again right away; a success closes it.
+    """
+
+    failure_threshold: int
+    window_seconds: float
+    cooldown_seconds: float
+    failures: list[float] = field(default_factory=list)
+    opened_until: float = 0.0
+
+    def allows(self, now: float | None = None) -> bool:
+        """Return whether a call may go through."""
+        return (time.time() if now is None else now) >= self.opened_until
+
+    def is_open(self, now: float | None = None) -> bool:
+        """Return whether calls are currently rejected."""
+        return not self.allows(now)
+
+    def record_success(self) -> None:
+        """Close the breaker and forget earlier failures."""
+        self.failures.clear()
+        self.opened_until = 0.0
+
+    def record_failure(self, now: float | None = None) -> bool:
+        """Count a failure and return whether it opened the breaker."""
+        now = time.time() if now is None else now
+        self.failures = [failed_at for failed_at in self.failures if failed_at > now - self.window_seconds]
+        self.failures.append(now)
+
+        # A failure after an earlier opening that was not followed by a success means the probe failed.
+        if self.opened_until or len(self.failures) >= self.failure_threshold:
+            self.opened_until = now + self.cooldown_seconds
+            return True
+        return False
+
+
+class HostCircuitBreakers:
+    """Per-host circuit breakers, optionally persisted as JSON so that later runs skip hosts that are still down."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        window_seconds: float,
+        cooldown_seconds: float,
+        path: Path | None = None,
+    ):
+        """Create the breakers, loading their state from the path if it exists."""
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.path = path.expanduser() if path is not None else None
+        self._lock = threading.Lock()
+        self._breakers = self._load()
+
+    def _new_breaker(self) -> CircuitBreaker:
+        return CircuitBreaker(self.failure_threshold, self.window_seconds, self.cooldown_seconds)
+
+    def _load(self) -> dict[str, CircuitBreaker]:
+        if self.path is None:
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable circuit breaker state", path=str(self.path), error=str(e))
+            return {}
+
+        breakers: dict[str, CircuitBreaker] = {}
+        try:
+            for host, state in data.items():
+                breaker = self._new_breaker()
+                breaker.failures = [float(failed_at) for failed_at in state.get("failures", [])]
+                breaker.opened_until = float(state.get("opened_until", 0.0))
+                breakers[host] = breaker
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning("Ignoring malformed circuit breaker state", path=str(self.path), error=str(e))
+            return {}
+        return breakers
+
+    def allows(self, host: str) -> bool:
+        """Return whether a request to the host may go through."""
+        with self._lock:
+            breaker = self._breakers.get(host)
+            return breaker is None or breaker.allows()
+
+    def record_success(self, host: str) -> None:
+        """Close the host's breaker."""
+        with self._lock:
+            breaker = self._breakers.pop(host, None)
+        if breaker is not None and breaker.opened_until:
+            logger.info("Host is reachable again; closing circuit breaker", host=host)
+
+    def record_failure(self, host: str) -> None:
+        """Count a failed request to the host, opening its breaker once it fails too often."""
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = self._new_breaker()
+            opened = breaker.record_failure()
+        if opened:
+            logger.warning(
+                "Host keeps failing; skipping it until the cooldown ends",
+                host=host,
+                cooldown_seconds=self.cooldown_seconds,
+            )
+
+    def close(self) -> None:
+        """Persist the state of breakers that are open or have recent failures."""
+        if self.path is None:
+            return
+
+        now = time.time()
+        with self._lock:
+            state = {
+                host: {"failures": breaker.failures, "opened_until": breaker.opened_until}
+                for host, breaker in self._breakers.items()
+                if breaker.opened_until > now - self.window_seconds
+                or any(failed_at > now - self.window_seconds for failed_at in breaker.failures)
+            }
+
+        temporary_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_text(json.dumps(state, sort_keys=True), encoding="utf-8")
+            os.replace(temporary_path, self.path)
+        except OSError as e:
+            logger.warning("Failed to save circuit breaker state", path=str(self.path), error=str(e))
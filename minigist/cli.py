@@ -1,20 +1,25 @@
 import sys
+from contextlib import nullcontext
+from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from minigist import config, exceptions, notification
-from minigist.constants import MINIGIST_ENV_PREFIX
+from minigist import exceptions
+from minigist.constants import DEFAULT_STRIP_CHECKPOINT_PATH, MINIGIST_ENV_PREFIX
 from minigist.logging import configure_logging, get_logger
-from minigist.models import ProcessingStats
-from minigist.processor import Processor
+
+if TYPE_CHECKING:
+    from minigist.metrics import PipelineMetrics
+    from minigist.notification import AppriseNotifier
 
 logger = get_logger(__name__)
 
 
 def _handle_critical_error(
     error_instance: Exception,
-    error_notifier: notification.AppriseNotifier,
+    error_notifier: "AppriseNotifier",
     log_message: str,
     notification_message_prefix: str,
 ):
@@ -27,40 +32,37 @@ def _handle_critical_error(
     sys.exit(1)
 
 
-@click.group(context_settings=dict(auto_envvar_prefix=MINIGIST_ENV_PREFIX))
-def cli():
-    """
-    A tool that generates concise summaries for you Miniflux feeds.
-    """
-    pass
+def _export_metrics(metrics: "PipelineMetrics", metrics_file: Path | None, metrics_textfile: Path | None) -> None:
+    """Write collected pipeline metrics to the requested destinations."""
+    try:
+        if metrics_file:
+            metrics.write_json(metrics_file)
+        if metrics_textfile:
+            metrics.write_prometheus_textfile(metrics_textfile)
+    except OSError as e:
+        logger.error("Failed to write metrics", error=str(e))
 
 
-@cli.command()
-@click.option(
-    "--config-file",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    default=None,
-    help="Path to the YAML configuration file.",
-)
-@click.option(
-    "--log-level",
-    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False),
-    default="INFO",
-    show_default=True,
-    help="Set the logging level.",
-)
-@click.option(
-    "--dry-run",
-    is_flag=True,
-    default=False,
-    help="Perform a dry run without updating Miniflux.",
-)
-def run(
+def _process_entries(
     config_file: Path | None,
     log_level: str,
     dry_run: bool,
-):
-    """Fetch entries, summarize, and update Miniflux."""
+    metrics_file: Path | None,
+    metrics_textfile: Path | None,
+    profile: str | None,
+    profile_dir: Path,
+    slow_callback_ms: float,
+    max_duration: float | None,
+    refresh: bool = False,
+    include_unmarked: bool = False,
+) -> None:
+    """Run the summarization pipeline and report its outcome."""
+    # Heavy dependencies are imported here so that the CLI starts quickly.
+    from minigist import config, notification
+    from minigist.models import ProcessingStats
+    from minigist.processor import Processor
+    from minigist.profiling import RunProfiler
+
     configure_logging(log_level)
 
     try:
@@ -74,8 +76,22 @@ def run(
     stats = ProcessingStats(total_considered=0, processed_successfully=0, failed_processing=0)
 
     try:
-        with Processor(app_config, dry_run=dry_run) as processor:
-            stats = processor.run()
+        slow_callback_seconds = slow_callback_ms / 1000 if profile else None
+        profiler = RunProfiler(profile.lower(), profile_dir) if profile else nullcontext()  # type: ignore[arg-type]
+
+        with Processor(
+            app_config,
+            dry_run=dry_run,
+            slow_callback_seconds=slow_callback_seconds,
+            max_duration_seconds=max_duration,
+            refresh=refresh,
+            include_unmarked=include_unmarked,
+        ) as processor:
+            try:
+                with profiler:
+                    stats = processor.run()
+            finally:
+                _export_metrics(processor.metrics, metrics_file, metrics_textfile)
 
     except exceptions.ConfigError as e:
         _handle_critical_error(
@@ -84,12 +100,12 @@ def run(
             log_message="Configuration error during processing",
             notification_message_prefix="Configuration error",
         )
-    except exceptions.TooManyFailuresError as e:
+    except exceptions.DependencyUnavailableError as e:
         _handle_critical_error(
             e,
             notifier,
-            log_message="Processing aborted due to excessive entry failures",
-            notification_message_prefix="Too many entry failures",
+            log_message="Processing aborted because a critical dependency is unavailable",
+            notification_message_prefix="Dependency unavailable",
         )
     except exceptions.MinifluxApiError as e:
         _handle_critical_error(
@@ -109,6 +125,16 @@ def run(
         "total_considered": stats.total_considered,
         "processed_successfully": stats.processed_successfully,
         "failed_processing": stats.failed_processing,
+        "hedged_requests": stats.hedged_requests,
+        "hedge_wins": stats.hedge_wins,
+        "resumed_from_journal": stats.resumed_from_journal,
+        "duplicates_merged": stats.duplicates_merged,
+        "deferred": stats.deferred,
+        "unclaimed": stats.unclaimed,
+        "near_duplicate_hits": stats.near_duplicate_hits,
+        "near_duplicate_hit_rate": (
+            round(stats.near_duplicate_hits / stats.near_duplicate_lookups, 3) if stats.near_duplicate_lookups else None
+        ),
     }
     if stats.failed_processing > 0:
         logger.warning("Processing finished with failures", **log_data)
@@ -121,5 +147,271 @@ def run(
         logger.info("Processing finished successfully", **log_data)
 
 
+@click.group(context_settings=dict(auto_envvar_prefix=MINIGIST_ENV_PREFIX))
+def cli():
+    """
+    A tool that generates concise summaries for you Miniflux feeds.
+    """
+    pass
+
+
+@cli.command()
+@click.option(
+    "--config-file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Path to the YAML configuration file.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False),
+    default="INFO",
+    show_default=True,
+    help="Set the logging level.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Perform a dry run without updating Miniflux.",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Write per-stage metrics as JSON to this file at the end of the run.",
+)
+@click.option(
+    "--metrics-textfile",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Write metrics in Prometheus text format to this file, e.g. for the node_exporter textfile collector.",
+)
+@click.option(
+    "--profile",
+    type=click.Choice(["cpu", "wall", "memory"], case_sensitive=False),
+    default=None,
+    help="Profile the run and write per-stage reports to the profile directory.",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False, writable=True, path_type=Path),
+    default=Path("minigist-profile"),
+    show_default=True,
+    help="Directory for profiling reports.",
+)
+@click.option(
+    "--slow-callback-ms",
+    type=click.FloatRange(min=0),
+    default=100,
+    show_default=True,
+    help="Report event loop blocking episodes longer than this when profiling.",
+)
+@click.option(
+    "--max-duration",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Time budget for the run in seconds; entries that would finish later are left for the next run.",
+)
+def run(
+    config_file: Path | None,
+    log_level: str,
+    dry_run: bool,
+    metrics_file: Path | None,
+    metrics_textfile: Path | None,
+    profile: str | None,
+    profile_dir: Path,
+    slow_callback_ms: float,
+    max_duration: float | None,
+):
+    """Fetch entries, summarize, and update Miniflux."""
+    _process_entries(
+        config_file,
+        log_level,
+        dry_run,
+        metrics_file,
+        metrics_textfile,
+        profile,
+        profile_dir,
+        slow_callback_ms,
+        max_duration,
+    )
+
+
+@cli.command()
+@click.option(
+    "--config-file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Path to the YAML configuration file.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False),
+    default="INFO",
+    show_default=True,
+    help="Set the logging level.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Perform a dry run without updating Miniflux.",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Write per-stage metrics as JSON to this file at the end of the run.",
+)
+@click.option(
+    "--max-duration",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Time budget for the run in seconds; entries that would finish later are left for the next run.",
+)
+@click.option(
+    "--include-unmarked",
+    is_flag=True,
+    default=False,
+    help="Also re-summarize entries summarized before markers were added, whose prompt is unknown.",
+)
+def refresh(
+    config_file: Path | None,
+    log_level: str,
+    dry_run: bool,
+    metrics_file: Path | None,
+    max_duration: float | None,
+    include_unmarked: bool,
+):
+    """Re-summarize entries whose summary was made with a prompt that has since changed."""
+    _process_entries(
+        config_file,
+        log_level,
+        dry_run,
+        metrics_file,
+        metrics_textfile=None,
+        profile=None,
+        profile_dir=Path("minigist-profile"),
+        slow_callback_ms=0,
+        max_duration=max_duration,
+        refresh=True,
+        include_unmarked=include_unmarked,
+    )
+
+
+@cli.command()
+@click.option(
+    "--config-file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Path to the YAML configuration file.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False),
+    default="INFO",
+    show_default=True,
+    help="Set the logging level.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Report which entries would be changed without updating Miniflux.",
+)
+@click.option(
+    "--feed-id",
+    "feed_ids",
+    type=int,
+    multiple=True,
+    help="Only strip entries of this feed; repeat for several feeds.",
+)
+@click.option("--category-id", type=int, default=None, help="Only strip entries of this category.")
+@click.option(
+    "--status",
+    type=click.Choice(["all", "unread", "read"], case_sensitive=False),
+    default="all",
+    show_default=True,
+    help="Only strip entries with this status.",
+)
+@click.option(
+    "--since",
+    type=click.DateTime(),
+    default=None,
+    help="Only strip entries published after this date.",
+)
+@click.option("--yes", is_flag=True, default=False, help="Strip without asking for confirmation.")
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=Path(DEFAULT_STRIP_CHECKPOINT_PATH),
+    show_default=True,
+    help="File recording progress, so that an interrupted run resumes where it stopped.",
+)
+@click.option(
+    "--restart",
+    is_flag=True,
+    default=False,
+    help="Ignore the checkpoint and scan all matching entries again.",
+)
+def strip(
+    config_file: Path | None,
+    log_level: str,
+    dry_run: bool,
+    feed_ids: tuple[int, ...],
+    category_id: int | None,
+    status: str,
+    since: datetime | None,
+    yes: bool,
+    checkpoint: Path,
+    restart: bool,
+):
+    """Remove summaries from entries, restoring their original content."""
+    import asyncio
+
+    from minigist import config
+    from minigist.miniflux_client import MinifluxClient
+    from minigist.strip import StripCheckpoint, SummaryStripper
+
+    configure_logging(log_level)
+
+    try:
+        app_config = config.load_app_config(config_file)
+    except exceptions.ConfigError as e:
+        logger.critical("Configuration error", error=str(e))
+        sys.exit(1)
+
+    filters: dict[str, object] = {
+        "status": None if status.lower() == "all" else status.lower(),
+        "category_id": category_id,
+        "published_after": int(since.timestamp()) if since else None,
+    }
+    if not dry_run and not yes:
+        click.confirm("Strip minigist summaries from all matching entries?", abort=True)
+
+    strip_checkpoint = None
+    if not dry_run:
+        strip_checkpoint = StripCheckpoint(checkpoint, {**filters, "feed_ids": sorted(feed_ids)})
+        if restart:
+            strip_checkpoint.reset()
+
+    async def _strip():
+        async with MinifluxClient(app_config.miniflux, dry_run=dry_run) as client:
+            stripper = SummaryStripper(client, app_config.miniflux.concurrency, strip_checkpoint)
+            return await stripper.run(feed_ids, filters)
+
+    try:
+        stats = asyncio.run(_strip())
+    except exceptions.MinifluxApiError as e:
+        logger.critical("Miniflux API error occurred", error=str(e))
+        sys.exit(1)
+
+    if stats.failed > 0:
+        logger.warning("Stripping finished with failures; run again to retry them", **stats.model_dump())
+    else:
+        logger.info("Stripping finished successfully", **stats.model_dump())
+
+
 if __name__ == "__main__":
     cli()
@@ -1,19 +1,43 @@
 import os
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Literal
 
 import yaml
 from pydantic import BaseModel, Field, HttpUrl, ValidationError
 from pydantic.functional_validators import BeforeValidator
 
 from minigist.constants import (
+    DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_CIRCUIT_BREAKER_PATH,
+    DEFAULT_CIRCUIT_BREAKER_WINDOW_SECONDS,
     DEFAULT_FETCH_LIMIT,
+    DEFAULT_FETCH_METHODS_PATH,
+    DEFAULT_HEDGE_MIN_SAMPLES,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_HTTP_CACHE_MAX_SIZE_MB,
+    DEFAULT_HTTP_CACHE_PATH,
+    DEFAULT_JOURNAL_PATH,
+    DEFAULT_LEASE_BATCH_SIZE,
+    DEFAULT_LEASE_PATH,
+    DEFAULT_LEASE_SECONDS,
     DEFAULT_LLM_CONCURRENCY,
     DEFAULT_LLM_TIMEOUT_SECONDS,
+    DEFAULT_MAX_HEDGES_PER_RUN,
+    DEFAULT_MIN_FEED_CONTENT_LENGTH,
+    DEFAULT_MINIFLUX_CONCURRENCY,
     DEFAULT_MINIFLUX_TIMEOUT_SECONDS,
+    DEFAULT_NEAR_DUPLICATE_MAX_DISTANCE,
+    DEFAULT_NEAR_DUPLICATE_PATH,
+    DEFAULT_PER_HOST_CONCURRENCY,
+    DEFAULT_PER_HOST_DELAY_SECONDS,
     DEFAULT_PROMPT,
+    DEFAULT_PURE_RATE_LIMIT_PATH,
+    DEFAULT_SCRAPE_CONCURRENCY,
     DEFAULT_SCRAPE_TIMEOUT_SECONDS,
+    DEFAULT_TARGET_WEIGHT,
     MINIGIST_ENV_PREFIX,
+    PRIMARY_LLM_ENDPOINT_ID,
 )
 from minigist.exceptions import ConfigError
 from minigist.logging import get_logger
@@ -37,6 +61,57 @@ class MinifluxConfig(BaseModel):
         DEFAULT_MINIFLUX_TIMEOUT_SECONDS,
         description="Timeout for Miniflux API requests in seconds.",
     )
+    concurrency: int = Field(
+        DEFAULT_MINIFLUX_CONCURRENCY,
+        ge=1,
+        description="Maximum number of concurrent Miniflux API requests.",
+    )
+    http2: bool = Field(False, description="Use HTTP/2 for Miniflux API requests. Requires the 'http2' extra.")
+
+
+class LLMEndpointConfig(BaseModel):
+    id: str = Field(..., description="Identifier for the endpoint.")
+    model: str = Field(..., description="Model identifier to use on this endpoint.")
+    api_key: str | None = Field(
+        None,
+        description="API key for this endpoint. Defaults to the primary API key.",
+    )
+    base_url: str | None = Field(
+        None,
+        description="Base URL for this endpoint. Defaults to the primary base URL.",
+    )
+    timeout_seconds: float | None = Field(
+        None,
+        description="Timeout for requests to this endpoint in seconds. Defaults to the primary timeout.",
+    )
+    concurrency: Annotated[
+        int | None,
+        Field(
+            None,
+            ge=1,
+            description="Maximum number of concurrent requests to this endpoint. Defaults to the primary concurrency.",
+        ),
+    ]
+
+
+class HedgingConfig(BaseModel):
+    enabled: bool = Field(False, description="Whether to issue hedged requests for slow LLM calls.")
+    percentile: float = Field(
+        DEFAULT_HEDGE_PERCENTILE,
+        gt=0,
+        lt=1,
+        description="Observed latency percentile after which a hedged request is issued.",
+    )
+    min_samples: int = Field(
+        DEFAULT_HEDGE_MIN_SAMPLES,
+        ge=1,
+        description="Number of observed latencies required before hedging starts.",
+    )
+    max_hedges_per_run: int = Field(
+        DEFAULT_MAX_HEDGES_PER_RUN,
+        ge=0,
+        description="Maximum number of hedged requests issued per run.",
+    )
 
 
 class LLMConfig(BaseModel):
@@ -64,6 +139,11 @@ class LLMConfig(BaseModel):
             description="Maximum number of concurrent LLM requests.",
         ),
     ]
+    fallbacks: list[LLMEndpointConfig] = Field(
+        default_factory=list,
+        description="Ordered list of endpoints to fail over to when the primary endpoint fails.",
+    )
+    hedging: HedgingConfig = Field(default_factory=HedgingConfig)  # type: ignore[arg-type]
 
 
 class NotificationConfig(BaseModel):
@@ -74,16 +154,141 @@ class FetchConfig(BaseModel):
     limit: int | None = Field(DEFAULT_FETCH_LIMIT, description="Maximum number of entries to fetch per feed.")
 
 
+class RunConfig(BaseModel):
+    max_duration_seconds: float | None = Field(
+        None,
+        gt=0,
+        description="Stop starting new entries once they are projected to finish after this many seconds into the run.",
+    )
+    cpu_workers: int | None = Field(
+        None,
+        ge=1,
+        description="Processes for extraction, rendering and fingerprinting; unset keeps them in the main process.",
+    )
+
+
+class HttpCacheConfig(BaseModel):
+    enabled: bool = Field(False, description="Whether to cache article downloads and extracted texts on disk.")
+    path: Path = Field(Path(DEFAULT_HTTP_CACHE_PATH), description="SQLite file to store the cache in.")
+    max_size_mb: float = Field(
+        DEFAULT_HTTP_CACHE_MAX_SIZE_MB,
+        gt=0,
+        description="Size budget of the cache in megabytes; least recently used items are evicted first.",
+    )
+
+
+class HostCircuitBreakerConfig(BaseModel):
+    enabled: bool = Field(False, description="Whether to stop fetching from hosts that keep failing for a while.")
+    failure_threshold: int = Field(
+        DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        ge=1,
+        description="Number of failed requests to a host within the window that opens its circuit breaker.",
+    )
+    window_seconds: float = Field(
+        DEFAULT_CIRCUIT_BREAKER_WINDOW_SECONDS, gt=0, description="Window in which failed requests are counted."
+    )
+    cooldown_seconds: float = Field(
+        DEFAULT_CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+        gt=0,
+        description="How long entries from a host are deferred once its circuit breaker opens.",
+    )
+    path: Path = Field(Path(DEFAULT_CIRCUIT_BREAKER_PATH), description="File to keep circuit breaker state in.")
+
+
 class ScrapingConfig(BaseModel):
     pure_api_token: str | None = Field(None, description="API token for the pure.md service.")
     pure_base_urls: Annotated[list[str], BeforeValidator(lambda v: [] if v is None else v)] = Field(
         default_factory=list,
         description="List of base URL prefixes for which pure.md should always be used.",
     )
+    strategy: Literal["single", "fallback", "race"] = Field(
+        "single",
+        description=(
+            "How to combine direct fetches and pure.md: 'single' uses one of them, 'fallback' tries the other "
+            "when the first fails, 'race' runs both and keeps the first article text."
+        ),
+    )
+    strategy_state_path: Path = Field(
+        Path(DEFAULT_FETCH_METHODS_PATH),
+        description="File remembering, per host, which fetch method last succeeded with 'fallback' or 'race'.",
+    )
+    pure_rate_limit_path: Path = Field(
+        Path(DEFAULT_PURE_RATE_LIMIT_PATH),
+        description="File holding the pure.md rate limit state shared by concurrent runs when no API token is set.",
+    )
     timeout_seconds: float = Field(
         DEFAULT_SCRAPE_TIMEOUT_SECONDS,
         description="Timeout for HTTP fetch requests in seconds.",
     )
+    concurrency: int = Field(
+        DEFAULT_SCRAPE_CONCURRENCY,
+        ge=1,
+        description="Maximum number of concurrent article fetches across all hosts.",
+    )
+    per_host_concurrency: int = Field(
+        DEFAULT_PER_HOST_CONCURRENCY,
+        ge=1,
+        description="Maximum number of concurrent article fetches from a single host.",
+    )
+    per_host_delay_seconds: float = Field(
+        DEFAULT_PER_HOST_DELAY_SECONDS,
+        ge=0,
+        description="Minimum delay between starting two fetches from the same host.",
+    )
+    cache: HttpCacheConfig = Field(default_factory=HttpCacheConfig)  # type: ignore[arg-type]
+    circuit_breaker: HostCircuitBreakerConfig = Field(default_factory=HostCircuitBreakerConfig)  # type: ignore[arg-type]
+
+
+class TracingConfig(BaseModel):
+    enabled: bool = Field(False, description="Whether to trace entries through the pipeline with OpenTelemetry.")
+    exporter: Literal["otlp", "file"] = Field("otlp", description="Where to export spans to.")
+    endpoint: str = Field(
+        "http://localhost:4318/v1/traces",
+        description="OTLP/HTTP endpoint of the trace collector.",
+    )
+    file_path: Path | None = Field(None, description="File to append spans to when using the file exporter.")
+    service_name: str = Field("minigist", description="Service name reported with exported spans.")
+
+
+class JournalConfig(BaseModel):
+    enabled: bool = Field(
+        False,
+        description="Whether to checkpoint entry progress so an interrupted run can resume without new LLM calls.",
+    )
+    path: Path = Field(Path(DEFAULT_JOURNAL_PATH), description="SQLite file to store the checkpoint journal in.")
+
+
+class CoordinationConfig(BaseModel):
+    enabled: bool = Field(
+        False,
+        description="Whether to lease entries before processing them so that several instances can share the work.",
+    )
+    backend: Literal["sqlite"] = Field("sqlite", description="Where leases are stored.")
+    path: Path = Field(Path(DEFAULT_LEASE_PATH), description="SQLite file shared by all instances.")
+    lease_seconds: float = Field(
+        DEFAULT_LEASE_SECONDS,
+        gt=0,
+        description="How long a lease lasts; it is renewed while the run is still working on its entries.",
+    )
+    batch_size: int | None = Field(
+        DEFAULT_LEASE_BATCH_SIZE,
+        ge=1,
+        description="Maximum number of entries an instance claims per run; null claims all available entries.",
+    )
+
+
+class NearDuplicateConfig(BaseModel):
+    enabled: bool = Field(
+        False,
+        description="Whether to reuse summaries of near-identical articles, such as syndicated wire stories.",
+    )
+    max_distance: int = Field(
+        DEFAULT_NEAR_DUPLICATE_MAX_DISTANCE,
+        ge=0,
+        le=15,
+        description="Maximum number of differing SimHash bits for two articles to count as near-duplicates.",
+    )
+    path: Path = Field(Path(DEFAULT_NEAR_DUPLICATE_PATH), description="SQLite file to persist fingerprints in.")
 
 
 class PromptConfig(BaseModel):
@@ -102,6 +307,27 @@ class TargetConfig(BaseModel):
         description="List of category IDs whose feeds should use this prompt.",
     )
     use_pure: bool = Field(False, description="Whether to prefer pure.md for this target.")
+    llm_endpoint_id: str | None = Field(
+        None,
+        description="LLM endpoint to try first for this target. Defaults to the primary endpoint.",
+    )
+    content_source: Literal["feed", "web", "auto"] = Field(
+        "web",
+        description=(
+            "Where to take article text from: the entry content shipped by the feed, the fetched web page, "
+            "or the feed content unless it looks incomplete."
+        ),
+    )
+    min_feed_content_length: int = Field(
+        DEFAULT_MIN_FEED_CONTENT_LENGTH,
+        ge=0,
+        description="Minimum length of the extracted feed text for content_source 'auto' to skip fetching the page.",
+    )
+    weight: float = Field(
+        DEFAULT_TARGET_WEIGHT,
+        gt=0,
+        description="Relative share of processing turns this target gets when entries are interleaved across targets.",
+    )
 
 
 class AppConfig(BaseModel):
@@ -116,6 +342,11 @@ class AppConfig(BaseModel):
     miniflux: MinifluxConfig
     notifications: NotificationConfig = Field(default_factory=NotificationConfig)
     scraping: ScrapingConfig = Field(default_factory=ScrapingConfig)  # type: ignore[arg-type]
+    tracing: TracingConfig = Field(default_factory=TracingConfig)  # type: ignore[arg-type]
+    journal: JournalConfig = Field(default_factory=JournalConfig)  # type: ignore[arg-type]
+    near_duplicates: NearDuplicateConfig = Field(default_factory=NearDuplicateConfig)  # type: ignore[arg-type]
+    run: RunConfig = Field(default_factory=RunConfig)  # type: ignore[arg-type]
+    coordination: CoordinationConfig = Field(default_factory=CoordinationConfig)  # type: ignore[arg-type]
 
 
 def find_config_file(config_option: Path | None = None) -> Path:
@@ -202,6 +433,15 @@ def _validate_app_config(app_config: AppConfig) -> None:
         )
         raise ConfigError(f"default_prompt_id '{app_config.default_prompt_id}' does not match any configured prompt")
 
+    if app_config.tracing.enabled and app_config.tracing.exporter == "file" and not app_config.tracing.file_path:
+        logger.error("Validation failed: file tracing exporter without file_path")
+        raise ConfigError("tracing.file_path must be set when using the file exporter")
+
+    endpoint_ids = [PRIMARY_LLM_ENDPOINT_ID] + [endpoint.id for endpoint in app_config.llm.fallbacks]
+    if len(endpoint_ids) != len(set(endpoint_ids)):
+        logger.error("Validation failed: duplicate LLM endpoint IDs detected")
+        raise ConfigError(f"LLM endpoint IDs must be unique and must not be '{PRIMARY_LLM_ENDPOINT_ID}'")
+
     if not app_config.targets:
         logger.info("No targets configured; default prompt will be used for all unread entries")
         return
@@ -214,6 +454,13 @@ def _validate_app_config(app_config: AppConfig) -> None:
             logger.error("Validation failed: target references unknown prompt ID", prompt_id=target.prompt_id)
             raise ConfigError(f"Target references unknown prompt_id '{target.prompt_id}'")
 
+        if target.llm_endpoint_id is not None and target.llm_endpoint_id not in endpoint_ids:
+            logger.error(
+                "Validation failed: target references unknown LLM endpoint ID",
+                llm_endpoint_id=target.llm_endpoint_id,
+            )
+            raise ConfigError(f"Target references unknown llm_endpoint_id '{target.llm_endpoint_id}'")
+
         has_feeds = bool(target.feed_ids)
         has_categories = bool(target.category_ids)
 
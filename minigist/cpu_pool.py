@@ -0,0 +1,47 @@
+"""Process pool for the CPU-bound pipeline stages, so that they are not limited to the event loop's core."""
+
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CPUPool:
+    """Run CPU-bound stage functions in worker processes, or in the calling process without workers.
+
+    Functions and their arguments are pickled, so callers pass module-level functions and plain
+    strings rather than whole entries, keeping the data copied between processes small. Workers
+    are started with `spawn`, since forking a process that runs threads and an event loop is unsafe.
+    """
+
+    def __init__(self, workers: int | None = None):
+        """Create the pool; its worker processes are started on first use."""
+        self.workers = workers
+        self.executor = (
+            ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            if workers
+            else None
+        )
+        if self.executor is not None:
+            logger.debug("Running CPU-bound stages in worker processes", workers=workers)
+
+    def run[**P, R](self, function: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run the function to completion, blocking the calling thread; meant for executor threads."""
+        if self.executor is None:
+            return function(*args, **kwargs)
+        return self.executor.submit(function, *args, **kwargs).result()
+
+    async def run_async[**P, R](self, function: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run the function without blocking the event loop, in a thread if there are no worker processes."""
+        if self.executor is None:
+            return await asyncio.to_thread(function, *args, **kwargs)
+        return await asyncio.wrap_future(self.executor.submit(function, *args, **kwargs))
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
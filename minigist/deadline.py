@@ -0,0 +1,39 @@
+"""Time budget for a run, so that scheduled runs finish before the next one starts."""
+
+import time
+
+from .metrics import PipelineMetrics
+
+ENTRY_STAGES = ("fetch", "render", "update")
+
+
+class RunDeadline:
+    """Decide whether a new entry can still be summarized and written back before the deadline.
+
+    Completion is projected from the rolling per-stage latencies in the metrics registry. Stages
+    without observations yet count as free, so the first entries of a run are always admitted.
+    """
+
+    def __init__(
+        self,
+        max_duration_seconds: float,
+        metrics: PipelineMetrics,
+        llm_concurrency: int,
+        started_at: float | None = None,
+    ) -> None:
+        self.deadline = (time.monotonic() if started_at is None else started_at) + max_duration_seconds
+        self.metrics = metrics
+        self.llm_concurrency = llm_concurrency
+
+    def _latency(self, stage: str) -> float:
+        return self.metrics.recent_stage_latency(stage) or 0.0
+
+    def projected_completion(self, queued_summaries: int) -> float:
+        """Project when an entry admitted now would be written back, given the summaries queued ahead of it."""
+        llm_rounds = queued_summaries // self.llm_concurrency + 1
+        entry_latency = sum(self._latency(stage) for stage in ENTRY_STAGES)
+        return time.monotonic() + entry_latency + llm_rounds * self._latency("llm")
+
+    def admits(self, queued_summaries: int) -> bool:
+        """Return whether an entry admitted now is projected to finish before the deadline."""
+        return self.projected_completion(queued_summaries) <= self.deadline
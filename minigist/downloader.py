@@ -1,27 +1,90 @@
 import json
+from urllib.parse import urlparse
 
 import httpx
-import trafilatura
 from httpx_retries import RetryTransport
 
+from . import tracing
+from .circuit_breaker import HostCircuitBreakers
 from .config import ScrapingConfig
-from .exceptions import ArticleFetchError
+from .cpu_pool import CPUPool
+from .exceptions import ArticleFetchError, ArticleTransportError, HostUnavailableError
+from .http_cache import HttpCache, body_hash
 from .logging import get_logger
+from .metrics import PipelineMetrics
 from .pure_client import DEFAULT_USER_AGENT, PureMDClient
 
 logger = get_logger(__name__)
 
+TRUNCATION_MARKERS = ("read more", "continue reading", "read the full", "[…]", "[...]", "…", "...")
+
+
+def looks_complete(text: str, min_length: int) -> bool:
+    """Return whether extracted feed text is long enough and does not end like a teaser."""
+    stripped = text.strip()
+    if len(stripped) < min_length:
+        return False
+    return not stripped.lower().endswith(TRUNCATION_MARKERS)
+
+
+def extract_article_text(html: str) -> str | None:
+    """Extract the main text of an HTML page, or return None if trafilatura finds none.
+
+    This runs in CPU pool workers, so it returns only the text instead of trafilatura's whole JSON output.
+    """
+    import trafilatura
+
+    extracted_json_str = trafilatura.extract(
+        html,
+        output_format="json",
+        with_metadata=True,
+        include_comments=False,
+    )
+    if not extracted_json_str:
+        return None
+    text = json.loads(extracted_json_str).get("text")
+    return text if text and text.strip() else None
+
 
 class Downloader:
-    def __init__(self, scraping_config: ScrapingConfig, user_agent: str = DEFAULT_USER_AGENT):
+    def __init__(
+        self,
+        scraping_config: ScrapingConfig,
+        user_agent: str = DEFAULT_USER_AGENT,
+        metrics: PipelineMetrics | None = None,
+        cpu_pool: CPUPool | None = None,
+    ):
         self.scraping_config = scraping_config
+        self.metrics = metrics or PipelineMetrics()
+        self.cpu_pool = cpu_pool or CPUPool()
         self.timeout_seconds = scraping_config.timeout_seconds
-        self.pure_client = PureMDClient(api_token=scraping_config.pure_api_token, user_agent=user_agent)
+        self.pure_client = PureMDClient(
+            api_token=scraping_config.pure_api_token,
+            user_agent=user_agent,
+            rate_limit_state_path=scraping_config.pure_rate_limit_path,
+        )
         self.http_session = httpx.Client(
             transport=RetryTransport(),
             headers={"User-Agent": user_agent},
             follow_redirects=True,
         )
+        cache_config = scraping_config.cache
+        self.http_cache = (
+            HttpCache(cache_config.path, max_size_bytes=int(cache_config.max_size_mb * 1024 * 1024))
+            if cache_config.enabled
+            else None
+        )
+        breaker_config = scraping_config.circuit_breaker
+        self.circuit_breakers = (
+            HostCircuitBreakers(
+                breaker_config.failure_threshold,
+                breaker_config.window_seconds,
+                breaker_config.cooldown_seconds,
+                path=breaker_config.path,
+            )
+            if breaker_config.enabled
+            else None
+        )
 
     def __enter__(self) -> "Downloader":
         """Return the downloader for context manager usage."""
@@ -55,53 +118,142 @@ class Downloader:
         )
         return False
 
+    def uses_pure(self, url: str, force_use_pure: bool = False) -> bool:
+        """Return whether the URL is configured to be fetched through pure.md."""
+        return force_use_pure or self._should_use_pure(url, {})
+
+    async def reserve_pure_request(self, url: str, force_use_pure: bool, log_context: dict[str, object]) -> bool:
+        """Take a pure.md request from the rate limit before fetching the URL through it.
+
+        Forced requests wait for the limit without blocking the event loop. Other requests return
+        False right away when the limit is exhausted, so the caller can fetch the page directly.
+        """
+        rate_limiter = self.pure_client.rate_limiter
+        if rate_limiter is None:
+            return True
+        if force_use_pure:
+            await rate_limiter.acquire()
+            return True
+        if await rate_limiter.try_acquire():
+            return True
+
+        logger.info("pure.md rate limit reached; fetching the page directly", **log_context, url=url)
+        self.metrics.increment(
+            "pure_rate_limited_total",
+            description="Number of optional pure.md fetches that went direct because of the rate limit.",
+        )
+        return False
+
+    def request_host(self, url: str, force_use_pure: bool = False, use_pure: bool | None = None) -> str:
+        """Return the host that a fetch of the URL will contact."""
+        if use_pure is None:
+            use_pure = self.uses_pure(url, force_use_pure)
+        if use_pure:
+            url = self.pure_client.base_url
+        return (urlparse(url).hostname or "").lower()
+
     def _extract_text_from_html(self, html: str, url: str, log_context: dict[str, object]) -> str:
-        try:
-            extracted_json_str = trafilatura.extract(
-                html,
-                output_format="json",
-                with_metadata=True,
-                include_comments=False,
-            )
-        except Exception as e:
-            logger.error("Trafilatura extraction failed", **log_context, url=url, error=str(e))
-            raise ArticleFetchError(f"Trafilatura extraction failed for {url}: {e}") from e
+        if self.http_cache is None:
+            return self._extract_text(html, url, log_context)
 
-        if not extracted_json_str:
-            logger.warning("Trafilatura returned no content", **log_context, url=url)
-            raise ArticleFetchError(f"Trafilatura returned no content for {url}")
+        digest = body_hash(html)
+        cached_text = self.http_cache.get_extracted_text(url, digest)
+        if cached_text is not None:
+            logger.debug("Using cached extracted text", **log_context, url=url)
+            self._record_cache_lookup("extract", "hit")
+            return cached_text
 
+        self._record_cache_lookup("extract", "miss")
+        text = self._extract_text(html, url, log_context)
+        self.http_cache.store_extracted_text(url, digest, text)
+        return text
+
+    def _record_cache_lookup(self, cache: str, outcome: str) -> None:
+        self.metrics.increment(
+            "cache_lookups_total",
+            description="Number of download cache lookups by cache and outcome.",
+            cache=cache,
+            outcome=outcome,
+        )
+
+    @staticmethod
+    def _is_host_failure(status_code: int) -> bool:
+        return status_code >= httpx.codes.INTERNAL_SERVER_ERROR or status_code == httpx.codes.TOO_MANY_REQUESTS
+
+    def _record_host_outcome(self, host: str, failed: bool) -> None:
+        if self.circuit_breakers is None:
+            return
+        if failed:
+            self.circuit_breakers.record_failure(host)
+        else:
+            self.circuit_breakers.record_success(host)
+
+    def _download_html(self, url: str, timeout: float, log_context: dict[str, object]) -> str:
+        cached = self.http_cache.get_response(url) if self.http_cache is not None else None
+        if cached is not None and cached.is_fresh():
+            logger.debug("Using fresh cached response", **log_context, url=url)
+            self._record_cache_lookup("http", "hit")
+            return cached.body
+
+        host = self.request_host(url, use_pure=False)
+        if self.circuit_breakers is not None and not self.circuit_breakers.allows(host):
+            raise HostUnavailableError(f"Circuit breaker is open for {host}")
+
+        headers = cached.validators() if cached is not None else {}
+        with self.metrics.time_stage("download", source="direct"), tracing.span("download", source="direct"):
+            try:
+                response = self.http_session.get(url, timeout=timeout, headers=headers)
+            except httpx.RequestError:
+                self._record_host_outcome(host, failed=True)
+                raise
+        self._record_host_outcome(host, failed=self._is_host_failure(response.status_code))
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.debug("Cached response revalidated", **log_context, url=url)
+            self._record_cache_lookup("http", "revalidated")
+            if self.http_cache is not None:
+                self.http_cache.refresh_response(cached, response.headers)
+            return cached.body
+
+        response.raise_for_status()
+        if self.http_cache is not None:
+            self._record_cache_lookup("http", "miss")
+            self.http_cache.store_response(url, response.text, response.headers)
+        return response.text
+
+    def _extract_text(self, html: str, url: str, log_context: dict[str, object]) -> str:
         try:
-            content_data = json.loads(extracted_json_str)
+            with self.metrics.time_stage("extract"), tracing.span("extract", url=url):
+                text = self.cpu_pool.run(extract_article_text, html)
         except json.JSONDecodeError as e:
-            logger.error(
-                "Failed to parse JSON from trafilatura output",
-                **log_context,
-                url=url,
-                error=str(e),
-                raw_output_preview=extracted_json_str[:200],
-            )
+            logger.error("Failed to parse JSON from trafilatura output", **log_context, url=url, error=str(e))
             raise ArticleFetchError(f"Failed to parse JSON from trafilatura for {url}: {e}") from e
+        except Exception as e:
+            logger.error("Trafilatura extraction failed", **log_context, url=url, error=str(e))
+            raise ArticleFetchError(f"Trafilatura extraction failed for {url}: {e}") from e
 
-        text = content_data.get("text")
-        if not text or not text.strip():
-            logger.warning(
-                "No text content in trafilatura extracted data or text is empty",
-                **log_context,
-                url=url,
-            )
+        if text is None:
+            logger.warning("Trafilatura found no text content", **log_context, url=url)
             raise ArticleFetchError(f"No text content in trafilatura extracted data for {url}")
 
         return text
 
+    def extract_feed_content(self, content: str, url: str, log_context: dict[str, object]) -> str:
+        """Extract article text from the HTML content shipped with a feed entry."""
+        if not content.strip():
+            logger.debug("Entry has no feed content", **log_context, url=url)
+            raise ArticleFetchError(f"Entry has no feed content for {url}")
+        return self._extract_text_from_html(content, url, log_context)
+
     def _fetch_and_parse_html_via_http_get(self, url: str, timeout: float, log_context: dict[str, object]) -> str:
         logger.info("Attempting standard HTTP GET and parse", **log_context, url=url)
 
         html_content: str | None = None
         try:
-            response = self.http_session.get(url, timeout=timeout)
-            response.raise_for_status()
-            html_content = response.text
+            html_content = self._download_html(url, timeout, log_context)
+        except HostUnavailableError:
+            logger.info("Skipping fetch because the host keeps failing", **log_context, url=url)
+            raise
         except httpx.HTTPStatusError as e:
             logger.error(
                 "HTTP error during standard GET",
@@ -115,7 +267,7 @@ class Downloader:
             ) from e
         except httpx.RequestError as e:
             logger.error("RequestException during standard GET", **log_context, url=url, error=str(e))
-            raise ArticleFetchError(f"RequestException during GET for {url}: {e}") from e
+            raise ArticleTransportError(f"RequestException during GET for {url}: {e}") from e
         except Exception as e:
             logger.error(
                 "Unexpected error during standard GET",
@@ -136,9 +288,13 @@ class Downloader:
         url: str,
         log_context: dict[str, object],
         force_use_pure: bool = False,
+        timeout: float | None = None,
+        use_pure: bool | None = None,
     ) -> str:
         log_context = log_context or {}
-        use_pure = force_use_pure or self._should_use_pure(url, log_context)
+        timeout = self.timeout_seconds if timeout is None else timeout
+        if use_pure is None:
+            use_pure = force_use_pure or self._should_use_pure(url, log_context)
 
         if use_pure:
             logger.info(
@@ -147,14 +303,15 @@ class Downloader:
                 url=url,
                 forced=force_use_pure,
             )
-            content = self.pure_client.fetch_markdown_content(url, timeout=self.timeout_seconds)
+            with self.metrics.time_stage("download", source="pure"), tracing.span("download", source="pure"):
+                content = self.pure_client.fetch_markdown_content(url, timeout=timeout)
             if content and content.strip():
                 return content
             else:
                 logger.warning("pure.md fetch failed or returned empty content", **log_context, url=url)
                 raise ArticleFetchError(f"pure.md fetch failed or returned empty content for {url}")
 
-        return self._fetch_and_parse_html_via_http_get(url, timeout=self.timeout_seconds, log_context=log_context)
+        return self._fetch_and_parse_html_via_http_get(url, timeout=timeout, log_context=log_context)
 
     def close(self):
         try:
@@ -162,4 +319,10 @@ class Downloader:
         except Exception as e:
             logger.warning("Failed to close downloader HTTP session cleanly", error=str(e))
 
+        if self.http_cache is not None:
+            self.http_cache.close()
+
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.close()
+
         self.pure_client.close()
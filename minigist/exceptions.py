@@ -18,9 +18,21 @@ class ArticleFetchError(SummarizationError):
     pass
 
 
+class HostUnavailableError(ArticleFetchError):
+    """Raised without contacting a host whose circuit breaker is open."""
+
+
+class ArticleTransportError(ArticleFetchError):
+    """Raised when an article request fails in transit, e.g. on a connection error, a timeout or a failing proxy."""
+
+
 class LLMServiceError(SummarizationError):
     pass
 
 
-class TooManyFailuresError(MinigistError):
+class LLMContentRejectedError(LLMServiceError):
+    """Raised when the LLM service answered but produced no usable summary for the given article."""
+
+
+class DependencyUnavailableError(MinigistError):
     pass
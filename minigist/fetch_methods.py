@@ -0,0 +1,60 @@
+"""Per-host memory of which fetch method last produced article text."""
+
+import json
+import os
+from pathlib import Path
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+FETCH_METHODS = ("direct", "pure")
+
+
+class FetchMethodMemory:
+    """Remember, per article host, whether a direct GET or pure.md last succeeded, persisted as JSON across runs."""
+
+    def __init__(self, path: Path):
+        """Load the remembered methods from the given path, starting empty if it does not exist yet."""
+        self.path = path.expanduser()
+        self._methods = self._load()
+        self._changed = False
+
+    def _load(self) -> dict[str, str]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable fetch method state", path=str(self.path), error=str(e))
+            return {}
+
+        if not isinstance(data, dict):
+            logger.warning("Ignoring malformed fetch method state", path=str(self.path))
+            return {}
+        return {host: method for host, method in data.items() if method in FETCH_METHODS}
+
+    def preferred(self, host: str) -> str | None:
+        """Return the method that last succeeded for the host, if any."""
+        return self._methods.get(host)
+
+    def record_success(self, host: str, method: str) -> None:
+        """Remember that the method produced article text for the host."""
+        if self._methods.get(host) != method:
+            self._methods[host] = method
+            self._changed = True
+
+    def close(self) -> None:
+        """Persist the remembered methods if they changed during the run."""
+        if not self._changed:
+            return
+
+        temporary_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_text(json.dumps(self._methods, sort_keys=True), encoding="utf-8")
+            os.replace(temporary_path, self.path)
+        except OSError as e:
+            logger.warning("Failed to save fetch method state", path=str(self.path), error=str(e))
+            return
+        self._changed = False
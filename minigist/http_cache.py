@@ -0,0 +1,258 @@
+"""On-disk cache for article downloads and their extracted text."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import httpx
+
+from .constants import HEURISTIC_FRESHNESS_FRACTION, MAX_HEURISTIC_FRESHNESS_SECONDS
+from .exceptions import ConfigError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS extracted_texts (
+    url TEXT NOT NULL,
+    body_hash TEXT NOT NULL,
+    text BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (url, body_hash)
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS extracted_texts_accessed_at ON extracted_texts (accessed_at);
+"""
+DELETE_BY_ROWID = {
+    "responses": "DELETE FROM responses WHERE rowid = ?",
+    "extracted_texts": "DELETE FROM extracted_texts WHERE rowid = ?",
+}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body together with its validators."""
+
+    url: str
+    body: str
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Return whether the response may be used without revalidation."""
+        return (time.time() if now is None else now) < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers for revalidating this response."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _parse_cache_control(headers: httpx.Headers) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: httpx.Headers) -> float | None:
+    """Return how long a response stays fresh in seconds, or None if it must not be stored."""
+    directives = _parse_cache_control(headers)
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+
+    try:
+        age = float(headers.get("age", "0"))
+    except ValueError:
+        age = 0.0
+
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            return max(0.0, float(max_age) - age)
+        except ValueError:
+            return 0.0
+
+    date = _parse_http_date(headers.get("date")) or time.time()
+    expires = _parse_http_date(headers.get("expires"))
+    if "expires" in headers:
+        return max(0.0, expires - date - age) if expires is not None else 0.0
+
+    last_modified = _parse_http_date(headers.get("last-modified"))
+    if last_modified is not None and last_modified < date:
+        heuristic = (date - last_modified) * HEURISTIC_FRESHNESS_FRACTION
+        return max(0.0, min(heuristic, MAX_HEURISTIC_FRESHNESS_SECONDS) - age)
+
+    return 0.0
+
+
+def body_hash(body: str) -> str:
+    """Return a stable digest of a response body."""
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+class HttpCache:
+    """Store response bodies and extracted texts in a size-bounded SQLite database with LRU eviction."""
+
+    def __init__(self, path: Path, max_size_bytes: int):
+        """Open or create the cache at the given path."""
+        self.path = path.expanduser()
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            logger.error("Failed to open HTTP cache", path=str(self.path), error=str(e))
+            raise ConfigError(f"Cannot open HTTP cache at {self.path}") from e
+
+    def get_response(self, url: str) -> CachedResponse | None:
+        """Return the stored response for a URL and mark it as recently used."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+
+        body, etag, last_modified, expires_at = row
+        return CachedResponse(
+            url=url,
+            body=zlib.decompress(body).decode(),
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=expires_at,
+        )
+
+    def store_response(self, url: str, body: str, headers: httpx.Headers) -> None:
+        """Store a response body if its caching headers allow it."""
+        lifetime = freshness_lifetime(headers)
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if lifetime is None or (lifetime == 0 and not etag and not last_modified):
+            return
+
+        compressed = zlib.compress(body.encode())
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (url, body, etag, last_modified, expires_at, size, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, compressed, etag, last_modified, now + lifetime, len(compressed), now),
+            )
+            self._evict()
+
+    def refresh_response(self, cached: CachedResponse, headers: httpx.Headers) -> None:
+        """Update freshness and validators after a 304 Not Modified response."""
+        lifetime = freshness_lifetime(headers)
+        if lifetime is None:
+            with self._lock:
+                self._connection.execute("DELETE FROM responses WHERE url = ?", (cached.url,))
+            return
+
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET expires_at = ?, etag = ?, last_modified = ? WHERE url = ?",
+                (
+                    time.time() + lifetime,
+                    headers.get("etag", cached.etag),
+                    headers.get("last-modified", cached.last_modified),
+                    cached.url,
+                ),
+            )
+
+    def get_extracted_text(self, url: str, digest: str) -> str | None:
+        """Return previously extracted text for an identical body of the URL."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT text FROM extracted_texts WHERE url = ? AND body_hash = ?",
+                (url, digest),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE extracted_texts SET accessed_at = ? WHERE url = ? AND body_hash = ?",
+                (time.time(), url, digest),
+            )
+        return zlib.decompress(row[0]).decode()
+
+    def store_extracted_text(self, url: str, digest: str, text: str) -> None:
+        """Store the text extracted from a body of the URL."""
+        compressed = zlib.compress(text.encode())
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO extracted_texts (url, body_hash, text, size, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, digest, compressed, len(compressed), time.time()),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used rows until the cache fits its size budget."""
+        total = self._connection.execute(
+            "SELECT (SELECT COALESCE(SUM(size), 0) FROM responses) "
+            "+ (SELECT COALESCE(SUM(size), 0) FROM extracted_texts)"
+        ).fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        candidates = self._connection.execute(
+            "SELECT 'responses', rowid, size, accessed_at FROM responses "
+            "UNION ALL SELECT 'extracted_texts', rowid, size, accessed_at FROM extracted_texts "
+            "ORDER BY accessed_at"
+        ).fetchall()
+        evicted = 0
+        for table, rowid, size, _ in candidates:
+            if total <= self.max_size_bytes:
+                break
+            self._connection.execute(DELETE_BY_ROWID[table], (rowid,))
+            total -= size
+            evicted += 1
+
+        logger.debug("Evicted HTTP cache rows", count=evicted, size_bytes=total)
+
+    def close(self) -> None:
+        """Close the cache database."""
+        try:
+            with self._lock:
+                self._connection.close()
+        except sqlite3.Error as e:
+            logger.warning("Failed to close HTTP cache cleanly", error=str(e))
@@ -0,0 +1,138 @@
+"""Append-only checkpoint journal for resuming interrupted runs."""
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .constants import JOURNAL_RETENTION_SECONDS
+from .exceptions import ConfigError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+STAGE_FETCHED = "fetched"
+STAGE_SUMMARIZED = "summarized"
+STAGE_UPDATED = "updated"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entry_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entry_id INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    summary TEXT,
+    model TEXT,
+    prompt_hash TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entry_events_entry_id ON entry_events (entry_id, seq);
+"""
+
+
+@dataclass(frozen=True)
+class JournaledSummary:
+    """A summary that was generated but not yet written back to Miniflux."""
+
+    entry_id: int
+    summary: str
+    model: str | None
+    prompt_hash: str | None
+
+
+class EntryJournal:
+    """Record per-entry stage transitions in a SQLite write-ahead-logged database."""
+
+    def __init__(self, path: Path):
+        """Open or create the journal at the given path."""
+        self.path = path.expanduser()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+            self._migrate()
+        except (OSError, sqlite3.Error) as e:
+            logger.error("Failed to open checkpoint journal", path=str(self.path), error=str(e))
+            raise ConfigError(f"Cannot open checkpoint journal at {self.path}") from e
+
+        logger.debug("Opened checkpoint journal", path=str(self.path))
+
+    def _migrate(self) -> None:
+        """Add columns that journals written by older versions lack."""
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(entry_events)")}
+        if "prompt_hash" not in columns:
+            self._connection.execute("ALTER TABLE entry_events ADD COLUMN prompt_hash TEXT")
+
+    def _append(
+        self,
+        entry_id: int,
+        stage: str,
+        summary: str | None = None,
+        model: str | None = None,
+        prompt_hash: str | None = None,
+    ) -> None:
+        """Append a single stage transition for an entry."""
+        try:
+            self._connection.execute(
+                "INSERT INTO entry_events (entry_id, stage, summary, model, prompt_hash, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (entry_id, stage, summary, model, prompt_hash, time.time()),
+            )
+        except sqlite3.Error as e:
+            logger.warning("Failed to write checkpoint journal", entry_id=entry_id, stage=stage, error=str(e))
+
+    def record_fetched(self, entry_id: int) -> None:
+        """Record that the article for an entry was fetched."""
+        self._append(entry_id, STAGE_FETCHED)
+
+    def record_summarized(self, entry_id: int, summary: str, model: str | None, prompt_hash: str) -> None:
+        """Record a generated summary and the prompt it came from, so it survives a crash before the update."""
+        self._append(entry_id, STAGE_SUMMARIZED, summary=summary, model=model, prompt_hash=prompt_hash)
+
+    def record_updated(self, entry_id: int) -> None:
+        """Record that the summary for an entry was written back to Miniflux."""
+        self._append(entry_id, STAGE_UPDATED)
+
+    def pending_summaries(self) -> dict[int, JournaledSummary]:
+        """Return the latest summary of every entry whose last recorded stage is 'summarized'."""
+        rows = self._connection.execute(
+            """
+            SELECT e.entry_id, e.summary, e.model, e.prompt_hash
+            FROM entry_events AS e
+            JOIN (SELECT entry_id, MAX(seq) AS seq FROM entry_events GROUP BY entry_id) AS latest
+                ON e.entry_id = latest.entry_id AND e.seq = latest.seq
+            WHERE e.stage = ?
+            """,
+            (STAGE_SUMMARIZED,),
+        ).fetchall()
+        return {
+            entry_id: JournaledSummary(entry_id=entry_id, summary=summary, model=model, prompt_hash=prompt_hash)
+            for entry_id, summary, model, prompt_hash in rows
+        }
+
+    def prune(self, max_age_seconds: float = JOURNAL_RETENTION_SECONDS) -> int:
+        """Drop finished entries and events older than the retention window."""
+        cutoff = time.time() - max_age_seconds
+        cursor = self._connection.execute(
+            """
+            DELETE FROM entry_events
+            WHERE recorded_at < ?
+               OR entry_id IN (
+                   SELECT e.entry_id
+                   FROM entry_events AS e
+                   JOIN (SELECT entry_id, MAX(seq) AS seq FROM entry_events GROUP BY entry_id) AS latest
+                       ON e.entry_id = latest.entry_id AND e.seq = latest.seq
+                   WHERE e.stage = ?
+               )
+            """,
+            (cutoff, STAGE_UPDATED),
+        )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the journal database."""
+        try:
+            self._connection.close()
+        except sqlite3.Error as e:
+            logger.warning("Failed to close checkpoint journal cleanly", error=str(e))
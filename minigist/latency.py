@@ -0,0 +1,44 @@
+"""Rolling latency tracking for adaptive pipeline decisions."""
+
+import math
+import threading
+from collections import deque
+
+
+class LatencyTracker:
+    """Keep a rolling window of observed latencies."""
+
+    def __init__(self, window_size: int):
+        """Initialize the tracker with the number of samples to retain."""
+        self._samples: deque[float] = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of retained samples."""
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Record an observed latency in seconds."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the latency at the given percentile, or None without samples."""
+        with self._lock:
+            samples = sorted(self._samples)
+
+        if not samples:
+            return None
+
+        index = min(len(samples) - 1, max(0, math.ceil(fraction * len(samples)) - 1))
+        return samples[index]
+
+    def mean(self) -> float | None:
+        """Return the mean latency, or None without samples."""
+        with self._lock:
+            samples = list(self._samples)
+
+        if not samples:
+            return None
+
+        return sum(samples) / len(samples)
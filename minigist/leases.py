@@ -0,0 +1,119 @@
+"""Entry leases that let several minigist instances share one Miniflux account without duplicate work."""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Protocol
+
+from .exceptions import ConfigError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entry_leases (
+    entry_id INTEGER PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entry_leases_owner ON entry_leases (owner);
+"""
+
+CLAIM = """
+INSERT INTO entry_leases (entry_id, owner, expires_at) VALUES (?, ?, ?)
+ON CONFLICT (entry_id) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+WHERE entry_leases.expires_at <= ? OR entry_leases.owner = excluded.owner
+"""
+
+
+def new_lease_owner() -> str:
+    """Return an owner ID that is unique to this run."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaseBackend(Protocol):
+    """Storage for expiring, exclusive claims on entries, shared by all cooperating instances."""
+
+    def claim(self, entry_ids: Sequence[int], owner: str, ttl_seconds: float, limit: int | None = None) -> list[int]:
+        """Claim entries in the given order that are not leased by another owner, up to the limit."""
+        ...
+
+    def renew(self, owner: str, ttl_seconds: float) -> None:
+        """Extend all leases held by the owner."""
+        ...
+
+    def release(self, entry_ids: Iterable[int], owner: str) -> None:
+        """Give up the owner's leases on the given entries."""
+        ...
+
+    def close(self) -> None:
+        """Release backend resources."""
+        ...
+
+
+class SQLiteLeaseBackend:
+    """Lease backend on a SQLite file; suitable for instances on one host or on a file system with working locks."""
+
+    def __init__(self, path: Path):
+        """Open or create the lease database at the given path."""
+        self.path = path.expanduser()
+        self._lock = threading.Lock()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False, timeout=30)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            logger.error("Failed to open lease database", path=str(self.path), error=str(e))
+            raise ConfigError(f"Cannot open lease database at {self.path}") from e
+
+    def claim(self, entry_ids: Sequence[int], owner: str, ttl_seconds: float, limit: int | None = None) -> list[int]:
+        now = time.time()
+        claimed: list[int] = []
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock up front, so concurrent claims are serialized.
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                for entry_id in entry_ids:
+                    if limit is not None and len(claimed) >= limit:
+                        break
+                    cursor = self._connection.execute(CLAIM, (entry_id, owner, now + ttl_seconds, now))
+                    if cursor.rowcount:
+                        claimed.append(entry_id)
+                self._connection.execute("DELETE FROM entry_leases WHERE expires_at <= ?", (now,))
+                self._connection.execute("COMMIT")
+            except sqlite3.Error:
+                self._connection.execute("ROLLBACK")
+                raise
+        return claimed
+
+    def renew(self, owner: str, ttl_seconds: float) -> None:
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "UPDATE entry_leases SET expires_at = ? WHERE owner = ?",
+                    (time.time() + ttl_seconds, owner),
+                )
+        except sqlite3.Error as e:
+            logger.warning("Failed to renew entry leases", owner=owner, error=str(e))
+
+    def release(self, entry_ids: Iterable[int], owner: str) -> None:
+        try:
+            with self._lock:
+                self._connection.executemany(
+                    "DELETE FROM entry_leases WHERE entry_id = ? AND owner = ?",
+                    [(entry_id, owner) for entry_id in entry_ids],
+                )
+        except sqlite3.Error as e:
+            logger.warning("Failed to release entry leases; they will expire instead", owner=owner, error=str(e))
+
+    def close(self) -> None:
+        try:
+            self._connection.close()
+        except sqlite3.Error as e:
+            logger.warning("Failed to close lease database cleanly", error=str(e))
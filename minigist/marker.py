@@ -0,0 +1,91 @@
+"""Machine-readable marker in summarized entries, recording how their summary was made."""
+
+import html
+import re
+import time
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs, quote, unquote, urlencode
+
+from .constants import WATERMARK_DETECTOR, WATERMARK_URL
+
+MARKER_VERSION = 2
+MARKER_PARAMETER = "minigist"
+MARKER_LINK_PATTERN = re.compile(r'href="' + re.escape(WATERMARK_URL) + r'\?(?P<query>[^"]*)"')
+LEGACY_MARKER_PREFIX = "<!-- minigist:"
+LEGACY_MARKER_PATTERN = re.compile(r"<!-- minigist:v(?P<version>\d+)(?P<fields>(?: [a-z]+=[^\s>]*)*) -->")
+
+
+@dataclass(frozen=True)
+class SummaryMarker:
+    """Format version, prompt hash, model and creation time of a summary.
+
+    The marker is rendered as query parameters of the watermark link, since Miniflux keeps links when it
+    sanitizes entry content but may strip HTML comments.
+    """
+
+    prompt_hash: str
+    model: str | None = None
+    created_at: int = field(default_factory=lambda: int(time.time()))
+    version: int = MARKER_VERSION
+
+    def render(self) -> str:
+        """Return the watermark link URL carrying the marker."""
+        query = urlencode(
+            {
+                MARKER_PARAMETER: f"v{self.version}",
+                "prompt": self.prompt_hash,
+                "model": self.model or "",
+                "at": self.created_at,
+            },
+            quote_via=quote,
+        )
+        return f"{WATERMARK_URL}?{query}"
+
+
+def parse_marker(content: str) -> SummaryMarker | None:
+    """Return the marker of summarized content, or None if there is none or it cannot be read."""
+    if content.startswith(LEGACY_MARKER_PREFIX):
+        return _parse_legacy_marker(content)
+
+    watermark_at = content.find(WATERMARK_DETECTOR)
+    if watermark_at < 0:
+        return None
+
+    match = MARKER_LINK_PATTERN.search(content, watermark_at)
+    if match is None:
+        return None
+
+    fields = parse_qs(html.unescape(match["query"]))
+    try:
+        version = fields[MARKER_PARAMETER][0]
+        return SummaryMarker(
+            prompt_hash=fields["prompt"][0],
+            model=fields.get("model", [""])[0] or None,
+            created_at=int(fields.get("at", ["0"])[0]),
+            version=int(version.removeprefix("v")),
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+def _parse_legacy_marker(content: str) -> SummaryMarker | None:
+    """Read the HTML comment that earlier versions put in front of the rendered content."""
+    match = LEGACY_MARKER_PATTERN.match(content)
+    if match is None:
+        return None
+
+    fields = dict(pair.split("=", 1) for pair in match["fields"].split())
+    try:
+        return SummaryMarker(
+            prompt_hash=fields["prompt"],
+            model=unquote(fields.get("model", "")) or None,
+            created_at=int(fields.get("at", 0)),
+            version=int(match["version"]),
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+def is_summarized(content: str) -> bool:
+    """Return whether the content carries a summary, recognized by its watermark or a legacy marker comment."""
+    return content.startswith(LEGACY_MARKER_PREFIX) or WATERMARK_DETECTOR in content
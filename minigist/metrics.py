@@ -0,0 +1,258 @@
+"""In-process metrics for pipeline stages with JSON and Prometheus exposition."""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+METRIC_PREFIX = "minigist"
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+QUEUE_DEPTH_BUCKETS = (0.0, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0)
+STAGE_LATENCY_WINDOW_SIZE = 50
+
+LabelSet = tuple[tuple[str, str], ...]
+
+
+@dataclass
+class Histogram:
+    """Cumulative histogram with fixed upper bounds."""
+
+    buckets: tuple[float, ...]
+    bucket_counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Initialize one counter per bucket."""
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        self.count += 1
+        self.total += value
+        for index, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                self.bucket_counts[index] += 1
+
+    def quantile(self, fraction: float) -> float | None:
+        """Estimate a quantile by linear interpolation within the matching bucket."""
+        if self.count == 0:
+            return None
+
+        rank = fraction * self.count
+        lower_bound = 0.0
+        lower_count = 0
+        for upper_bound, cumulative_count in zip(self.buckets, self.bucket_counts, strict=True):
+            if cumulative_count >= rank:
+                in_bucket = cumulative_count - lower_count
+                if in_bucket == 0:
+                    return upper_bound
+                return lower_bound + (upper_bound - lower_bound) * (rank - lower_count) / in_bucket
+            lower_bound = upper_bound
+            lower_count = cumulative_count
+
+        return self.buckets[-1]
+
+
+class PipelineMetrics:
+    """Thread-safe registry of counters, gauges and histograms."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[LabelSet, float]] = {}
+        self._gauges: dict[str, dict[LabelSet, float]] = {}
+        self._histograms: dict[str, dict[LabelSet, Histogram]] = {}
+        self._help: dict[str, str] = {}
+        self._recent_stage_latencies: dict[str, deque[float]] = {}
+
+    @staticmethod
+    def _label_set(labels: dict[str, object]) -> LabelSet:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def increment(self, name: str, amount: float = 1, description: str = "", **labels: object) -> None:
+        """Increase a counter."""
+        label_set = self._label_set(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[label_set] = series.get(label_set, 0) + amount
+            self._help.setdefault(name, description)
+
+    def set_gauge(self, name: str, value: float, description: str = "", **labels: object) -> None:
+        """Set a gauge to the given value."""
+        label_set = self._label_set(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[label_set] = value
+            self._help.setdefault(name, description)
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        description: str = "",
+        **labels: object,
+    ) -> None:
+        """Record an observation in a histogram."""
+        self._observe(name, value, buckets, description, labels)
+
+    def _observe(
+        self,
+        name: str,
+        value: float,
+        buckets: tuple[float, ...],
+        description: str,
+        labels: dict[str, object],
+    ) -> None:
+        """Record an observation in a histogram using an explicit label mapping."""
+        label_set = self._label_set(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(label_set)
+            if histogram is None:
+                histogram = series[label_set] = Histogram(buckets=buckets)
+            histogram.observe(value)
+            self._help.setdefault(name, description)
+
+    @contextmanager
+    def time_stage(self, stage: str, **labels: object) -> Iterator[None]:
+        """Record the duration of the enclosed block as a stage latency."""
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe_stage(stage, time.monotonic() - started_at, **labels)
+
+    def observe_stage(self, stage: str, seconds: float, **labels: object) -> None:
+        """Record a stage latency in seconds."""
+        self._observe(
+            "stage_duration_seconds",
+            seconds,
+            LATENCY_BUCKETS,
+            "Latency of pipeline stages in seconds.",
+            {"stage": stage, **labels},
+        )
+        with self._lock:
+            window = self._recent_stage_latencies.setdefault(stage, deque(maxlen=STAGE_LATENCY_WINDOW_SIZE))
+            window.append(seconds)
+
+    def recent_stage_latency(self, stage: str) -> float | None:
+        """Return the mean of the most recent latencies of a stage, or None before the first observation."""
+        with self._lock:
+            window = self._recent_stage_latencies.get(stage)
+            if not window:
+                return None
+            return sum(window) / len(window)
+
+    def observe_queue_depth(self, queue: str, depth: int) -> None:
+        """Record the depth of a pipeline queue."""
+        self.observe(
+            "queue_depth",
+            depth,
+            buckets=QUEUE_DEPTH_BUCKETS,
+            description="Number of items waiting in pipeline queues.",
+            queue=queue,
+        )
+        with self._lock:
+            series = self._gauges.setdefault("queue_depth_max", {})
+            label_set = self._label_set({"queue": queue})
+            series[label_set] = max(series.get(label_set, 0), depth)
+            self._help.setdefault("queue_depth_max", "Maximum observed depth of pipeline queues.")
+
+    def record_retry(self, operation: str) -> None:
+        """Count a retried operation."""
+        self.increment("retries_total", description="Number of retried operations.", operation=operation)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot of all metrics."""
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(label_set), "value": value} for label_set, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            gauges = {
+                name: [{"labels": dict(label_set), "value": value} for label_set, value in series.items()]
+                for name, series in self._gauges.items()
+            }
+            histograms = {
+                name: [
+                    {
+                        "labels": dict(label_set),
+                        "count": histogram.count,
+                        "sum": histogram.total,
+                        "p50": histogram.quantile(0.5),
+                        "p95": histogram.quantile(0.95),
+                        "buckets": dict(zip(map(str, histogram.buckets), histogram.bucket_counts, strict=True)),
+                    }
+                    for label_set, histogram in series.items()
+                ]
+                for name, series in self._histograms.items()
+            }
+
+        return {"counters": counters, "gauges": gauges, "histograms": histograms}
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        with self._lock:
+            for kind, families in (("counter", self._counters), ("gauge", self._gauges)):
+                for name, series in sorted(families.items()):
+                    full_name = f"{METRIC_PREFIX}_{name}"
+                    lines.append(f"# HELP {full_name} {self._help.get(name, '')}".rstrip())
+                    lines.append(f"# TYPE {full_name} {kind}")
+                    for label_set, value in sorted(series.items()):
+                        lines.append(f"{full_name}{_format_labels(label_set)} {value}")
+
+            for name, histograms in sorted(self._histograms.items()):
+                full_name = f"{METRIC_PREFIX}_{name}"
+                lines.append(f"# HELP {full_name} {self._help.get(name, '')}".rstrip())
+                lines.append(f"# TYPE {full_name} histogram")
+                for label_set, histogram in sorted(histograms.items()):
+                    for upper_bound, bucket_count in zip(histogram.buckets, histogram.bucket_counts, strict=True):
+                        bucket_labels = (*label_set, ("le", str(upper_bound)))
+                        lines.append(f"{full_name}_bucket{_format_labels(bucket_labels)} {bucket_count}")
+                    inf_labels = (*label_set, ("le", "+Inf"))
+                    lines.append(f"{full_name}_bucket{_format_labels(inf_labels)} {histogram.count}")
+                    lines.append(f"{full_name}_sum{_format_labels(label_set)} {histogram.total}")
+                    lines.append(f"{full_name}_count{_format_labels(label_set)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: Path) -> None:
+        """Write a JSON snapshot of all metrics to the given path."""
+        _write_atomically(path, json.dumps(self.to_dict(), indent=2))
+        logger.info("Wrote metrics snapshot", path=str(path))
+
+    def write_prometheus_textfile(self, path: Path) -> None:
+        """Write metrics in a format suitable for the node_exporter textfile collector."""
+        _write_atomically(path, self.render_prometheus())
+        logger.info("Wrote Prometheus metrics", path=str(path))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(label_set: LabelSet) -> str:
+    if not label_set:
+        return ""
+    formatted = ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in label_set)
+    return "{" + formatted + "}"
+
+
+def _write_atomically(path: Path, content: str) -> None:
+    temporary_path = path.with_name(f".{path.name}.tmp")
+    temporary_path.write_text(content)
+    os.replace(temporary_path, path)
@@ -1,49 +1,80 @@
-"""Miniflux API client wrapper with retry handling."""
+"""Async Miniflux API client with retry handling."""
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 from functools import partial
 from typing import TypeVar
 
-from miniflux import Client  # type: ignore
-from tenacity import RetryCallState, Retrying, retry_if_exception_type, stop_after_attempt, wait_fixed
+import httpx
+from pydantic import TypeAdapter
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception_type, stop_after_attempt, wait_fixed
 
 from .config import FetchConfig, MinifluxConfig
-from .constants import MAX_RETRIES_PER_ENTRY, RETRY_DELAY_SECONDS
-from .exceptions import MinifluxApiError
+from .constants import MAX_RETRIES_PER_ENTRY, MINIFLUX_KEEPALIVE_EXPIRY_SECONDS, RETRY_DELAY_SECONDS
+from .exceptions import ConfigError, MinifluxApiError
 from .logging import format_log_preview, get_logger
-from .models import EntriesResponse, Entry, Feed, FeedsResponse
+from .metrics import PipelineMetrics
+from .models import EntriesResponse, Entry, Feed
 
 logger = get_logger(__name__)
 T = TypeVar("T")
 
+FEEDS_ADAPTER = TypeAdapter(list[Feed])
+
 
 class MinifluxClient:
-    """Wrap Miniflux API calls with retry and error handling."""
+    """Wrap Miniflux API calls with retry and error handling on a pooled async HTTP client."""
 
-    def __init__(self, config: MinifluxConfig, dry_run: bool = False):
+    def __init__(self, config: MinifluxConfig, dry_run: bool = False, metrics: PipelineMetrics | None = None):
         """Initialize the Miniflux client with configuration and dry-run mode."""
-        self.client = Client(
-            base_url=str(config.url),
-            api_key=config.api_key,
+        self.metrics = metrics or PipelineMetrics()
+        self.timeout_seconds = config.timeout_seconds
+        self.concurrency = config.concurrency
+        self.dry_run = dry_run
+
+        if config.http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as e:
+                logger.error("HTTP/2 is enabled for Miniflux but the 'h2' package is not installed")
+                raise ConfigError("Miniflux HTTP/2 support requires the optional 'http2' dependencies") from e
+
+        self.http_client = httpx.AsyncClient(
+            base_url=f"{str(config.url).rstrip('/')}/v1",
+            headers={"X-Auth-Token": config.api_key},
             timeout=config.timeout_seconds,
+            http2=config.http2,
+            limits=httpx.Limits(
+                max_connections=config.concurrency,
+                max_keepalive_connections=config.concurrency,
+                keepalive_expiry=MINIFLUX_KEEPALIVE_EXPIRY_SECONDS,
+            ),
         )
-        self.dry_run = dry_run
 
         if dry_run:
             logger.warning("Running in dry run mode; no updates will be made")
 
+    async def __aenter__(self) -> "MinifluxClient":
+        """Return the client for async context manager usage."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, exc_tb) -> None:
+        """Close pooled connections when exiting an async context."""
+        await self.aclose()
+
     def _log_retry_attempt(self, retry_state: RetryCallState, action_name: str) -> None:
         """Log a retry attempt for a Miniflux API operation."""
         exception = retry_state.outcome.exception() if retry_state.outcome else None
+        self.metrics.record_retry(action_name)
         logger.warning(
             f"Action '{action_name}' failed, retrying...",
             attempt=retry_state.attempt_number,
             error=str(exception) if exception else "Unknown error",
         )
 
-    def _call_with_retry(self, action: Callable[[], T], action_name: str) -> T:
+    async def _call_with_retry(self, action: Callable[[], Awaitable[T]], action_name: str) -> T:
         """Execute a Miniflux API action with retry behavior."""
-        retryer = Retrying(
+        retryer = AsyncRetrying(
             stop=stop_after_attempt(MAX_RETRIES_PER_ENTRY),
             wait=wait_fixed(RETRY_DELAY_SECONDS),
             retry=retry_if_exception_type(MinifluxApiError),
@@ -51,10 +82,20 @@ class MinifluxClient:
             reraise=True,
         )
 
-        return retryer(action)
+        with self.metrics.time_stage("miniflux", operation=action_name):
+            return await retryer(action)
+
+    async def get_entries(
+        self,
+        feed_ids: list[int] | None,
+        fetch_config: FetchConfig,
+        timeout: float | None = None,
+    ) -> list[Entry]:
+        """Fetch unread entries from Miniflux with retries, querying feeds concurrently.
 
-    def get_entries(self, feed_ids: list[int] | None, fetch_config: FetchConfig) -> list[Entry]:
-        """Fetch unread entries from Miniflux with retries."""
+        At most one request per pooled connection is in flight, so feeds beyond the pool size wait
+        here rather than for a connection, where the request timeout would already be running.
+        """
         params: dict[str, object] = {
             "status": "unread",
             "direction": "desc",
@@ -65,29 +106,75 @@ class MinifluxClient:
         logger.debug("Fetching entries", parameters=params)
 
         if feed_ids:
-            all_entries: list[Entry] = []
-
-            for feed_id in feed_ids:
-                entries = self._call_with_retry(
-                    partial(self._get_feed_entries, feed_id=feed_id, params=params),
-                    "get_miniflux_entries",
-                )
-                all_entries.extend(entries)
+            connections = asyncio.Semaphore(self.concurrency)
+
+            async def get_feed_entries(feed_id: int) -> list[Entry]:
+                async with connections:
+                    return await self._call_with_retry(
+                        partial(self._get_feed_entries, feed_id, params, timeout),
+                        "get_miniflux_entries",
+                    )
+
+            per_feed_entries = await asyncio.gather(*(get_feed_entries(feed_id) for feed_id in feed_ids))
+            all_entries = [entry for entries in per_feed_entries for entry in entries]
         else:
-            all_entries = self._call_with_retry(
-                lambda: self._get_entries(params=params),
+            all_entries = await self._call_with_retry(
+                partial(self._get_entries, params, timeout),
                 "get_miniflux_entries",
             )
 
         logger.info("Fetched unread entries", count=len(all_entries))
         return all_entries
 
-    def _get_feed_entries(self, feed_id: int, params: dict[str, object]) -> list[Entry]:
+    async def get_entry_page(
+        self,
+        after_entry_id: int,
+        limit: int,
+        feed_id: int | None = None,
+        filters: dict[str, object] | None = None,
+        timeout: float | None = None,
+    ) -> list[Entry]:
+        """Fetch the next page of entries in ascending ID order with retries, whatever their status."""
+        params: dict[str, object] = {
+            **(filters or {}),
+            "order": "id",
+            "direction": "asc",
+            "after_entry_id": after_entry_id,
+            "limit": limit,
+        }
+        if feed_id is not None:
+            return await self._call_with_retry(
+                partial(self._get_feed_entries, feed_id, params, timeout),
+                "get_miniflux_entries",
+            )
+        return await self._call_with_retry(partial(self._get_entries, params, timeout), "get_miniflux_entries")
+
+    def _timeout(self, timeout: float | None) -> float:
+        """Return the per-call timeout, falling back to the configured default."""
+        return self.timeout_seconds if timeout is None else timeout
+
+    async def _get_json_bytes(
+        self,
+        path: str,
+        params: dict[str, object] | None = None,
+        timeout: float | None = None,
+    ) -> bytes:
+        """Fetch a Miniflux API resource and return the undecoded response body."""
+        query = {key: value for key, value in (params or {}).items() if value is not None}
+        response = await self.http_client.get(path, params=query, timeout=self._timeout(timeout))  # type: ignore[arg-type]
+        response.raise_for_status()
+        return response.content
+
+    async def _get_feed_entries(
+        self,
+        feed_id: int,
+        params: dict[str, object],
+        timeout: float | None = None,
+    ) -> list[Entry]:
         """Fetch entries for a single Miniflux feed without retries."""
         try:
-            raw_response = self.client.get_feed_entries(feed_id=feed_id, **params)
-            response = EntriesResponse.model_validate(raw_response)
-            return response.entries
+            raw_response = await self._get_json_bytes(f"/feeds/{feed_id}/entries", params, timeout)
+            return EntriesResponse.model_validate_json(raw_response).entries
         except Exception as e:
             logger.error(
                 "Failed to fetch entries from Miniflux",
@@ -96,17 +183,22 @@ class MinifluxClient:
             )
             raise MinifluxApiError(f"Failed to fetch entries for feed {feed_id}") from e
 
-    def _get_entries(self, params: dict[str, object]) -> list[Entry]:
+    async def _get_entries(self, params: dict[str, object], timeout: float | None = None) -> list[Entry]:
         """Fetch entries across all feeds without retries."""
         try:
-            raw_response = self.client.get_entries(**params)
-            response = EntriesResponse.model_validate(raw_response)
-            return response.entries
+            raw_response = await self._get_json_bytes("/entries", params, timeout)
+            return EntriesResponse.model_validate_json(raw_response).entries
         except Exception as e:
             logger.error("Failed to fetch entries from Miniflux", error=str(e))
             raise MinifluxApiError("Failed to fetch entries") from e
 
-    def update_entry(self, entry_id: int, content: str, log_context: dict[str, object]) -> None:
+    async def update_entry(
+        self,
+        entry_id: int,
+        content: str,
+        log_context: dict[str, object],
+        timeout: float | None = None,
+    ) -> None:
         """Update entry content in Miniflux with retries."""
         logger.info(
             "Updating entry",
@@ -122,15 +214,26 @@ class MinifluxClient:
             )
             return
 
-        self._call_with_retry(
-            lambda: self._update_entry(entry_id=entry_id, content=content, log_context=log_context),
+        await self._call_with_retry(
+            partial(self._update_entry, entry_id, content, log_context, timeout),
             "update_miniflux_entry",
         )
 
-    def _update_entry(self, entry_id: int, content: str, log_context: dict[str, object]) -> None:
+    async def _update_entry(
+        self,
+        entry_id: int,
+        content: str,
+        log_context: dict[str, object],
+        timeout: float | None = None,
+    ) -> None:
         """Perform the Miniflux update call without retries."""
         try:
-            self.client.update_entry(entry_id=entry_id, content=content)
+            response = await self.http_client.put(
+                f"/entries/{entry_id}",
+                json={"content": content},
+                timeout=self._timeout(timeout),
+            )
+            response.raise_for_status()
         except Exception as e:
             logger.error(
                 "Failed to update entry",
@@ -139,17 +242,23 @@ class MinifluxClient:
             )
             raise MinifluxApiError(f"Failed to update entry ID {entry_id}") from e
 
-    def get_feeds(self) -> list[Feed]:
+    async def get_feeds(self, timeout: float | None = None) -> list[Feed]:
         """Fetch Miniflux feeds metadata with retries."""
         logger.debug("Fetching feeds metadata")
-        return self._call_with_retry(self._get_feeds, "get_miniflux_feeds")
+        return await self._call_with_retry(partial(self._get_feeds, timeout), "get_miniflux_feeds")
 
-    def _get_feeds(self) -> list[Feed]:
+    async def _get_feeds(self, timeout: float | None = None) -> list[Feed]:
         """Perform the Miniflux feeds fetch without retries."""
         try:
-            raw_response = self.client.get_feeds()
-            response = FeedsResponse.model_validate({"feeds": raw_response})
-            return response.feeds
+            raw_response = await self._get_json_bytes("/feeds", timeout=timeout)
+            return FEEDS_ADAPTER.validate_json(raw_response)
         except Exception as e:
             logger.error("Failed to fetch feeds from Miniflux", error=str(e))
             raise MinifluxApiError("Failed to fetch feeds") from e
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        try:
+            await self.http_client.aclose()
+        except Exception as e:
+            logger.warning("Failed to close Miniflux HTTP client cleanly", error=str(e))
@@ -30,6 +30,14 @@ class ProcessingStats(BaseModel):
     total_considered: int
     processed_successfully: int
     failed_processing: int
+    hedged_requests: int = 0
+    hedge_wins: int = 0
+    resumed_from_journal: int = 0
+    duplicates_merged: int = 0
+    near_duplicate_lookups: int = 0
+    near_duplicate_hits: int = 0
+    deferred: int = 0
+    unclaimed: int = 0
 
 
 class Category(BaseModel):
@@ -43,5 +51,8 @@ class Feed(BaseModel):
     category: Category | None = None
 
 
-class FeedsResponse(BaseModel):
-    feeds: list[Feed]
+class StripStats(BaseModel):
+    scanned: int = 0
+    stripped: int = 0
+    unsplittable: int = 0
+    failed: int = 0
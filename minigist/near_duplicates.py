@@ -0,0 +1,176 @@
+"""SimHash fingerprints for recognizing near-identical articles across runs."""
+
+import hashlib
+import re
+import sqlite3
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from .constants import (
+    FINGERPRINT_BITS,
+    FINGERPRINT_SHINGLE_SIZE,
+    MIN_FINGERPRINT_TOKENS,
+    NEAR_DUPLICATE_RETENTION_SECONDS,
+)
+from .exceptions import ConfigError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+FINGERPRINT_MASK = (1 << FINGERPRINT_BITS) - 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fingerprint INTEGER NOT NULL,
+    prompt_key TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    model TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def simhash(text: str) -> int | None:
+    """Return a 64-bit SimHash of word shingles in the text, or None if the text is too short."""
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) < MIN_FINGERPRINT_TOKENS:
+        return None
+
+    shingles = Counter(
+        " ".join(tokens[index : index + FINGERPRINT_SHINGLE_SIZE])
+        for index in range(len(tokens) - FINGERPRINT_SHINGLE_SIZE + 1)
+    )
+    weights = [0] * FINGERPRINT_BITS
+    for shingle, count in shingles.items():
+        digest = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=FINGERPRINT_BITS // 8).digest())
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if digest >> bit & 1 else -count
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(left: int, right: int) -> int:
+    """Return the number of differing bits between two fingerprints."""
+    return (left ^ right).bit_count()
+
+
+def prompt_key(prompt: str) -> str:
+    """Return a short digest identifying a prompt's text."""
+    return hashlib.sha256(prompt.encode()).hexdigest()[:16]
+
+
+def _to_signed(fingerprint: int) -> int:
+    return fingerprint - (1 << FINGERPRINT_BITS) if fingerprint >> (FINGERPRINT_BITS - 1) else fingerprint
+
+
+def _to_unsigned(value: int) -> int:
+    return value & FINGERPRINT_MASK
+
+
+@dataclass(frozen=True)
+class NearDuplicateMatch:
+    """A stored summary of an article whose fingerprint is close to the looked-up one."""
+
+    summary: str
+    model: str
+    distance: int
+
+
+class NearDuplicateIndex:
+    """Find stored summaries of near-identical articles using banded locality-sensitive hashing.
+
+    Fingerprints are split into max_distance + 1 bands, so any two fingerprints within
+    max_distance bits share at least one identical band and end up as candidates.
+    """
+
+    def __init__(self, path: Path, max_distance: int):
+        """Open or create the persisted index and load its fingerprints into memory."""
+        self.path = path.expanduser()
+        self.max_distance = max_distance
+        self.lookups = 0
+        self.hits = 0
+        band_count = max_distance + 1
+        band_width = FINGERPRINT_BITS // band_count
+        self._bands = [
+            (index * band_width, FINGERPRINT_BITS if index == band_count - 1 else (index + 1) * band_width)
+            for index in range(band_count)
+        ]
+        self._buckets: dict[tuple[int, int], list[int]] = {}
+        self._fingerprints: dict[int, tuple[int, str]] = {}
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+            self._connection.execute(
+                "DELETE FROM fingerprints WHERE created_at < ?",
+                (time.time() - NEAR_DUPLICATE_RETENTION_SECONDS,),
+            )
+            rows = self._connection.execute("SELECT id, fingerprint, prompt_key FROM fingerprints").fetchall()
+        except (OSError, sqlite3.Error) as e:
+            logger.error("Failed to open near-duplicate index", path=str(self.path), error=str(e))
+            raise ConfigError(f"Cannot open near-duplicate index at {self.path}") from e
+
+        for row_id, fingerprint, key in rows:
+            self._add(row_id, _to_unsigned(fingerprint), key)
+        logger.debug("Loaded near-duplicate index", path=str(self.path), fingerprints=len(rows))
+
+    def _band_keys(self, fingerprint: int) -> list[tuple[int, int]]:
+        return [
+            (index, (fingerprint >> start) & ((1 << (end - start)) - 1))
+            for index, (start, end) in enumerate(self._bands)
+        ]
+
+    def _add(self, row_id: int, fingerprint: int, key: str) -> None:
+        self._fingerprints[row_id] = (fingerprint, key)
+        for band_key in self._band_keys(fingerprint):
+            self._buckets.setdefault(band_key, []).append(row_id)
+
+    def lookup(self, fingerprint: int, key: str) -> NearDuplicateMatch | None:
+        """Return the closest stored summary for the same prompt within the distance threshold."""
+        self.lookups += 1
+        best: tuple[int, int] | None = None
+        for band_key in self._band_keys(fingerprint):
+            for row_id in self._buckets.get(band_key, ()):
+                candidate, candidate_key = self._fingerprints[row_id]
+                if candidate_key != key:
+                    continue
+                distance = hamming_distance(fingerprint, candidate)
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, row_id)
+
+        if best is None:
+            return None
+
+        row = self._connection.execute("SELECT summary, model FROM fingerprints WHERE id = ?", (best[1],)).fetchone()
+        if row is None:
+            return None
+
+        self.hits += 1
+        return NearDuplicateMatch(summary=row[0], model=row[1], distance=best[0])
+
+    def add(self, fingerprint: int, key: str, summary: str, model: str) -> None:
+        """Persist a generated summary under the article's fingerprint."""
+        try:
+            cursor = self._connection.execute(
+                "INSERT INTO fingerprints (fingerprint, prompt_key, summary, model, created_at) VALUES (?, ?, ?, ?, ?)",
+                (_to_signed(fingerprint), key, summary, model, time.time()),
+            )
+        except sqlite3.Error as e:
+            logger.warning("Failed to store article fingerprint", error=str(e))
+            return
+
+        if cursor.lastrowid is not None:
+            self._add(cursor.lastrowid, fingerprint, key)
+
+    def close(self) -> None:
+        """Close the persisted index."""
+        try:
+            self._connection.close()
+        except sqlite3.Error as e:
+            logger.warning("Failed to close near-duplicate index cleanly", error=str(e))
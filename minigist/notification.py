@@ -1,16 +1,24 @@
-import apprise
+from typing import TYPE_CHECKING
 
 from .logging import get_logger
 
+if TYPE_CHECKING:
+    import apprise
+
 logger = get_logger(__name__)
 
 
 class AppriseNotifier:
+    apobj: "apprise.Apprise | None"
+
     def __init__(self, urls: list[str]):
-        self.apobj = apprise.Apprise()
+        self.apobj = None
         self.has_urls = False
 
         if urls:
+            import apprise
+
+            self.apobj = apprise.Apprise()
             for url in urls:
                 if self.apobj.add(url):
                     logger.info("Added Apprise notification URL", url=url)
@@ -21,7 +29,7 @@ class AppriseNotifier:
             logger.warning("No Apprise notification URLs configured")
 
     def notify(self, title: str, body: str) -> None:
-        if not self.has_urls:
+        if not self.has_urls or self.apobj is None:
             logger.debug("Skipping notification as no valid Apprise URLs are configured")
             return
 
@@ -1,14 +1,20 @@
 from minigist.pipeline.base_worker import BaseWorker
+from minigist.pipeline.dependency_health import DependencyHealth
 from minigist.pipeline.fetch_worker import FetchWorker
+from minigist.pipeline.host_scheduler import HostScheduler
 from minigist.pipeline.llm_worker import LLMWorker
-from minigist.pipeline.types import InQueueItem, OutQueueItem
+from minigist.pipeline.types import FeedTarget, InQueueItem, OutQueueItem, PrioritizedItem
 from minigist.pipeline.update_worker import UpdateWorker
 
 __all__ = [
     "BaseWorker",
+    "DependencyHealth",
+    "FeedTarget",
     "FetchWorker",
+    "HostScheduler",
     "InQueueItem",
     "LLMWorker",
     "OutQueueItem",
+    "PrioritizedItem",
     "UpdateWorker",
 ]
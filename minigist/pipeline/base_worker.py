@@ -4,21 +4,48 @@ from collections.abc import Callable
 from tenacity import RetryCallState
 
 from minigist.constants import MAX_RETRIES_PER_ENTRY
+from minigist.journal import EntryJournal
 from minigist.logging import get_logger
+from minigist.metrics import PipelineMetrics
+from minigist.pipeline.dependency_health import DependencyHealth
 
 logger = get_logger(__name__)
 
 
 class BaseWorker:
-    def __init__(self, record_failure: Callable[[], None], abort_event: asyncio.Event) -> None:
+    def __init__(
+        self,
+        record_failure: Callable[[], None],
+        abort_event: asyncio.Event,
+        metrics: PipelineMetrics,
+        journal: EntryJournal | None = None,
+        health: DependencyHealth | None = None,
+    ) -> None:
         self.record_failure = record_failure
         self.abort_event = abort_event
+        self.metrics = metrics
+        self.journal = journal
+        self.health = health
 
     def _record_failure(self) -> None:
         self.record_failure()
 
+    async def _wait_for_dependency(self) -> None:
+        """Wait while the service this worker calls is paused by its circuit breaker."""
+        if self.health is not None:
+            await self.health.wait_until_available()
+
+    def _record_dependency_outcome(self, failed: bool) -> None:
+        if self.health is None:
+            return
+        if failed:
+            self.health.record_failure()
+        else:
+            self.health.record_success()
+
     def _log_retry_attempt(self, retry_state: RetryCallState, action_name: str, log_context: dict[str, object]) -> None:
         exception = retry_state.outcome.exception() if retry_state.outcome else None
+        self.metrics.record_retry(action_name)
         logger.warning(
             f"Action '{action_name}' failed, retrying...",
             **log_context,
@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+from minigist.constants import (
+    DEPENDENCY_BASE_COOLDOWN_SECONDS,
+    DEPENDENCY_FAILURE_THRESHOLD,
+    DEPENDENCY_MAX_COOLDOWN_SECONDS,
+    DEPENDENCY_MAX_TRIPS,
+)
+from minigist.logging import get_logger
+from minigist.metrics import PipelineMetrics
+
+logger = get_logger(__name__)
+
+
+class DependencyHealth:
+    """Circuit breaker for a service that a pipeline stage depends on.
+
+    After `failure_threshold` consecutive failures, the stage pauses for a cooldown that doubles
+    with every trip. When it ends, a single call is let through as a probe while the others wait:
+    a success closes the breaker, a failure trips it again. A critical dependency that trips
+    `max_trips` times without recovering sets the abort event, since the run cannot make progress.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        critical: bool,
+        abort_event: asyncio.Event,
+        metrics: PipelineMetrics | None = None,
+        failure_threshold: int = DEPENDENCY_FAILURE_THRESHOLD,
+        base_cooldown_seconds: float = DEPENDENCY_BASE_COOLDOWN_SECONDS,
+        max_cooldown_seconds: float = DEPENDENCY_MAX_COOLDOWN_SECONDS,
+        max_trips: int = DEPENDENCY_MAX_TRIPS,
+    ) -> None:
+        self.name = name
+        self.critical = critical
+        self.abort_event = abort_event
+        self.metrics = metrics or PipelineMetrics()
+        self.failure_threshold = failure_threshold
+        self.base_cooldown_seconds = base_cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.max_trips = max_trips
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.opened_until: float | None = None
+        self.probing = False
+        self.is_down = False
+        self._state_changed = asyncio.Event()
+
+    def _notify(self) -> None:
+        self._state_changed.set()
+        self._state_changed = asyncio.Event()
+
+    async def wait_until_available(self) -> None:
+        """Wait while the breaker is open or another caller is probing; return at once after an abort."""
+        while self.opened_until is not None and not self.abort_event.is_set():
+            remaining = self.opened_until - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+                continue
+
+            if not self.probing:
+                self.probing = True
+                logger.info("Probing whether dependency has recovered", dependency=self.name)
+                return
+
+            try:
+                await asyncio.wait_for(self._state_changed.wait(), timeout=self.max_cooldown_seconds)
+            except TimeoutError:
+                # The probe ended without reporting an outcome, e.g. because no call was needed after all.
+                self.probing = False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        self.consecutive_failures = 0
+        if self.opened_until is None:
+            return
+
+        logger.info("Dependency has recovered; resuming its stage", dependency=self.name)
+        self.trips = 0
+        self.opened_until = None
+        self.probing = False
+        self._notify()
+
+    def record_failure(self) -> None:
+        """Record a failed call, tripping the breaker after too many consecutive failures or a failed probe."""
+        self.consecutive_failures += 1
+        if not self.probing and (self.opened_until is not None or self.consecutive_failures < self.failure_threshold):
+            return
+
+        self.trips += 1
+        cooldown = min(self.base_cooldown_seconds * 2 ** (self.trips - 1), self.max_cooldown_seconds)
+        self.opened_until = time.monotonic() + cooldown
+        self.probing = False
+        self.metrics.increment(
+            "dependency_breaker_trips_total",
+            description="Number of times a dependency's circuit breaker paused its stage.",
+            dependency=self.name,
+        )
+        logger.warning(
+            "Dependency keeps failing; pausing its stage",
+            dependency=self.name,
+            consecutive_failures=self.consecutive_failures,
+            cooldown_seconds=cooldown,
+            trips=self.trips,
+        )
+
+        if self.critical and self.trips >= self.max_trips:
+            self.is_down = True
+            logger.critical("Critical dependency is down; aborting the run", dependency=self.name)
+            self.abort_event.set()
+        self._notify()
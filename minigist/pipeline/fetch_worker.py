@@ -1,13 +1,26 @@
 import asyncio
-from collections.abc import Callable
+import functools
+import math
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Sequence
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any
 
-from minigist.downloader import Downloader
-from minigist.exceptions import ArticleFetchError
+from minigist import tracing
+from minigist.deadline import RunDeadline
+from minigist.downloader import Downloader, looks_complete
+from minigist.exceptions import ArticleFetchError, ArticleTransportError, HostUnavailableError
+from minigist.fetch_methods import FetchMethodMemory
+from minigist.journal import EntryJournal
 from minigist.logging import format_log_preview, get_logger
+from minigist.metrics import PipelineMetrics
 from minigist.models import Entry
 from minigist.pipeline.base_worker import BaseWorker
-from minigist.pipeline.types import InQueueItem
+from minigist.pipeline.dependency_health import DependencyHealth
+from minigist.pipeline.host_scheduler import HostScheduler
+from minigist.pipeline.types import FeedTarget, FetchStrategy, InQueueItem, PrioritizedItem
+from minigist.urls import canonicalize_url
 
 logger = get_logger(__name__)
 
@@ -18,19 +31,35 @@ class FetchWorker(BaseWorker):
         downloader: Downloader,
         total_considered_entries: int,
         use_targets: bool,
-        feed_target_map: dict[int, tuple[str, bool]],
+        feed_target_map: dict[int, FeedTarget],
         default_prompt_id: str,
+        host_scheduler: HostScheduler,
         record_failure: Callable[[], None],
         abort_event: asyncio.Event,
+        metrics: PipelineMetrics,
+        journal: EntryJournal | None = None,
+        deadline: RunDeadline | None = None,
+        strategy: FetchStrategy = "single",
+        fetch_methods: FetchMethodMemory | None = None,
+        health: DependencyHealth | None = None,
     ) -> None:
-        super().__init__(record_failure, abort_event)
+        super().__init__(record_failure, abort_event, metrics, journal, health)
         self.downloader = downloader
         self.total_considered_entries = total_considered_entries
         self.use_targets = use_targets
         self.feed_target_map = feed_target_map
         self.default_prompt_id = default_prompt_id
+        self.host_scheduler = host_scheduler
+        self.duplicates_merged = 0
+        self.deadline = deadline
+        self.strategy = strategy
+        self.fetch_methods = fetch_methods
+        self.deadline_reached = False
+        self.deferred = 0
+        self.fetch_slots: asyncio.Semaphore | None = None
+        self.transport_failed_hosts: set[str] = set()
 
-    def _resolve_prompt_and_source(self, entry: Entry, log_context: dict[str, object]) -> tuple[str, bool] | None:
+    def _resolve_target(self, entry: Entry, log_context: dict[str, object]) -> FeedTarget | None:
         if self.use_targets:
             target = self.feed_target_map.get(entry.feed_id)
             if not target:
@@ -40,66 +69,419 @@ class FetchWorker(BaseWorker):
                 )
                 return None
             return target
-        return self.default_prompt_id, False
+        return FeedTarget(prompt_id=self.default_prompt_id, use_pure=False)
 
     async def run(
         self,
         loop: asyncio.AbstractEventLoop,
         entries: list[Entry],
-        in_queue: asyncio.Queue[InQueueItem | None],
+        in_queue: asyncio.PriorityQueue[PrioritizedItem],
         fetch_executor: ThreadPoolExecutor,
         llm_concurrency: int,
+        fetch_concurrency: int,
     ) -> None:
-        for entry_count, entry in enumerate(entries, 1):
-            if self.abort_event.is_set():
-                break
-
-            log_context: dict[str, object] = {
-                "miniflux_entry_id": entry.id,
-                "miniflux_feed_id": entry.feed_id,
-                "processor_id": f"{entry_count}/{self.total_considered_entries}",
-            }
-            logger.debug("Processing entry", **log_context)
-
-            target = self._resolve_prompt_and_source(entry, log_context)
-            if not target:
-                self._record_failure()
+        numbered_groups = list(enumerate(self._group_duplicates(entries), 1))
+        hosts = [self._request_host(entry) for _, (entry, _) in numbered_groups]
+
+        await self._dispatch(
+            list(zip(numbered_groups, hosts, strict=True)),
+            fetch_concurrency,
+            lambda entry_count, entry, duplicates, host: self._fetch_entry(
+                loop, entry, duplicates, entry_count, host, in_queue, fetch_executor
+            ),
+        )
+
+        for _ in range(llm_concurrency):
+            await in_queue.put(PrioritizedItem(math.inf))
+
+    async def _dispatch(
+        self,
+        scheduled: Sequence[tuple[tuple[int, tuple[Entry, tuple[Entry, ...]]], str | None]],
+        fetch_concurrency: int,
+        start: Callable[[int, Entry, tuple[Entry, ...], str | None], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Start entries in priority order as fetch slots free up, skipping entries whose host is busy.
+
+        Deadline admission follows the same order, so low-priority entries are the ones deferred. An
+        entry holds its global slot until its article text is queued, so a slow LLM stage applies
+        backpressure here. Entries waiting for a busy host hold none, so a slow host cannot take up
+        the slots that other hosts could use. Entries without a host are not known to download anything
+        and are never held back.
+        """
+        waiting: dict[str | None, deque[tuple[int, tuple[int, tuple[Entry, tuple[Entry, ...]]]]]] = {}
+        for rank, (group, host) in enumerate(scheduled):
+            waiting.setdefault(host, deque()).append((rank, group))
+
+        fetch_slots = self.fetch_slots = asyncio.Semaphore(fetch_concurrency)
+        per_host_limit = self.host_scheduler.per_host_concurrency
+        busy: dict[str | None, int] = defaultdict(int)
+        running: set[asyncio.Task[None]] = set()
+        started: list[asyncio.Task[None]] = []
+
+        def finish(host: str | None, task: asyncio.Task[None]) -> None:
+            busy[host] -= 1
+            running.discard(task)
+            fetch_slots.release()
+
+        while any(waiting.values()):
+            await fetch_slots.acquire()
+            ready = [
+                (queue[0][0], host)
+                for host, queue in waiting.items()
+                if queue and (host is None or busy[host] < per_host_limit)
+            ]
+            if not ready:
+                fetch_slots.release()
+                await asyncio.wait(set(running), return_when=asyncio.FIRST_COMPLETED)
                 continue
-            prompt_id, use_pure = target
 
+            _, host = min(ready)
+            _, (entry_count, (entry, duplicates)) = waiting[host].popleft()
+            busy[host] += 1
+            task = asyncio.create_task(start(entry_count, entry, duplicates, host))
+            running.add(task)
+            started.append(task)
+            task.add_done_callback(functools.partial(finish, host))
+
+        await asyncio.gather(*started)
+
+    def _group_duplicates(self, entries: list[Entry]) -> list[tuple[Entry, tuple[Entry, ...]]]:
+        """Group entries that link to the same article and would get the same summary, keeping the first as primary."""
+        groups: dict[tuple[str, tuple[object, ...] | int | None], list[Entry]] = {}
+        for entry in entries:
+            target = self.feed_target_map.get(entry.feed_id) if self.use_targets else None
+            # Entries without a target are never merged; they fail individually in _fetch_entry.
+            summary_key = target.summary_key if target else (entry.id if self.use_targets else None)
+            key = (canonicalize_url(entry.url), summary_key)
+            groups.setdefault(key, []).append(entry)
+
+        merged = [(group[0], tuple(group[1:])) for group in groups.values()]
+        self.duplicates_merged = len(entries) - len(merged)
+        if self.duplicates_merged:
+            logger.info("Merged entries linking to the same article", duplicates=self.duplicates_merged)
+            self.metrics.increment(
+                "duplicate_entries_total",
+                amount=self.duplicates_merged,
+                description="Number of entries that reused another entry's fetch and summary.",
+            )
+        return merged
+
+    async def _load_article_text(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        entry: Entry,
+        target: FeedTarget,
+        log_context: dict[str, object],
+        fetch_executor: ThreadPoolExecutor,
+        entry_span: Any,
+    ) -> str:
+        if target.content_source != "web":
             try:
-                article_text = await loop.run_in_executor(
+                feed_text = await loop.run_in_executor(
                     fetch_executor,
-                    self.downloader.fetch_content,
-                    entry.url,
-                    log_context,
-                    use_pure,
+                    tracing.bind_context(self.downloader.extract_feed_content, entry.content, entry.url, log_context),
                 )
+            except ArticleFetchError:
+                if target.content_source == "feed":
+                    raise
+                feed_text = None
+
+            if feed_text is not None and (
+                target.content_source == "feed" or looks_complete(feed_text, target.min_feed_content_length)
+            ):
+                self._record_article_source("feed")
+                return feed_text
+
+            logger.debug("Feed content looks incomplete; fetching the page", **log_context)
+
+        await self._wait_for_dependency()
+        try:
+            with self.metrics.time_stage("fetch"):
+                article_text = await self._fetch_page(loop, entry, target, log_context, fetch_executor, entry_span)
+        except HostUnavailableError:
+            raise
+        except ArticleTransportError:
+            self._record_scraping_outcome(entry, failed=True)
+            raise
+        except ArticleFetchError:
+            # The page was reached, so the network and pure.md are working even if the article was unusable.
+            self._record_scraping_outcome(entry, failed=False)
+            raise
+        self._record_scraping_outcome(entry, failed=False)
+        self._record_article_source("web")
+        return article_text
+
+    def _record_scraping_outcome(self, entry: Entry, failed: bool) -> None:
+        """Count transport failures once per article host, so a single unreachable host cannot pause all fetches."""
+        if not failed:
+            self.transport_failed_hosts.clear()
+            self._record_dependency_outcome(failed=False)
+            return
+
+        host = self.downloader.request_host(entry.url, use_pure=False)
+        probing = self.health is not None and self.health.probing
+        if host in self.transport_failed_hosts and not probing:
+            return
+        self.transport_failed_hosts.add(host)
+        self._record_dependency_outcome(failed=True)
+
+    async def _fetch_page(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        entry: Entry,
+        target: FeedTarget,
+        log_context: dict[str, object],
+        fetch_executor: ThreadPoolExecutor,
+        entry_span: Any,
+    ) -> str:
+        """Fetch the article page with the configured strategy for combining direct fetches and pure.md."""
+        primary = "pure" if self.downloader.uses_pure(entry.url, target.use_pure) else "direct"
+        if self.strategy == "single":
+            if primary == "pure" and not await self._reserve_pure_request(entry, target, log_context):
+                primary = "direct"
+            return await self._fetch_with(primary, loop, entry, target, log_context, fetch_executor, entry_span)
+
+        methods = [primary, "direct" if primary == "pure" else "pure"]
+        article_host = self.downloader.request_host(entry.url, use_pure=False)
+        preferred = self.fetch_methods.preferred(article_host) if self.fetch_methods is not None else None
+        if preferred in methods:
+            methods.sort(key=lambda method: method != preferred)
+        attempts = [
+            functools.partial(self._attempt, method, loop, entry, target, log_context, fetch_executor, entry_span)
+            for method in methods
+        ]
+
+        if self.strategy == "race" and preferred is None:
+            method, article_text = await self._race(attempts)
+        else:
+            method, article_text = await self._fall_back(attempts, log_context)
+
+        if self.fetch_methods is not None:
+            self.fetch_methods.record_success(article_host, method)
+        self.metrics.increment(
+            "fetch_method_wins_total",
+            description="Number of article pages by the fetch method that produced their text.",
+            method=method,
+            strategy=self.strategy,
+        )
+        return article_text
+
+    async def _attempt(
+        self,
+        method: str,
+        loop: asyncio.AbstractEventLoop,
+        entry: Entry,
+        target: FeedTarget,
+        log_context: dict[str, object],
+        fetch_executor: ThreadPoolExecutor,
+        entry_span: Any,
+    ) -> tuple[str, str]:
+        if method == "pure" and not await self._reserve_pure_request(entry, target, log_context):
+            raise ArticleFetchError(f"pure.md rate limit reached for {entry.url}")
+        return method, await self._fetch_with(method, loop, entry, target, log_context, fetch_executor, entry_span)
+
+    async def _reserve_pure_request(self, entry: Entry, target: FeedTarget, log_context: dict[str, object]) -> bool:
+        """Reserve a pure.md request, giving up the entry's fetch slot while a forced request waits for a token."""
+        if not target.use_pure or self.fetch_slots is None:
+            return await self.downloader.reserve_pure_request(entry.url, target.use_pure, log_context)
+
+        self.fetch_slots.release()
+        try:
+            return await self.downloader.reserve_pure_request(entry.url, True, log_context)
+        finally:
+            await self.fetch_slots.acquire()
+
+    async def _fall_back(
+        self,
+        attempts: Sequence[Callable[[], Awaitable[tuple[str, str]]]],
+        log_context: dict[str, object],
+    ) -> tuple[str, str]:
+        """Try each fetch method in turn until one produces article text."""
+        errors: list[ArticleFetchError] = []
+        for attempt in attempts:
+            try:
+                return await attempt()
             except ArticleFetchError as e:
-                logger.error(
-                    "Action failed after all retries for entry",
-                    **log_context,
-                    error_type=type(e).__name__,
-                    error=str(e),
+                logger.info("Fetch method failed; trying the next one", **log_context, error=str(e))
+                errors.append(e)
+        raise errors[-1]
+
+    async def _race(self, attempts: Sequence[Callable[[], Awaitable[tuple[str, str]]]]) -> tuple[str, str]:
+        """Run all fetch methods concurrently, keep the first article text and cancel the others."""
+        tasks = [asyncio.ensure_future(attempt()) for attempt in attempts]
+        errors: list[ArticleFetchError] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done
+                except ArticleFetchError as e:
+                    errors.append(e)
+            raise errors[-1]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_with(
+        self,
+        method: str,
+        loop: asyncio.AbstractEventLoop,
+        entry: Entry,
+        target: FeedTarget,
+        log_context: dict[str, object],
+        fetch_executor: ThreadPoolExecutor,
+        entry_span: Any,
+    ) -> str:
+        use_pure = method == "pure"
+        host = self.downloader.request_host(entry.url, use_pure=use_pure)
+        async with self._host_slot(host) as timeout:
+            with tracing.span("fetch", parent=entry_span, url=entry.url, method=method):
+                return await loop.run_in_executor(
+                    fetch_executor,
+                    tracing.bind_context(
+                        self.downloader.fetch_content,
+                        entry.url,
+                        log_context,
+                        target.use_pure,
+                        timeout,
+                        use_pure,
+                    ),
                 )
-                self._record_failure()
-                continue
 
-            logger.debug(
-                "Fetched article text for summarization",
+    @asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[float]:
+        """Enter a fetch slot on the host, giving up the entry's global fetch slot while the host is busy.
+
+        Entries that may be summarized from their feed content are started regardless of their host,
+        so they can find it busy once they turn out to need a download.
+        """
+        fetch_slots = self.fetch_slots
+        if fetch_slots is None or not self.host_scheduler.is_busy(host):
+            async with self.host_scheduler.slot(host) as timeout:
+                yield timeout
+            return
+
+        fetch_slots.release()
+        reacquired = False
+        try:
+            async with self.host_scheduler.slot(host) as timeout:
+                await fetch_slots.acquire()
+                reacquired = True
+                yield timeout
+        finally:
+            if not reacquired:
+                await fetch_slots.acquire()
+
+    def _record_article_source(self, source: str) -> None:
+        self.metrics.increment(
+            "article_sources_total",
+            description="Number of articles by where their text was taken from.",
+            source=source,
+        )
+
+    def _admit(self, queued_summaries: int) -> bool:
+        """Return whether new entries may still start; once the deadline is reached, later entries are deferred too."""
+        if self.deadline_reached:
+            return False
+        if self.deadline is None or self.deadline.admits(queued_summaries):
+            return True
+
+        self.deadline_reached = True
+        logger.warning(
+            "Run deadline would be exceeded; deferring remaining entries to the next run",
+            queued_summaries=queued_summaries,
+        )
+        return False
+
+    def _defer(self, entries: tuple[Entry, ...], log_context: dict[str, object]) -> None:
+        self.deferred += len(entries)
+        self.metrics.increment(
+            "entries_total", len(entries), description="Number of entries by outcome.", outcome="deferred"
+        )
+        logger.debug("Deferred entry to the next run", **log_context)
+
+    def _request_host(self, entry: Entry) -> str | None:
+        """Return the host the entry's page is fetched from, or None unless the entry always needs a download."""
+        target = self.feed_target_map.get(entry.feed_id) if self.use_targets else None
+        if target is not None and target.content_source != "web":
+            return None
+        return self.downloader.request_host(entry.url, force_use_pure=bool(target and target.use_pure))
+
+    async def _fetch_entry(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        entry: Entry,
+        duplicates: tuple[Entry, ...],
+        entry_count: int,
+        host: str | None,
+        in_queue: asyncio.PriorityQueue[PrioritizedItem],
+        fetch_executor: ThreadPoolExecutor,
+    ) -> None:
+        if self.abort_event.is_set():
+            return
+
+        log_context: dict[str, object] = {
+            "miniflux_entry_id": entry.id,
+            "miniflux_feed_id": entry.feed_id,
+            "processor_id": f"{entry_count}/{self.total_considered_entries}",
+        }
+        if duplicates:
+            log_context["duplicate_entry_ids"] = [duplicate.id for duplicate in duplicates]
+
+        target = self._resolve_target(entry, log_context)
+        if not target:
+            self._record_failure()
+            return
+
+        if not self._admit(in_queue.qsize()):
+            self._defer((entry, *duplicates), log_context)
+            return
+
+        logger.debug("Processing entry", **log_context, host=host)
+        entry_span = tracing.start_entry_span(log_context, url=entry.url)
+
+        try:
+            article_text = await self._load_article_text(loop, entry, target, log_context, fetch_executor, entry_span)
+        except HostUnavailableError as e:
+            logger.warning("Deferring entry because its host is unavailable", **log_context, error=str(e))
+            self._defer((entry, *duplicates), log_context)
+            tracing.end_span(entry_span, error=e)
+            return
+        except ArticleFetchError as e:
+            logger.error(
+                "Action failed after all retries for entry",
                 **log_context,
-                text_length=len(article_text),
-                preview=format_log_preview(article_text),
+                error_type=type(e).__name__,
+                error=str(e),
             )
+            for _ in (entry, *duplicates):
+                self._record_failure()
+            tracing.end_span(entry_span, error=e)
+            return
+
+        if self.journal is not None:
+            for fetched_entry in (entry, *duplicates):
+                self.journal.record_fetched(fetched_entry.id)
 
-            await in_queue.put(
+        logger.debug(
+            "Fetched article text for summarization",
+            **log_context,
+            text_length=len(article_text),
+            preview=format_log_preview(article_text),
+        )
+
+        await in_queue.put(
+            PrioritizedItem(
+                entry_count,
                 InQueueItem(
                     entry=entry,
-                    prompt_id=prompt_id,
+                    prompt_id=target.prompt_id,
                     article_text=article_text,
                     log_context=log_context,
-                )
+                    llm_endpoint_id=target.llm_endpoint_id,
+                    span=entry_span,
+                    duplicates=duplicates,
+                ),
             )
-
-        for _ in range(llm_concurrency):
-            await in_queue.put(None)
+        )
+        self.metrics.observe_queue_depth("in", in_queue.qsize())
@@ -0,0 +1,93 @@
+"""Host-aware admission control for article fetches."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from minigist.constants import (
+    HOST_LATENCY_WINDOW_SIZE,
+    HOST_TIMEOUT_LATENCY_MULTIPLIER,
+    HOST_TIMEOUT_MIN_SAMPLES,
+    MIN_ADAPTIVE_SCRAPE_TIMEOUT_SECONDS,
+)
+from minigist.latency import LatencyTracker
+from minigist.metrics import PipelineMetrics
+
+
+@dataclass
+class _HostState:
+    semaphore: asyncio.Semaphore
+    politeness_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_started_at: float | None = None
+    latencies: LatencyTracker = field(default_factory=lambda: LatencyTracker(HOST_LATENCY_WINDOW_SIZE))
+
+
+class HostScheduler:
+    """Limit concurrent fetches per host, space them out, and adapt per-host timeouts."""
+
+    def __init__(
+        self,
+        per_host_concurrency: int,
+        per_host_delay_seconds: float,
+        timeout_seconds: float,
+        metrics: PipelineMetrics | None = None,
+    ):
+        """Initialize the scheduler with per-host limits and the configured fetch timeout."""
+        self.metrics = metrics or PipelineMetrics()
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_delay_seconds = per_host_delay_seconds
+        self.timeout_seconds = timeout_seconds
+        self._hosts: dict[str, _HostState] = {}
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(semaphore=asyncio.Semaphore(self.per_host_concurrency))
+        return state
+
+    def is_busy(self, host: str) -> bool:
+        """Return whether all fetch slots of the host are taken."""
+        state = self._hosts.get(host)
+        return state is not None and state.semaphore.locked()
+
+    def timeout_for(self, host: str) -> float:
+        """Return the fetch timeout for a host based on its observed latency."""
+        state = self._hosts.get(host)
+        if state is None or len(state.latencies) < HOST_TIMEOUT_MIN_SAMPLES:
+            return self.timeout_seconds
+
+        p95 = state.latencies.percentile(0.95)
+        if p95 is None:
+            return self.timeout_seconds
+
+        adapted = p95 * HOST_TIMEOUT_LATENCY_MULTIPLIER
+        return min(self.timeout_seconds, max(MIN_ADAPTIVE_SCRAPE_TIMEOUT_SECONDS, adapted))
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[float]:
+        """Wait for a fetch slot on the host and yield the timeout to use for the fetch."""
+        state = self._state(host)
+        waiting_since = time.monotonic()
+        async with state.semaphore:
+            async with state.politeness_lock:
+                if state.last_started_at is not None:
+                    delay = state.last_started_at + self.per_host_delay_seconds - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                state.last_started_at = time.monotonic()
+            self.metrics.observe_stage("host_wait", time.monotonic() - waiting_since)
+
+            timeout = self.timeout_for(host)
+            started_at = time.monotonic()
+            cancelled = False
+            try:
+                yield timeout
+            except asyncio.CancelledError:
+                # A cancelled fetch, such as the loser of a race, says nothing about the host's latency.
+                cancelled = True
+                raise
+            finally:
+                if not cancelled:
+                    state.latencies.record(time.monotonic() - started_at)
@@ -1,13 +1,28 @@
 import asyncio
 from collections.abc import Callable
 
-from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_fixed
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_fixed,
+)
 
+from minigist import tracing
 from minigist.constants import MAX_RETRIES_PER_ENTRY, RETRY_DELAY_SECONDS
-from minigist.exceptions import LLMServiceError
+from minigist.cpu_pool import CPUPool
+from minigist.exceptions import LLMContentRejectedError, LLMServiceError
+from minigist.journal import EntryJournal
+from minigist.logging import get_logger
+from minigist.metrics import PipelineMetrics
+from minigist.near_duplicates import NearDuplicateIndex, prompt_key, simhash
 from minigist.pipeline.base_worker import BaseWorker
-from minigist.pipeline.types import InQueueItem, OutQueueItem
-from minigist.summarizer import Summarizer
+from minigist.pipeline.dependency_health import DependencyHealth
+from minigist.pipeline.types import OutQueueItem, PrioritizedItem
+from minigist.summarizer import Summarizer, SummaryResult
+
+logger = get_logger(__name__)
 
 
 class LLMWorker(BaseWorker):
@@ -17,16 +32,49 @@ class LLMWorker(BaseWorker):
         prompt_lookup: dict[str, str],
         record_failure: Callable[[], None],
         abort_event: asyncio.Event,
+        metrics: PipelineMetrics,
+        journal: EntryJournal | None = None,
+        near_duplicates: NearDuplicateIndex | None = None,
+        health: DependencyHealth | None = None,
+        cpu_pool: CPUPool | None = None,
     ) -> None:
-        super().__init__(record_failure, abort_event)
+        super().__init__(record_failure, abort_event, metrics, journal, health)
         self.summarizer = summarizer
         self.prompt_lookup = prompt_lookup
+        self.near_duplicates = near_duplicates
+        self.cpu_pool = cpu_pool or CPUPool()
+
+    async def _generate_summary_with_retry(
+        self,
+        text: str,
+        prompt_id: str,
+        llm_endpoint_id: str | None,
+        log_context: dict[str, object],
+    ) -> SummaryResult:
+        await self._wait_for_dependency()
+        try:
+            result = await self._retry_generate_summary(text, prompt_id, llm_endpoint_id, log_context)
+        except LLMContentRejectedError:
+            # The service is reachable; only this article could not be summarized.
+            self._record_dependency_outcome(failed=False)
+            raise
+        except LLMServiceError:
+            self._record_dependency_outcome(failed=True)
+            raise
+        self._record_dependency_outcome(failed=False)
+        return result
 
-    async def _generate_summary_with_retry(self, text: str, prompt_id: str, log_context: dict[str, object]) -> str:
+    async def _retry_generate_summary(
+        self,
+        text: str,
+        prompt_id: str,
+        llm_endpoint_id: str | None,
+        log_context: dict[str, object],
+    ) -> SummaryResult:
         retryer = AsyncRetrying(
             stop=stop_after_attempt(MAX_RETRIES_PER_ENTRY),
             wait=wait_fixed(RETRY_DELAY_SECONDS),
-            retry=retry_if_exception_type(LLMServiceError),
+            retry=retry_if_exception_type(LLMServiceError) & retry_if_not_exception_type(LLMContentRejectedError),
             before_sleep=lambda rs: self._log_retry_attempt(rs, "generate_summary", log_context),
             reraise=True,
         )
@@ -34,22 +82,58 @@ class LLMWorker(BaseWorker):
         async for attempt in retryer:
             with attempt:
                 prompt = self.prompt_lookup[prompt_id]
-                return await self.summarizer.generate_summary(text, prompt, log_context=log_context)
+                return await self.summarizer.generate_summary(
+                    text,
+                    prompt,
+                    log_context=log_context,
+                    endpoint_id=llm_endpoint_id,
+                )
 
         raise RuntimeError("Async retry loop exited unexpectedly")
 
+    async def _summarize(
+        self,
+        text: str,
+        prompt_id: str,
+        llm_endpoint_id: str | None,
+        log_context: dict[str, object],
+    ) -> SummaryResult:
+        """Reuse the summary of a near-identical article if one is known, otherwise call the LLM."""
+        if self.near_duplicates is None:
+            return await self._generate_summary_with_retry(text, prompt_id, llm_endpoint_id, log_context)
+
+        fingerprint = await self.cpu_pool.run_async(simhash, text)
+        if fingerprint is None:
+            return await self._generate_summary_with_retry(text, prompt_id, llm_endpoint_id, log_context)
+
+        key = prompt_key(self.prompt_lookup[prompt_id])
+        match = self.near_duplicates.lookup(fingerprint, key)
+        self.metrics.increment(
+            "near_duplicate_lookups_total",
+            description="Number of near-duplicate index lookups by outcome.",
+            outcome="hit" if match else "miss",
+        )
+        if match is not None:
+            logger.info("Reusing summary of a near-duplicate article", **log_context, distance=match.distance)
+            return SummaryResult(markdown=match.summary, model=match.model)
+
+        result = await self._generate_summary_with_retry(text, prompt_id, llm_endpoint_id, log_context)
+        self.near_duplicates.add(fingerprint, key, result.markdown, result.model)
+        return result
+
     async def run(
         self,
-        in_queue: asyncio.Queue[InQueueItem | None],
+        in_queue: asyncio.PriorityQueue[PrioritizedItem],
         out_queue: asyncio.Queue[OutQueueItem | None],
     ) -> None:
         while True:
-            item = await in_queue.get()
+            item = (await in_queue.get()).item
             if item is None:
                 in_queue.task_done()
                 break
 
             if self.abort_event.is_set():
+                tracing.end_span(item.span)
                 in_queue.task_done()
                 continue
 
@@ -59,26 +143,44 @@ class LLMWorker(BaseWorker):
             log_context = item.log_context
 
             try:
-                summary = await self._generate_summary_with_retry(article_text, prompt_id, log_context)
+                with self.metrics.time_stage("llm"), tracing.span("llm", parent=item.span, prompt_id=prompt_id):
+                    result = await self._summarize(
+                        article_text,
+                        prompt_id,
+                        item.llm_endpoint_id,
+                        log_context,
+                    )
+                prompt_hash = prompt_key(self.prompt_lookup[prompt_id])
+                if self.journal is not None:
+                    for summarized_entry in item.entries:
+                        self.journal.record_summarized(summarized_entry.id, result.markdown, result.model, prompt_hash)
                 await out_queue.put(
                     OutQueueItem(
                         entry=entry,
-                        summary=summary,
+                        summary=result.markdown,
                         log_context=log_context,
                         error=None,
+                        model=result.model,
+                        prompt_hash=prompt_hash,
+                        span=item.span,
+                        duplicates=item.duplicates,
                     )
                 )
             except Exception as e:
-                self._record_failure()
+                for _ in item.entries:
+                    self._record_failure()
                 await out_queue.put(
                     OutQueueItem(
                         entry=entry,
                         summary=None,
                         log_context=log_context,
                         error=e,
+                        span=item.span,
+                        duplicates=item.duplicates,
                     )
                 )
             finally:
+                self.metrics.observe_queue_depth("out", out_queue.qsize())
                 in_queue.task_done()
 
         await out_queue.put(None)
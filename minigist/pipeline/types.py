@@ -1,7 +1,27 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, Literal
 
+from minigist.constants import DEFAULT_MIN_FEED_CONTENT_LENGTH, DEFAULT_TARGET_WEIGHT
 from minigist.models import Entry
 
+ContentSource = Literal["feed", "web", "auto"]
+FetchStrategy = Literal["single", "fallback", "race"]
+
+
+@dataclass(frozen=True)
+class FeedTarget:
+    prompt_id: str
+    use_pure: bool
+    llm_endpoint_id: str | None = None
+    content_source: ContentSource = "web"
+    min_feed_content_length: int = DEFAULT_MIN_FEED_CONTENT_LENGTH
+    weight: float = DEFAULT_TARGET_WEIGHT
+
+    @property
+    def summary_key(self) -> tuple[object, ...]:
+        """Return the settings that shape an article's summary; scheduling settings such as the weight do not."""
+        return (self.prompt_id, self.llm_endpoint_id, self.use_pure, self.content_source, self.min_feed_content_length)
+
 
 @dataclass(frozen=True)
 class InQueueItem:
@@ -9,6 +29,13 @@ class InQueueItem:
     prompt_id: str
     article_text: str
     log_context: dict[str, object]
+    llm_endpoint_id: str | None = None
+    span: Any = None
+    duplicates: tuple[Entry, ...] = ()
+
+    @property
+    def entries(self) -> tuple[Entry, ...]:
+        return (self.entry, *self.duplicates)
 
 
 @dataclass(frozen=True)
@@ -17,3 +44,19 @@ class OutQueueItem:
     summary: str | None
     log_context: dict[str, object]
     error: Exception | None
+    model: str | None = None
+    prompt_hash: str | None = None
+    span: Any = None
+    duplicates: tuple[Entry, ...] = ()
+
+    @property
+    def entries(self) -> tuple[Entry, ...]:
+        return (self.entry, *self.duplicates)
+
+
+@dataclass(frozen=True, order=True)
+class PrioritizedItem:
+    """Queue slot ordered by priority only; lower values are processed first."""
+
+    priority: float
+    item: InQueueItem | None = field(default=None, compare=False)
@@ -2,23 +2,42 @@
 
 import asyncio
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
-import markdown
-import nh3
-
-from minigist.constants import MARKDOWN_CONTENT_WITH_WATERMARK
+from minigist import tracing
+from minigist.constants import MARKDOWN_CONTENT_WITH_WATERMARK, WATERMARK_URL
+from minigist.cpu_pool import CPUPool
 from minigist.exceptions import MinifluxApiError
+from minigist.journal import EntryJournal
 from minigist.logging import format_log_preview, get_logger
+from minigist.marker import SummaryMarker
+from minigist.metrics import PipelineMetrics
 from minigist.miniflux_client import MinifluxClient
 from minigist.models import Entry
 from minigist.pipeline.base_worker import BaseWorker
+from minigist.pipeline.dependency_health import DependencyHealth
 from minigist.pipeline.types import OutQueueItem
 from minigist.processing_counts import ProcessingCounts
 
 logger = get_logger(__name__)
 
 
+def render_entry_content(summary: str, original_content: str, marker: SummaryMarker | None = None) -> str:
+    """Render the updated, sanitized HTML content of an entry from its summary and original content.
+
+    The marker goes into the watermark link, which survives sanitizing by nh3 and by Miniflux.
+    """
+    import markdown
+    import nh3
+
+    formatted_content = MARKDOWN_CONTENT_WITH_WATERMARK.format(
+        summary_content=summary,
+        watermark_url=marker.render() if marker is not None else WATERMARK_URL,
+        original_article_content=original_content,
+    )
+    return nh3.clean(markdown.markdown(formatted_content))
+
+
 class UpdateWorker(BaseWorker):
     """Update Miniflux entries after summarization."""
 
@@ -27,29 +46,27 @@ class UpdateWorker(BaseWorker):
         miniflux_client: MinifluxClient,
         record_failure: Callable[[], None],
         abort_event: asyncio.Event,
+        metrics: PipelineMetrics,
+        journal: EntryJournal | None = None,
+        health: DependencyHealth | None = None,
+        cpu_pool: CPUPool | None = None,
     ) -> None:
         """Initialize the update worker."""
-        super().__init__(record_failure, abort_event)
+        super().__init__(record_failure, abort_event, metrics, journal, health)
         self.miniflux_client = miniflux_client
-
-    def _render_entry_content(self, entry: Entry, summary: str) -> str:
-        """Render the updated HTML content for a summarized entry."""
-        formatted_content = MARKDOWN_CONTENT_WITH_WATERMARK.format(
-            summary_content=summary, original_article_content=entry.content
-        )
-        new_html_content_for_miniflux = markdown.markdown(formatted_content)
-        return nh3.clean(new_html_content_for_miniflux)
+        self.cpu_pool = cpu_pool or CPUPool()
 
     async def run(
         self,
-        loop: asyncio.AbstractEventLoop,
         out_queue: asyncio.Queue[OutQueueItem | None],
-        update_executor: ThreadPoolExecutor,
         llm_concurrency: int,
+        update_concurrency: int,
         counts: ProcessingCounts,
     ) -> None:
-        """Consume summaries from the queue and update Miniflux entries."""
+        """Consume summaries from the queue and update Miniflux entries concurrently."""
         worker_sentinels = 0
+        semaphore = asyncio.Semaphore(update_concurrency)
+        started: list[asyncio.Task[None]] = []
 
         while worker_sentinels < llm_concurrency:
             item = await out_queue.get()
@@ -58,9 +75,25 @@ class UpdateWorker(BaseWorker):
                 out_queue.task_done()
                 continue
 
-            if self.abort_event.is_set():
-                out_queue.task_done()
-                continue
+            await semaphore.acquire()
+            task = asyncio.create_task(self._process_item(item, out_queue, counts))
+            task.add_done_callback(lambda _: semaphore.release())
+            started.append(task)
+
+        await asyncio.gather(*started)
+
+    async def _process_item(
+        self,
+        item: OutQueueItem,
+        out_queue: asyncio.Queue[OutQueueItem | None],
+        counts: ProcessingCounts,
+    ) -> None:
+        """Render and upload a summarized entry and every duplicate that shares its summary."""
+        try:
+            # Summaries that were already generated are still written back unless Miniflux itself is down.
+            if self.abort_event.is_set() and (self.health is None or self.health.is_down):
+                tracing.end_span(item.span)
+                return
 
             entry = item.entry
             summary = item.summary
@@ -74,8 +107,8 @@ class UpdateWorker(BaseWorker):
                     error_type=type(error).__name__ if error else "Unknown",
                     error=str(error) if error else "Unknown error",
                 )
-                out_queue.task_done()
-                continue
+                tracing.end_span(item.span, error=error)
+                return
 
             logger.debug(
                 "Generated summary",
@@ -84,25 +117,71 @@ class UpdateWorker(BaseWorker):
                 preview=format_log_preview(summary),
             )
 
-            sanitized_html_content = self._render_entry_content(entry, summary)
-
-            try:
-                await loop.run_in_executor(
-                    update_executor,
-                    self.miniflux_client.update_entry,
-                    entry.id,
-                    sanitized_html_content,
-                    log_context,
-                )
-                counts.increment_processed()
-                logger.info("Successfully processed entry", **log_context)
-            except MinifluxApiError as e:
-                logger.error(
-                    "Action failed after all retries for entry",
-                    **log_context,
-                    error_type=type(e).__name__,
-                    error=str(e),
-                )
-                self._record_failure()
-            finally:
-                out_queue.task_done()
+            marker = SummaryMarker(item.prompt_hash, item.model) if item.prompt_hash else None
+            update_error: Exception | None = None
+            for target_entry in item.entries:
+                entry_log_context = log_context
+                if target_entry is not entry:
+                    entry_log_context = {
+                        **log_context,
+                        "miniflux_entry_id": target_entry.id,
+                        "miniflux_feed_id": target_entry.feed_id,
+                        "duplicate_of": entry.id,
+                    }
+                try:
+                    entry_error = await self._update_entry(
+                        target_entry, summary, marker, entry_log_context, item.span, counts
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Unexpected error while updating entry",
+                        **entry_log_context,
+                        error_type=type(e).__name__,
+                        error=str(e),
+                    )
+                    self._record_failure()
+                    entry_error = e
+                update_error = update_error or entry_error
+            tracing.end_span(item.span, error=update_error)
+        finally:
+            out_queue.task_done()
+
+    async def _update_entry(
+        self,
+        entry: Entry,
+        summary: str,
+        marker: SummaryMarker | None,
+        log_context: dict[str, object],
+        span: Any,
+        counts: ProcessingCounts,
+    ) -> Exception | None:
+        """Render the summary into a single entry and upload it, returning the error if the update failed."""
+        with self.metrics.time_stage("render"), tracing.span("render", parent=span):
+            sanitized_html_content = await self.cpu_pool.run_async(render_entry_content, summary, entry.content, marker)
+
+        await self._wait_for_dependency()
+        try:
+            with self.metrics.time_stage("update"), tracing.span("update", parent=span):
+                await self.miniflux_client.update_entry(entry.id, sanitized_html_content, log_context)
+        except MinifluxApiError as e:
+            self._record_dependency_outcome(failed=True)
+            logger.error(
+                "Action failed after all retries for entry",
+                **log_context,
+                error_type=type(e).__name__,
+                error=str(e),
+            )
+            self._record_failure()
+            return e
+
+        self._record_dependency_outcome(failed=False)
+        if self.journal is not None:
+            self.journal.record_updated(entry.id)
+        counts.increment_processed(entry.id)
+        self.metrics.increment(
+            "entries_total",
+            description="Number of entries by outcome.",
+            outcome="processed",
+        )
+        logger.info("Successfully processed entry", **log_context)
+        return None
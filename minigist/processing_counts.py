@@ -1,6 +1,6 @@
 """Shared processing counters for pipeline workers."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -9,11 +9,13 @@ class ProcessingCounts:
 
     processed: int = 0
     failed: int = 0
+    processed_entry_ids: set[int] = field(default_factory=set)
 
-    def increment_processed(self) -> None:
+    def increment_processed(self, entry_id: int) -> None:
         """Increment the processed entry count."""
 
         self.processed += 1
+        self.processed_entry_ids.add(entry_id)
 
     def increment_failed(self) -> None:
         """Increment the failed entry count."""
@@ -1,30 +1,72 @@
 import asyncio
+import time
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 
+from . import tracing
 from .config import AppConfig
-from .constants import FAILED_ENTRIES_ABORT_THRESHOLD, WATERMARK_DETECTOR
+from .constants import DEFAULT_TARGET_WEIGHT
+from .cpu_pool import CPUPool
+from .deadline import RunDeadline
 from .downloader import Downloader
-from .exceptions import ConfigError, MinifluxApiError, TooManyFailuresError
+from .exceptions import ConfigError, DependencyUnavailableError, MinifluxApiError
+from .fetch_methods import FetchMethodMemory
+from .journal import EntryJournal
+from .leases import LeaseBackend, SQLiteLeaseBackend, new_lease_owner
 from .logging import get_logger
+from .marker import is_summarized, parse_marker
+from .metrics import PipelineMetrics
 from .miniflux_client import MinifluxClient
 from .models import Entry, ProcessingStats
-from .pipeline import FetchWorker, LLMWorker, UpdateWorker
+from .near_duplicates import NearDuplicateIndex, prompt_key
+from .pipeline import DependencyHealth, FeedTarget, FetchWorker, HostScheduler, LLMWorker, OutQueueItem, UpdateWorker
 from .processing_counts import ProcessingCounts
+from .scheduling import prioritize_entries
+from .strip import split_summary
 from .summarizer import Summarizer
 
 logger = get_logger(__name__)
 
 
 class Processor:
-    def __init__(self, config: AppConfig, dry_run: bool = False):
+    def __init__(
+        self,
+        config: AppConfig,
+        dry_run: bool = False,
+        slow_callback_seconds: float | None = None,
+        max_duration_seconds: float | None = None,
+        refresh: bool = False,
+        include_unmarked: bool = False,
+    ):
         self.config = config
-        self.client = MinifluxClient(config.miniflux, dry_run=dry_run)
-        self.summarizer = Summarizer(config.llm)
-        self.downloader = Downloader(config.scraping)
+        self.refresh = refresh
+        self.include_unmarked = include_unmarked
+        self.slow_callback_seconds = slow_callback_seconds
+        self.max_duration_seconds = max_duration_seconds or config.run.max_duration_seconds
+        self.started_at = time.monotonic()
+        self.metrics = PipelineMetrics()
+        self.client = MinifluxClient(config.miniflux, dry_run=dry_run, metrics=self.metrics)
+        self.summarizer = Summarizer(config.llm, metrics=self.metrics)
+        self.cpu_pool = CPUPool(config.run.cpu_workers)
+        self.downloader = Downloader(config.scraping, metrics=self.metrics, cpu_pool=self.cpu_pool)
         self.dry_run = dry_run
+        self.journal = self._open_journal()
+        self.lease_owner = new_lease_owner()
+        self.leases = self._open_leases()
+        self.unclaimed_count = 0
+        self.near_duplicates = (
+            NearDuplicateIndex(config.near_duplicates.path, config.near_duplicates.max_distance)
+            if config.near_duplicates.enabled
+            else None
+        )
+        self.fetch_methods = (
+            FetchMethodMemory(config.scraping.strategy_state_path) if config.scraping.strategy != "single" else None
+        )
+        self.resumed_count = 0
+        self.duplicates_merged = 0
+        self.deferred_count = 0
         self.prompt_lookup = {prompt.id: prompt.prompt for prompt in config.prompts}
-        self.feed_target_map: dict[int, tuple[str, bool]] = {}
+        self.feed_target_map: dict[int, FeedTarget] = {}
         self.use_targets = bool(config.targets)
         default_prompt_id = config.default_prompt_id or (config.prompts[0].id if config.prompts else None)
         if default_prompt_id is None or default_prompt_id not in self.prompt_lookup:
@@ -34,6 +76,7 @@ class Processor:
             )
             raise ConfigError("A valid default prompt must be configured")
         self.default_prompt_id = default_prompt_id
+        tracing.configure_tracing(config.tracing)
 
     def __enter__(self) -> "Processor":
         """Return the processor for context manager usage."""
@@ -42,10 +85,116 @@ class Processor:
     def __exit__(self, exc_type, exc, exc_tb) -> bool:
         """Close managed resources when exiting a context."""
         self.downloader.close()
+        if self.journal is not None:
+            self.journal.close()
+        if self.near_duplicates is not None:
+            self.near_duplicates.close()
+        if self.fetch_methods is not None:
+            self.fetch_methods.close()
+        if self.leases is not None:
+            self.leases.close()
+        self.cpu_pool.close()
+        tracing.shutdown_tracing()
         return False
 
+    def _open_journal(self) -> EntryJournal | None:
+        if not self.config.journal.enabled:
+            return None
+        if self.dry_run:
+            logger.info("Checkpoint journal is disabled in dry run mode")
+            return None
+        return EntryJournal(self.config.journal.path)
+
+    def _open_leases(self) -> LeaseBackend | None:
+        if not self.config.coordination.enabled:
+            return None
+        if self.dry_run:
+            logger.info("Entry leases are disabled in dry-run mode")
+            return None
+        return SQLiteLeaseBackend(self.config.coordination.path)
+
+    async def _claim_entries(self, entries: list[Entry]) -> list[Entry]:
+        """Keep only the entries this instance could lease, in their original order."""
+        if self.leases is None:
+            return entries
+
+        coordination = self.config.coordination
+        claimed_ids = set(
+            await asyncio.to_thread(
+                self.leases.claim,
+                [entry.id for entry in entries],
+                self.lease_owner,
+                coordination.lease_seconds,
+                coordination.batch_size,
+            )
+        )
+        claimed = [entry for entry in entries if entry.id in claimed_ids]
+        self.unclaimed_count = len(entries) - len(claimed)
+        logger.info(
+            "Leased entries for this instance",
+            owner=self.lease_owner,
+            claimed=len(claimed),
+            left_for_other_instances=self.unclaimed_count,
+        )
+        return claimed
+
+    async def _renew_leases(self, leases: LeaseBackend) -> None:
+        lease_seconds = self.config.coordination.lease_seconds
+        while True:
+            await asyncio.sleep(lease_seconds / 3)
+            await asyncio.to_thread(leases.renew, self.lease_owner, lease_seconds)
+
+    def _split_resumable_entries(self, entries: list[Entry]) -> tuple[list[OutQueueItem], list[Entry]]:
+        """Separate entries with a journaled summary from entries that still need the full pipeline."""
+        if self.journal is None:
+            return [], entries
+
+        pruned = self.journal.prune()
+        pending_summaries = self.journal.pending_summaries()
+        logger.debug("Loaded checkpoint journal", pending_summaries=len(pending_summaries), pruned_events=pruned)
+
+        resumed: list[OutQueueItem] = []
+        remaining: list[Entry] = []
+        for entry in entries:
+            journaled = pending_summaries.get(entry.id)
+            if journaled is None:
+                remaining.append(entry)
+                continue
+            if journaled.prompt_hash != self._prompt_hash_for(entry):
+                logger.debug(
+                    "Discarding journaled summary from a different prompt",
+                    miniflux_entry_id=entry.id,
+                    journaled_prompt_hash=journaled.prompt_hash,
+                )
+                remaining.append(entry)
+                continue
+
+            log_context: dict[str, object] = {
+                "miniflux_entry_id": entry.id,
+                "miniflux_feed_id": entry.feed_id,
+                "processor_id": "journal",
+            }
+            resumed.append(
+                OutQueueItem(
+                    entry=entry,
+                    summary=journaled.summary,
+                    log_context=log_context,
+                    error=None,
+                    model=journaled.model,
+                    prompt_hash=journaled.prompt_hash,
+                    span=tracing.start_entry_span(log_context, url=entry.url, resumed=True),
+                )
+            )
+
+        if resumed:
+            logger.info("Resuming journaled summaries from a previous run", count=len(resumed))
+        return resumed, remaining
+
     def _filter_unsummarized_entries(self, entries: list[Entry]) -> list[Entry]:
-        unsummarized = [entry for entry in entries if WATERMARK_DETECTOR not in entry.content]
+        if self.refresh:
+            return self._filter_stale_entries(entries)
+
+        unsummarized = [entry for entry in entries if not is_summarized(entry.content)]
         logger.debug(
             "Filtered entries for summarization",
             total_entries=len(entries),
@@ -54,9 +203,45 @@ class Processor:
         )
         return unsummarized
 
-    def _build_feed_target_map(self) -> dict[int, tuple[str, bool]]:
+    def _filter_stale_entries(self, entries: list[Entry]) -> list[Entry]:
+        """Return summarized entries whose summary came from another prompt, with the summary removed again."""
+        stale: list[Entry] = []
+        for entry in entries:
+            if not is_summarized(entry.content):
+                continue
+
+            marker = parse_marker(entry.content)
+            if marker is None and not self.include_unmarked:
+                continue
+            if marker is not None and marker.prompt_hash == self._prompt_hash_for(entry):
+                continue
+
+            original_content = split_summary(entry.content)
+            if original_content is None:
+                logger.warning(
+                    "Cannot find the original content after the summary; skipping entry",
+                    miniflux_entry_id=entry.id,
+                )
+                continue
+            stale.append(entry.model_copy(update={"content": original_content}))
+
+        logger.info("Filtered entries with stale summaries", total_entries=len(entries), stale_count=len(stale))
+        return stale
+
+    def _prompt_hash_for(self, entry: Entry) -> str:
+        target = self._target_for(entry)
+        return prompt_key(self.prompt_lookup[target.prompt_id if target else self.default_prompt_id])
+
+    def _target_for(self, entry: Entry) -> FeedTarget | None:
+        return self.feed_target_map.get(entry.feed_id) if self.use_targets else None
+
+    @staticmethod
+    def _target_weight(target: FeedTarget | None) -> float:
+        return target.weight if target else DEFAULT_TARGET_WEIGHT
+
+    async def _build_feed_target_map(self) -> dict[int, FeedTarget]:
         try:
-            feeds = self.client.get_feeds()
+            feeds = await self.client.get_feeds()
         except MinifluxApiError as e:
             logger.critical("Failed to fetch feeds metadata from Miniflux", error=str(e))
             raise
@@ -69,7 +254,7 @@ class Processor:
             if feed.category and feed.category.id is not None:
                 category_to_feed_ids[feed.category.id].add(feed.id)
 
-        feed_target_map: dict[int, tuple[str, bool]] = {}
+        feed_target_map: dict[int, FeedTarget] = {}
 
         for index, target in enumerate(self.config.targets, start=1):
             if target.prompt_id not in self.prompt_lookup:
@@ -109,7 +294,14 @@ class Processor:
                         target_index=index,
                     )
                     raise ConfigError(f"Feed ID {feed_id} is assigned to multiple targets")
-                feed_target_map[feed_id] = (target.prompt_id, target.use_pure)
+                feed_target_map[feed_id] = FeedTarget(
+                    prompt_id=target.prompt_id,
+                    use_pure=target.use_pure,
+                    llm_endpoint_id=target.llm_endpoint_id,
+                    content_source=target.content_source,
+                    min_feed_content_length=target.min_feed_content_length,
+                    weight=target.weight,
+                )
 
         logger.info(
             "Resolved targets to feeds",
@@ -120,12 +312,20 @@ class Processor:
         return feed_target_map
 
     def run(self) -> ProcessingStats:
+        return asyncio.run(self._run())
+
+    async def _run(self) -> ProcessingStats:
+        self.started_at = time.monotonic()
+        async with self.client:
+            return await self._process()
+
+    async def _process(self) -> ProcessingStats:
         processed_successfully_count = 0
         failed_entries_count = 0
 
         if self.use_targets:
             try:
-                self.feed_target_map = self._build_feed_target_map()
+                self.feed_target_map = await self._build_feed_target_map()
             except (MinifluxApiError, ConfigError) as e:
                 logger.critical("Failed to resolve target mapping", error=str(e))
                 raise
@@ -136,7 +336,7 @@ class Processor:
         effective_feed_ids = list(self.feed_target_map.keys()) if self.use_targets else None
 
         try:
-            all_fetched_entries = self.client.get_entries(effective_feed_ids, self.config.fetch)
+            all_fetched_entries = await self.client.get_entries(effective_feed_ids, self.config.fetch)
         except MinifluxApiError as e:
             logger.critical("Failed to fetch initial entries from Miniflux", error=str(e))
             raise
@@ -155,15 +355,18 @@ class Processor:
         else:
             considered_entries = unsummarized_entries
 
-        total_considered_entries = len(considered_entries)
+        considered_entries = prioritize_entries(considered_entries, self._target_for, self._target_weight)
 
-        skipped_due_to_missing_target = len(unsummarized_entries) - total_considered_entries
+        skipped_due_to_missing_target = len(unsummarized_entries) - len(considered_entries)
         if skipped_due_to_missing_target > 0:
             logger.warning(
                 "Skipping entries without a configured target (this may be a bug)",
                 skipped=skipped_due_to_missing_target,
             )
 
+        considered_entries = await self._claim_entries(considered_entries)
+        total_considered_entries = len(considered_entries)
+
         if total_considered_entries == 0:
             logger.info("All considered entries have already been summarized")
             return ProcessingStats(
@@ -179,20 +382,22 @@ class Processor:
             total_considered=total_considered_entries,
         )
 
-        processed_successfully_count, failed_entries_count, aborted = asyncio.run(
-            self._run_pipeline(considered_entries, total_considered_entries)
+        processed_successfully_count, failed_entries_count, unavailable_dependencies = await self._run_pipeline(
+            considered_entries, total_considered_entries
         )
 
-        if aborted:
+        if unavailable_dependencies:
             logger.critical(
-                "Aborting processing because too many entries failed",
+                "Aborting processing because a critical dependency is unavailable",
+                dependencies=unavailable_dependencies,
                 failed_count=failed_entries_count,
                 attempted_this_run=processed_successfully_count + failed_entries_count,
                 total_considered=total_considered_entries,
             )
-            raise TooManyFailuresError(
+            raise DependencyUnavailableError(
                 f"Processing aborted after {processed_successfully_count + failed_entries_count} "
-                f"of {total_considered_entries} entries attempted, due to {failed_entries_count} failures"
+                f"of {total_considered_entries} entries attempted, "
+                f"because {', '.join(unavailable_dependencies)} is unavailable"
             )
 
         logger.debug(
@@ -205,23 +410,53 @@ class Processor:
             total_considered=total_considered_entries,
             processed_successfully=processed_successfully_count,
             failed_processing=failed_entries_count,
+            hedged_requests=self.summarizer.hedges_issued,
+            hedge_wins=self.summarizer.hedge_wins,
+            resumed_from_journal=self.resumed_count,
+            duplicates_merged=self.duplicates_merged,
+            near_duplicate_lookups=self.near_duplicates.lookups if self.near_duplicates else 0,
+            near_duplicate_hits=self.near_duplicates.hits if self.near_duplicates else 0,
+            deferred=self.deferred_count,
+            unclaimed=self.unclaimed_count,
+        )
+
+    def _build_deadline(self) -> RunDeadline | None:
+        if self.max_duration_seconds is None:
+            return None
+        return RunDeadline(
+            self.max_duration_seconds,
+            self.metrics,
+            llm_concurrency=self.config.llm.concurrency,
+            started_at=self.started_at,
         )
 
     async def _run_pipeline(
         self,
         considered_entries: list[Entry],
         total_considered_entries: int,
-    ) -> tuple[int, int, bool]:
+    ) -> tuple[int, int, list[str]]:
         loop = asyncio.get_running_loop()
-        in_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.llm.concurrency * 2)
+        if self.slow_callback_seconds is not None:
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.slow_callback_seconds
+        in_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=self.config.llm.concurrency * 2)
         out_queue: asyncio.Queue = asyncio.Queue()
         abort_event = asyncio.Event()
         counts = ProcessingCounts()
 
+        resumed_items, pending_entries = self._split_resumable_entries(considered_entries)
+        self.resumed_count = len(resumed_items)
+        for item in resumed_items:
+            out_queue.put_nowait(item)
+
         def record_failure() -> None:
             counts.increment_failed()
-            if counts.failed >= FAILED_ENTRIES_ABORT_THRESHOLD:
-                abort_event.set()
+            self.metrics.increment("entries_total", description="Number of entries by outcome.", outcome="failed")
+
+        # Entry failures alone never abort the run; only a critical dependency that stays down does.
+        scraping_health = DependencyHealth("scraping", critical=False, abort_event=abort_event, metrics=self.metrics)
+        llm_health = DependencyHealth("llm", critical=True, abort_event=abort_event, metrics=self.metrics)
+        miniflux_health = DependencyHealth("miniflux", critical=True, abort_event=abort_event, metrics=self.metrics)
 
         fetch_worker = FetchWorker(
             downloader=self.downloader,
@@ -229,32 +464,57 @@ class Processor:
             use_targets=self.use_targets,
             feed_target_map=self.feed_target_map,
             default_prompt_id=self.default_prompt_id,
+            host_scheduler=HostScheduler(
+                per_host_concurrency=self.config.scraping.per_host_concurrency,
+                per_host_delay_seconds=self.config.scraping.per_host_delay_seconds,
+                timeout_seconds=self.config.scraping.timeout_seconds,
+                metrics=self.metrics,
+            ),
             record_failure=record_failure,
             abort_event=abort_event,
+            metrics=self.metrics,
+            journal=self.journal,
+            deadline=self._build_deadline(),
+            strategy=self.config.scraping.strategy,
+            fetch_methods=self.fetch_methods,
+            health=scraping_health,
         )
         llm_worker = LLMWorker(
             summarizer=self.summarizer,
             prompt_lookup=self.prompt_lookup,
             record_failure=record_failure,
             abort_event=abort_event,
+            metrics=self.metrics,
+            journal=self.journal,
+            near_duplicates=self.near_duplicates,
+            health=llm_health,
+            cpu_pool=self.cpu_pool,
         )
         update_worker = UpdateWorker(
             miniflux_client=self.client,
             record_failure=record_failure,
             abort_event=abort_event,
+            metrics=self.metrics,
+            journal=self.journal,
+            health=miniflux_health,
+            cpu_pool=self.cpu_pool,
         )
 
-        fetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="minigist-fetch")
-        update_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="minigist-update")
+        fetch_executor = ThreadPoolExecutor(
+            max_workers=self.config.scraping.concurrency,
+            thread_name_prefix="minigist-fetch",
+        )
 
+        lease_renewal = asyncio.create_task(self._renew_leases(self.leases)) if self.leases is not None else None
         try:
             producer_task = asyncio.create_task(
                 fetch_worker.run(
                     loop,
-                    considered_entries,
+                    pending_entries,
                     in_queue,
                     fetch_executor,
                     self.config.llm.concurrency,
+                    self.config.scraping.concurrency,
                 )
             )
             worker_tasks = [
@@ -268,10 +528,9 @@ class Processor:
             ]
             updater_task = asyncio.create_task(
                 update_worker.run(
-                    loop,
                     out_queue,
-                    update_executor,
                     self.config.llm.concurrency,
+                    self.config.miniflux.concurrency,
                     counts,
                 )
             )
@@ -282,7 +541,15 @@ class Processor:
             await out_queue.join()
             await updater_task
         finally:
+            if lease_renewal is not None:
+                lease_renewal.cancel()
+            if self.leases is not None:
+                # Entries that were not written back can be picked up by another instance right away.
+                unfinished = {entry.id for entry in considered_entries} - counts.processed_entry_ids
+                await asyncio.to_thread(self.leases.release, unfinished, self.lease_owner)
             fetch_executor.shutdown(wait=True)
-            update_executor.shutdown(wait=True)
+            self.duplicates_merged = fetch_worker.duplicates_merged
+            self.deferred_count = fetch_worker.deferred
 
-        return counts.processed, counts.failed, abort_event.is_set()
+        unavailable = [health.name for health in (scraping_health, llm_health, miniflux_health) if health.is_down]
+        return counts.processed, counts.failed, unavailable
@@ -0,0 +1,243 @@
+"""Profiling support for `minigist run --profile`."""
+
+import json
+import logging
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from pathlib import Path
+from types import FrameType
+from typing import Literal, cast
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+ProfileMode = Literal["cpu", "wall", "memory"]
+
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 0.005
+DEFAULT_TOP_ALLOCATIONS = 25
+TRACEMALLOC_FRAMES = 25
+
+WORKER_STAGES = {
+    "FetchWorker": "fetch",
+    "LLMWorker": "llm",
+    "UpdateWorker": "update",
+}
+THREAD_STAGES = {
+    "minigist-fetch": "fetch",
+    "MainThread": "event_loop",
+}
+IDLE_FUNCTIONS = {
+    "select",
+    "poll",
+    "epoll",
+    "wait",
+    "acquire",
+    "recv",
+    "recv_into",
+    "read",
+    "readinto",
+    "sleep",
+    "_worker",
+    "get",
+}
+TASK_CORO_PATTERN = re.compile(r"coro=<(?P<qualname>[\w.<>]+)\(\)")
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({Path(code.co_filename).name})"
+
+
+def _stage_for_stack(thread_name: str, frames: list[FrameType]) -> str:
+    for frame in frames:
+        owner = frame.f_code.co_qualname.split(".", 1)[0]
+        if owner in WORKER_STAGES:
+            return WORKER_STAGES[owner]
+
+    for prefix, stage in THREAD_STAGES.items():
+        if thread_name.startswith(prefix):
+            return stage
+
+    return "other"
+
+
+class StackSampler:
+    """Periodically sample the stacks of all threads into collapsed stacks per stage."""
+
+    def __init__(self, include_idle: bool, interval_seconds: float = DEFAULT_SAMPLE_INTERVAL_SECONDS):
+        """Initialize the sampler; idle samples are dropped unless include_idle is set."""
+        self.include_idle = include_idle
+        self.interval_seconds = interval_seconds
+        self.stacks: dict[str, Counter[str]] = defaultdict(Counter)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="minigist-profiler", daemon=True)
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop_event.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop_event.wait(self.interval_seconds):
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, leaf in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                self._record(thread_names.get(ident, str(ident)), leaf)
+
+    def _record(self, thread_name: str, leaf: FrameType) -> None:
+        if not self.include_idle and leaf.f_code.co_name in IDLE_FUNCTIONS:
+            return
+
+        frames: list[FrameType] = []
+        frame: FrameType | None = leaf
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+
+        stage = _stage_for_stack(thread_name, frames)
+        self.stacks[stage][";".join(_frame_label(frame) for frame in frames)] += 1
+
+    def write(self, output_dir: Path, prefix: str) -> list[Path]:
+        """Write one flamegraph-compatible collapsed stack file per stage."""
+        written: list[Path] = []
+        for stage, stacks in sorted(self.stacks.items()):
+            path = output_dir / f"{prefix}.{stage}.folded"
+            path.write_text("".join(f"{stack} {count}\n" for stack, count in stacks.most_common()))
+            written.append(path)
+        return written
+
+
+class EventLoopBlockingCollector(logging.Handler):
+    """Collect asyncio slow-callback warnings and attribute them to pipeline workers."""
+
+    def __init__(self) -> None:
+        """Initialize an empty collector."""
+        super().__init__(level=logging.WARNING)
+        self.episodes: list[dict[str, object]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Record an 'Executing <handle> took N seconds' warning from asyncio."""
+        if not record.msg.startswith("Executing") or len(record.args or ()) != 2:
+            return
+
+        handle, duration = cast("tuple[object, float]", record.args)
+        handle_repr = str(handle)
+        match = TASK_CORO_PATTERN.search(handle_repr)
+        qualname = match.group("qualname") if match else None
+        owner = qualname.split(".", 1)[0] if qualname else None
+
+        self.episodes.append(
+            {
+                "duration_seconds": round(float(duration), 4),
+                "worker": owner if owner in WORKER_STAGES else None,
+                "coroutine": qualname,
+                "handle": handle_repr,
+            }
+        )
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Aggregate blocking episodes per worker."""
+        per_worker: dict[str, dict[str, float]] = defaultdict(lambda: {"count": 0, "total_seconds": 0.0})
+        for episode in self.episodes:
+            worker = str(episode["worker"] or "other")
+            per_worker[worker]["count"] += 1
+            per_worker[worker]["total_seconds"] += float(episode["duration_seconds"])  # type: ignore[arg-type]
+        return dict(per_worker)
+
+
+class RunProfiler:
+    """Profile a processing run and write the reports to a directory."""
+
+    def __init__(
+        self,
+        mode: ProfileMode,
+        output_dir: Path,
+        top_allocations: int = DEFAULT_TOP_ALLOCATIONS,
+    ):
+        """Configure the profiling mode and the output directory."""
+        self.mode = mode
+        self.output_dir = output_dir
+        self.top_allocations = top_allocations
+        self.sampler = StackSampler(include_idle=mode == "wall") if mode in ("cpu", "wall") else None
+        self.blocking_collector = EventLoopBlockingCollector()
+        self._started_at = 0.0
+
+    def __enter__(self) -> "RunProfiler":
+        """Start profiling."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        logging.getLogger("asyncio").addHandler(self.blocking_collector)
+
+        if self.mode == "memory":
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        if self.sampler:
+            self.sampler.start()
+
+        self._started_at = time.monotonic()
+        logger.info("Profiling run", mode=self.mode, output_dir=str(self.output_dir))
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> bool:
+        """Stop profiling and write the reports."""
+        elapsed = time.monotonic() - self._started_at
+        logging.getLogger("asyncio").removeHandler(self.blocking_collector)
+
+        written: list[Path] = []
+        if self.sampler:
+            self.sampler.stop()
+            written.extend(self.sampler.write(self.output_dir, self.mode))
+        if self.mode == "memory":
+            written.append(self._write_allocation_report())
+            tracemalloc.stop()
+        written.append(self._write_blocking_report())
+
+        logger.info(
+            "Wrote profiling reports",
+            mode=self.mode,
+            elapsed_seconds=round(elapsed, 2),
+            files=[str(path) for path in written],
+        )
+        return False
+
+    def _write_allocation_report(self) -> Path:
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ]
+        )
+        current, peak = tracemalloc.get_traced_memory()
+
+        lines = [f"Current traced memory: {current / 1024:.1f} KiB", f"Peak traced memory: {peak / 1024:.1f} KiB", ""]
+        for index, statistic in enumerate(snapshot.statistics("traceback")[: self.top_allocations], start=1):
+            lines.append(f"#{index}: {statistic.size / 1024:.1f} KiB in {statistic.count} blocks")
+            lines.extend(f"    {line}" for line in statistic.traceback.format(limit=TRACEMALLOC_FRAMES))
+            lines.append("")
+
+        path = self.output_dir / "memory.top.txt"
+        path.write_text("\n".join(lines))
+        return path
+
+    def _write_blocking_report(self) -> Path:
+        path = self.output_dir / "event_loop_blocking.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "summary": self.blocking_collector.summary(),
+                    "episodes": self.blocking_collector.episodes,
+                },
+                indent=2,
+            )
+        )
+        return path
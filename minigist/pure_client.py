@@ -1,12 +1,13 @@
-import time
-from collections import deque
+from pathlib import Path
 from urllib.parse import urlparse, urlunparse
 
 import httpx
 from httpx_retries import RetryTransport
 
 from .constants import DEFAULT_SCRAPE_TIMEOUT_SECONDS
+from .exceptions import ArticleTransportError
 from .logging import get_logger
+from .rate_limiter import TokenBucket
 
 logger = get_logger(__name__)
 
@@ -22,14 +23,21 @@ class PureMDClient:
         api_token: str | None,
         base_url: str = DEFAULT_PUREMD_API_BASE_URL,
         user_agent: str = DEFAULT_USER_AGENT,
+        rate_limit_state_path: Path | None = None,
     ):
         self.api_token = api_token
         self.base_url = base_url
         self.headers = {"User-Agent": user_agent}
+        # Requests without a token must take a token from this bucket before calling fetch_markdown_content.
+        self.rate_limiter: TokenBucket | None = None
         if self.api_token:
             self.headers["x-puremd-api-token"] = self.api_token
         else:
-            self._request_timestamps: deque[float] = deque(maxlen=MAX_REQUESTS_PER_WINDOW_NO_TOKEN)
+            self.rate_limiter = TokenBucket(
+                capacity=MAX_REQUESTS_PER_WINDOW_NO_TOKEN,
+                refill_per_second=MAX_REQUESTS_PER_WINDOW_NO_TOKEN / REQUEST_WINDOW_SECONDS,
+                state_path=rate_limit_state_path,
+            )
             logger.warning(
                 "Using pure.md without API token",
                 rate_limit_requests=MAX_REQUESTS_PER_WINDOW_NO_TOKEN,
@@ -41,31 +49,6 @@ class PureMDClient:
             follow_redirects=True,
         )
 
-    def _apply_rate_limit_delay_if_needed(self):
-        """Checks if rate limit is about to be hit and sleeps if necessary."""
-        now = time.monotonic()
-
-        while self._request_timestamps and self._request_timestamps[0] <= now - REQUEST_WINDOW_SECONDS:
-            self._request_timestamps.popleft()
-
-        if len(self._request_timestamps) >= MAX_REQUESTS_PER_WINDOW_NO_TOKEN:
-            oldest_in_window_request_time = self._request_timestamps[0]
-            time_until_window_resets = (oldest_in_window_request_time + REQUEST_WINDOW_SECONDS) - now
-
-            if time_until_window_resets > 0:
-                wait_time = time_until_window_resets
-                logger.info(
-                    "Rate limit delay activated",
-                    sleep_seconds=round(wait_time, 2),
-                    current_requests_in_window=len(self._request_timestamps),
-                    max_requests_per_window=MAX_REQUESTS_PER_WINDOW_NO_TOKEN,
-                    window_seconds=int(REQUEST_WINDOW_SECONDS),
-                )
-                time.sleep(wait_time)
-                now = time.monotonic()
-
-        self._request_timestamps.append(now)
-
     def _prepare_request_url(self, target_url: str) -> str:
         parsed_base = urlparse(self.base_url)
         path = parsed_base.path
@@ -88,9 +71,10 @@ class PureMDClient:
         return base_url_normalized + target_url
 
     def fetch_markdown_content(self, target_url: str, timeout: float = DEFAULT_SCRAPE_TIMEOUT_SECONDS) -> str | None:
-        if not self.api_token:
-            self._apply_rate_limit_delay_if_needed()
+        """Return the article as Markdown, or None if pure.md could not provide it.
 
+        Raises ArticleTransportError if pure.md itself could not be reached or failed with a server error.
+        """
         request_url = self._prepare_request_url(target_url)
 
         logger.debug(
@@ -110,6 +94,8 @@ class PureMDClient:
                 response_text=e.response.text[:200] if e.response else "N/A",
                 error=str(e),
             )
+            if e.response is not None and e.response.is_server_error:
+                raise ArticleTransportError(f"pure.md failed with HTTP {e.response.status_code}") from e
             return None
         except httpx.RequestError as e:
             logger.error(
@@ -117,7 +103,7 @@ class PureMDClient:
                 url=target_url,
                 error=str(e),
             )
-            return None
+            raise ArticleTransportError(f"pure.md request failed: {e}") from e
         except Exception as e:
             logger.error(
                 "Unexpected error fetching content from pure.md",
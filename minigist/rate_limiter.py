@@ -0,0 +1,92 @@
+"""Token bucket rate limiter that can be shared across processes through a state file."""
+
+import asyncio
+import fcntl
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class TokenBucket:
+    """Allow bursts of up to `capacity` requests, refilled at `refill_per_second`.
+
+    With a state path, the bucket is stored in that file under an exclusive lock, so that
+    concurrent minigist processes on the same machine draw from the same budget. Without one,
+    or if the file cannot be used, the bucket is kept in memory.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, state_path: Path | None = None):
+        """Create a full bucket."""
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.state_path = state_path.expanduser() if state_path is not None else None
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated_at = time.time()
+
+    def _refill(self, tokens: float, updated_at: float, now: float) -> float:
+        elapsed = max(now - updated_at, 0.0)
+        return min(self.capacity, tokens + elapsed * self.refill_per_second)
+
+    def _take_from(self, tokens: float, updated_at: float, now: float) -> tuple[float, float]:
+        """Return the remaining tokens and the seconds to wait, which is 0 if a token was taken."""
+        tokens = self._refill(tokens, updated_at, now)
+        if tokens >= 1:
+            return tokens - 1, 0.0
+        return tokens, (1 - tokens) / self.refill_per_second
+
+    def _take_in_memory(self) -> float:
+        now = time.time()
+        self._tokens, wait_seconds = self._take_from(self._tokens, self._updated_at, now)
+        self._updated_at = now
+        return wait_seconds
+
+    def _take_from_file(self, path: Path) -> float:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+", encoding="utf-8") as state_file:
+            fcntl.flock(state_file, fcntl.LOCK_EX)
+            now = time.time()
+            try:
+                state = json.loads(state_file.read() or "{}")
+                tokens = float(state.get("tokens", self.capacity))
+                updated_at = float(state.get("updated_at", now))
+            except (ValueError, TypeError, AttributeError):
+                tokens, updated_at = self.capacity, now
+
+            tokens, wait_seconds = self._take_from(tokens, updated_at, now)
+            state_file.seek(0)
+            state_file.truncate()
+            json.dump({"tokens": tokens, "updated_at": now}, state_file)
+        return wait_seconds
+
+    def take(self) -> float:
+        """Take a token if one is available; otherwise return the seconds until one will be."""
+        with self._lock:
+            if self.state_path is not None:
+                try:
+                    return self._take_from_file(self.state_path)
+                except OSError as e:
+                    logger.warning(
+                        "Cannot use shared rate limit state; limiting this process only",
+                        path=str(self.state_path),
+                        error=str(e),
+                    )
+                    self.state_path = None
+            return self._take_in_memory()
+
+    async def try_acquire(self) -> bool:
+        """Take a token without waiting; return whether one was available."""
+        return await asyncio.to_thread(self.take) == 0
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it, without blocking the event loop."""
+        while (wait_seconds := await asyncio.to_thread(self.take)) > 0:
+            logger.info("Rate limit delay activated", sleep_seconds=round(wait_seconds, 2))
+            await asyncio.sleep(wait_seconds)
@@ -0,0 +1,70 @@
+"""Fair ordering of entries across feeds and targets."""
+
+from collections.abc import Callable, Hashable
+
+from .models import Entry
+
+
+def _round_robin_feeds(entries: list[Entry]) -> list[Entry]:
+    """Interleave entries across feeds, newest first within each feed."""
+    by_feed: dict[int, list[Entry]] = {}
+    for entry in entries:
+        by_feed.setdefault(entry.feed_id, []).append(entry)
+    feeds = [
+        sorted(feed_entries, key=lambda entry: entry.published_at, reverse=True) for feed_entries in by_feed.values()
+    ]
+
+    ordered: list[Entry] = []
+    longest = max((len(feed_entries) for feed_entries in feeds), default=0)
+    for round_index in range(longest):
+        for feed_entries in feeds:
+            if round_index < len(feed_entries):
+                ordered.append(feed_entries[round_index])
+    return ordered
+
+
+def _weighted_round_robin[K: Hashable](queues: dict[K, list[Entry]], weights: dict[K, float]) -> list[Entry]:
+    """Merge per-group queues so each group gets turns in proportion to its weight (smooth weighted round robin)."""
+    positions = dict.fromkeys(queues, 0)
+    current = dict.fromkeys(queues, 0.0)
+    ordered: list[Entry] = []
+
+    while True:
+        active = [key for key in queues if positions[key] < len(queues[key])]
+        if not active:
+            return ordered
+
+        total_weight = sum(weights[key] for key in active)
+        for key in active:
+            current[key] += weights[key]
+        chosen = max(active, key=lambda key: current[key])
+        current[chosen] -= total_weight
+
+        ordered.append(queues[chosen][positions[chosen]])
+        positions[chosen] += 1
+
+
+def _fair_order[K: Hashable](
+    entries: list[Entry], group_of: Callable[[Entry], K], weight_of: Callable[[K], float]
+) -> list[Entry]:
+    by_group: dict[K, list[Entry]] = {}
+    for entry in entries:
+        by_group.setdefault(group_of(entry), []).append(entry)
+
+    queues = {group: _round_robin_feeds(group_entries) for group, group_entries in by_group.items()}
+    return _weighted_round_robin(queues, {group: weight_of(group) for group in queues})
+
+
+def prioritize_entries[K: Hashable](
+    entries: list[Entry],
+    group_of: Callable[[Entry], K],
+    weight_of: Callable[[K], float],
+) -> list[Entry]:
+    """Order entries for processing: starred first, then fairly across groups by weight and across feeds.
+
+    Within a feed, newer entries come first. Groups are typically targets, so a single
+    high-volume feed or target cannot use up a run's capacity before the others get a turn.
+    """
+    starred = [entry for entry in entries if entry.starred]
+    unstarred = [entry for entry in entries if not entry.starred]
+    return _fair_order(starred, group_of, weight_of) + _fair_order(unstarred, group_of, weight_of)
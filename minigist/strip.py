@@ -0,0 +1,173 @@
+"""Bulk removal of minigist summaries from Miniflux entries."""
+
+import asyncio
+import json
+import os
+import re
+from collections.abc import Sequence
+from pathlib import Path
+
+from .constants import STRIP_PAGE_SIZE, WATERMARK_DETECTOR
+from .exceptions import MinifluxApiError
+from .logging import get_logger
+from .marker import is_summarized
+from .miniflux_client import MinifluxClient
+from .models import Entry, StripStats
+
+logger = get_logger(__name__)
+
+HORIZONTAL_RULE = re.compile(r"<hr\b[^>]*>", re.IGNORECASE)
+
+
+def split_summary(content: str) -> str | None:
+    """Return the original content of a summarized entry, or None if no summary can be split off.
+
+    Entries are rendered as the summary, the watermark and a horizontal rule followed by the
+    original content, so the content is cut at the first rule after the watermark without parsing the HTML.
+    """
+    watermark_at = content.find(WATERMARK_DETECTOR)
+    if watermark_at < 0:
+        return None
+
+    rule = HORIZONTAL_RULE.search(content, watermark_at)
+    if rule is None:
+        return None
+
+    original = content[rule.end() :].lstrip()
+    return original or None
+
+
+class StripCheckpoint:
+    """Remember, per feed, the entry ID up to which every entry was handled, persisted as JSON.
+
+    Positions are only reused with the same filters, since a different selection of entries has to be scanned from
+    the start.
+    """
+
+    def __init__(self, path: Path, filters: dict[str, object]):
+        """Load the positions saved for the given filters, starting from scratch otherwise."""
+        self.path = path.expanduser()
+        self.filters = json.dumps(filters, sort_keys=True, default=str)
+        self._positions = self._load()
+
+    def _load(self) -> dict[str, int]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable strip checkpoint", path=str(self.path), error=str(e))
+            return {}
+
+        if not isinstance(data, dict) or data.get("filters") != self.filters:
+            return {}
+        try:
+            return {scope: int(entry_id) for scope, entry_id in data.get("positions", {}).items()}
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.warning("Ignoring malformed strip checkpoint", path=str(self.path), error=str(e))
+            return {}
+
+    def reset(self) -> None:
+        """Forget all positions, so that every scope is scanned from the start."""
+        self._positions.clear()
+
+    def position(self, scope: str) -> int:
+        """Return the entry ID after which the scope resumes."""
+        return self._positions.get(scope, 0)
+
+    def advance(self, scope: str, entry_id: int) -> None:
+        """Record that every entry of the scope up to the given ID was handled, and save the checkpoint."""
+        self._positions[scope] = entry_id
+        temporary_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_text(
+                json.dumps({"filters": self.filters, "positions": self._positions}, sort_keys=True),
+                encoding="utf-8",
+            )
+            os.replace(temporary_path, self.path)
+        except OSError as e:
+            logger.warning("Failed to save strip checkpoint", path=str(self.path), error=str(e))
+
+
+class SummaryStripper:
+    """Restore the original content of summarized entries, page by page with concurrent, bounded updates."""
+
+    def __init__(
+        self,
+        client: MinifluxClient,
+        concurrency: int,
+        checkpoint: StripCheckpoint | None = None,
+        page_size: int = STRIP_PAGE_SIZE,
+    ):
+        """Initialize the stripper; without a checkpoint, every run scans all matching entries."""
+        self.client = client
+        self.checkpoint = checkpoint
+        self.page_size = page_size
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.stats = StripStats()
+
+    async def run(self, feed_ids: Sequence[int] = (), filters: dict[str, object] | None = None) -> StripStats:
+        """Strip summaries from all entries matching the filters, in the given feeds or in all feeds."""
+        for feed_id in feed_ids or [None]:
+            await self._strip_scope(feed_id, filters or {})
+        return self.stats
+
+    async def _strip_scope(self, feed_id: int | None, filters: dict[str, object]) -> None:
+        scope = "all" if feed_id is None else f"feed:{feed_id}"
+        after_entry_id = self.checkpoint.position(scope) if self.checkpoint is not None else 0
+        if after_entry_id:
+            logger.info("Resuming from checkpoint", scope=scope, after_entry_id=after_entry_id)
+
+        # Once an update fails, the checkpoint stays put so that the next run retries the entry.
+        resumable = True
+        page = await self.client.get_entry_page(after_entry_id, self.page_size, feed_id, filters)
+        while page:
+            after_entry_id = page[-1].id
+            next_page = (
+                asyncio.create_task(self.client.get_entry_page(after_entry_id, self.page_size, feed_id, filters))
+                if len(page) == self.page_size
+                else None
+            )
+            try:
+                succeeded = await asyncio.gather(*(self._strip_entry(entry) for entry in page))
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+
+            resumable = resumable and all(succeeded)
+            if resumable and self.checkpoint is not None:
+                self.checkpoint.advance(scope, after_entry_id)
+            logger.info(
+                "Strip progress",
+                scope=scope,
+                last_entry_id=after_entry_id,
+                **self.stats.model_dump(),
+            )
+            page = await next_page if next_page is not None else []
+
+    async def _strip_entry(self, entry: Entry) -> bool:
+        """Restore one entry's original content; return False only if the update failed."""
+        self.stats.scanned += 1
+        if not is_summarized(entry.content):
+            return True
+
+        log_context: dict[str, object] = {"miniflux_entry_id": entry.id, "miniflux_feed_id": entry.feed_id}
+        original = split_summary(entry.content)
+        if original is None:
+            self.stats.unsplittable += 1
+            logger.warning("Cannot find the original content after the summary; skipping entry", **log_context)
+            return True
+
+        async with self.semaphore:
+            try:
+                await self.client.update_entry(entry.id, original, log_context)
+            except MinifluxApiError as e:
+                self.stats.failed += 1
+                logger.error("Failed to strip summary from entry", **log_context, error=str(e))
+                return False
+
+        self.stats.stripped += 1
+        logger.debug("Stripped summary from entry", **log_context)
+        return True
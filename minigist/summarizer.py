@@ -1,19 +1,34 @@
-from typing import Any, cast
-
-from openai import AsyncOpenAI
-from openai.types.chat import (
-    ChatCompletion,
-    ChatCompletionMessageParam,
-    ChatCompletionSystemMessageParam,
-    ChatCompletionUserMessageParam,
-)
-from openai.types.shared_params.response_format_json_schema import ResponseFormatJSONSchema
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
-from .config import LLMConfig
-from .constants import FIXED_SYSTEM_PROMPT
-from .exceptions import LLMServiceError
+from . import tracing
+from .config import HedgingConfig, LLMConfig
+from .constants import (
+    FIXED_SYSTEM_PROMPT,
+    LLM_CLIENT_MAX_RETRIES,
+    LLM_ENDPOINT_COOLDOWN_SECONDS,
+    LLM_ENDPOINT_FAILURE_THRESHOLD,
+    LLM_LATENCY_WINDOW_SIZE,
+    PRIMARY_LLM_ENDPOINT_ID,
+)
+from .exceptions import LLMContentRejectedError, LLMServiceError
+from .latency import LatencyTracker
 from .logging import format_log_preview, get_logger
+from .metrics import PipelineMetrics
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+    from openai.types.chat import (
+        ChatCompletion,
+        ChatCompletionMessageParam,
+        ChatCompletionSystemMessageParam,
+        ChatCompletionUserMessageParam,
+    )
+    from openai.types.shared_params.response_format_json_schema import ResponseFormatJSONSchema
 
 logger = get_logger(__name__)
 
@@ -26,29 +41,266 @@ class SummaryOutput(BaseModel):
     )
 
 
+@dataclass(frozen=True)
+class SummaryResult:
+    markdown: str
+    model: str
+
+
+@dataclass
+class LLMEndpoint:
+    id: str
+    model: str
+    client_kwargs: dict[str, Any]
+    is_openrouter: bool
+    semaphore: asyncio.Semaphore
+    latencies: LatencyTracker = field(default_factory=lambda: LatencyTracker(LLM_LATENCY_WINDOW_SIZE))
+    client: "AsyncOpenAI | None" = None
+    consecutive_failures: int = 0
+    demoted_until: float = 0.0
+
+    @property
+    def is_demoted(self) -> bool:
+        """Return whether the endpoint failed repeatedly and is tried last for now."""
+        return time.monotonic() < self.demoted_until
+
+    def get_client(self) -> "AsyncOpenAI":
+        """Return the API client, importing the OpenAI SDK on first use."""
+        if self.client is None:
+            from openai import AsyncOpenAI
+
+            self.client = AsyncOpenAI(**self.client_kwargs)
+        return self.client
+
+
 class Summarizer:
-    def __init__(self, config: LLMConfig):
+    def __init__(self, config: LLMConfig, metrics: PipelineMetrics | None = None):
+        self.metrics = metrics or PipelineMetrics()
+        self.hedging: HedgingConfig = config.hedging
+        self.hedges_issued = 0
+        self.hedge_wins = 0
+        self.endpoints: list[LLMEndpoint] = [
+            self._create_endpoint(
+                endpoint_id=PRIMARY_LLM_ENDPOINT_ID,
+                model=config.model,
+                api_key=config.api_key,
+                base_url=config.base_url,
+                timeout_seconds=config.timeout_seconds,
+                concurrency=config.concurrency,
+            )
+        ]
+        for fallback in config.fallbacks:
+            self.endpoints.append(
+                self._create_endpoint(
+                    endpoint_id=fallback.id,
+                    model=fallback.model,
+                    api_key=fallback.api_key or config.api_key,
+                    base_url=fallback.base_url or config.base_url,
+                    timeout_seconds=fallback.timeout_seconds or config.timeout_seconds,
+                    concurrency=fallback.concurrency or config.concurrency,
+                )
+            )
+
+    @staticmethod
+    def _create_endpoint(
+        endpoint_id: str,
+        model: str,
+        api_key: str,
+        base_url: str,
+        timeout_seconds: float,
+        concurrency: int,
+    ) -> LLMEndpoint:
         client_kwargs: dict[str, Any] = {
-            "api_key": config.api_key,
-            "timeout": config.timeout_seconds,
-            "base_url": config.base_url,
+            "api_key": api_key,
+            "timeout": timeout_seconds,
+            "base_url": base_url,
+            "max_retries": LLM_CLIENT_MAX_RETRIES,
         }
 
-        self.client = AsyncOpenAI(**client_kwargs)
-        self.model = config.model
-        self.is_openrouter = "openrouter.ai" in config.base_url
+        return LLMEndpoint(
+            id=endpoint_id,
+            model=model,
+            client_kwargs=client_kwargs,
+            is_openrouter="openrouter.ai" in base_url,
+            semaphore=asyncio.Semaphore(concurrency),
+        )
+
+    def _resolve_endpoint_chain(self, endpoint_id: str | None) -> list[LLMEndpoint]:
+        """Order the endpoints so that the preferred one is tried first and repeatedly failing ones last."""
+        if endpoint_id is None:
+            chain = list(self.endpoints)
+        else:
+            preferred = [endpoint for endpoint in self.endpoints if endpoint.id == endpoint_id]
+            if not preferred:
+                raise LLMServiceError(f"Unknown LLM endpoint '{endpoint_id}'")
+            chain = preferred + [endpoint for endpoint in self.endpoints if endpoint.id != endpoint_id]
+
+        return sorted(chain, key=lambda endpoint: endpoint.is_demoted)
+
+    def _record_endpoint_outcome(self, endpoint: LLMEndpoint, failed: bool) -> None:
+        """Track consecutive request failures and demote an endpoint that keeps failing for a cooldown."""
+        if not failed:
+            endpoint.consecutive_failures = 0
+            return
+
+        endpoint.consecutive_failures += 1
+        if endpoint.consecutive_failures >= LLM_ENDPOINT_FAILURE_THRESHOLD and not endpoint.is_demoted:
+            endpoint.demoted_until = time.monotonic() + LLM_ENDPOINT_COOLDOWN_SECONDS
+            logger.warning(
+                "LLM endpoint keeps failing; trying it last for a while",
+                llm_endpoint_id=endpoint.id,
+                consecutive_failures=endpoint.consecutive_failures,
+                cooldown_seconds=LLM_ENDPOINT_COOLDOWN_SECONDS,
+            )
 
     async def generate_summary(
         self,
         article_text: str,
         prompt: str,
         log_context: dict[str, object],
-    ) -> str:
+        endpoint_id: str | None = None,
+    ) -> SummaryResult:
         if not article_text or not article_text.strip():
             logger.warning("Generate summary called with empty article text", **log_context)
-            raise LLMServiceError("Cannot generate summary from empty or whitespace-only article text")
+            raise LLMContentRejectedError("Cannot generate summary from empty or whitespace-only article text")
+
+        chain = self._resolve_endpoint_chain(endpoint_id)
+        last_error: LLMServiceError | None = None
+        tried: set[str] = set()
+
+        for index, endpoint in enumerate(chain):
+            if endpoint.id in tried:
+                # The endpoint already failed as the hedge of the first one.
+                continue
+            tried.add(endpoint.id)
+            try:
+                if index == 0 and self.hedging.enabled:
+                    hedge_endpoint = chain[1] if len(chain) > 1 else endpoint
+                    return await self._generate_hedged_summary(
+                        endpoint, hedge_endpoint, article_text, prompt, log_context, tried
+                    )
+                return await self._generate_summary_on_endpoint(endpoint, article_text, prompt, log_context)
+            except LLMContentRejectedError:
+                # The endpoint answered; another model would most likely reject the article as well.
+                raise
+            except LLMServiceError as e:
+                last_error = e
+                remaining = [candidate for candidate in chain[index + 1 :] if candidate.id not in tried]
+                if remaining:
+                    logger.warning(
+                        "LLM endpoint failed, failing over to next endpoint",
+                        **log_context,
+                        llm_endpoint_id=endpoint.id,
+                        next_llm_endpoint_id=remaining[0].id,
+                        error=str(e),
+                    )
 
-        logger.info("Generating article summary", **log_context, text_length=len(article_text))
+        if last_error is None:
+            raise LLMServiceError("No LLM endpoints are configured")
+        raise last_error
+
+    def _record_token_usage(self, endpoint: LLMEndpoint, completion: "ChatCompletion", request_span: Any) -> None:
+        usage = completion.usage
+        if usage is None:
+            return
+
+        tracing.set_attributes(
+            request_span,
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+        )
+        for kind, tokens in (("prompt", usage.prompt_tokens), ("completion", usage.completion_tokens)):
+            self.metrics.increment(
+                "llm_tokens_total",
+                tokens,
+                description="Number of tokens consumed by LLM requests.",
+                kind=kind,
+                model=endpoint.model,
+            )
+
+    def _hedge_delay(self, endpoint: LLMEndpoint) -> float | None:
+        """Return how long to wait before hedging, or None if hedging is not possible yet."""
+        if len(endpoint.latencies) < self.hedging.min_samples:
+            return None
+        if self.hedges_issued >= self.hedging.max_hedges_per_run:
+            return None
+        return endpoint.latencies.percentile(self.hedging.percentile)
+
+    async def _generate_hedged_summary(
+        self,
+        primary: LLMEndpoint,
+        secondary: LLMEndpoint,
+        article_text: str,
+        prompt: str,
+        log_context: dict[str, object],
+        tried: set[str],
+    ) -> SummaryResult:
+        """Issue a duplicate request once the primary exceeds its latency percentile; the first success wins.
+
+        The secondary endpoint is added to `tried` once it was called, so that failover does not call it again.
+        """
+        primary_task = asyncio.create_task(
+            self._generate_summary_on_endpoint(primary, article_text, prompt, log_context)
+        )
+        pending: set[asyncio.Task[SummaryResult]] = {primary_task}
+
+        try:
+            delay = self._hedge_delay(primary)
+            if delay is None:
+                return await primary_task
+
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done or self.hedges_issued >= self.hedging.max_hedges_per_run:
+                return await primary_task
+
+            self.hedges_issued += 1
+            logger.info(
+                "Issuing hedged LLM request",
+                **log_context,
+                llm_endpoint_id=secondary.id,
+                hedge_delay_seconds=round(delay, 2),
+                hedges_issued=self.hedges_issued,
+            )
+            hedge_task = asyncio.create_task(
+                self._generate_summary_on_endpoint(secondary, article_text, prompt, log_context)
+            )
+            pending.add(hedge_task)
+            tried.add(secondary.id)
+
+            last_error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        if task is hedge_task:
+                            self.hedge_wins += 1
+                            logger.info("Hedged LLM request won", **log_context, llm_endpoint_id=secondary.id)
+                        return task.result()
+                    last_error = error
+
+            if isinstance(last_error, LLMServiceError):
+                raise last_error
+            raise LLMServiceError(f"Hedged LLM requests failed: {last_error}") from last_error
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _generate_summary_on_endpoint(
+        self,
+        endpoint: LLMEndpoint,
+        article_text: str,
+        prompt: str,
+        log_context: dict[str, object],
+    ) -> SummaryResult:
+        logger.info(
+            "Generating article summary",
+            **log_context,
+            text_length=len(article_text),
+            llm_endpoint_id=endpoint.id,
+            model=endpoint.model,
+        )
         try:
             response_format: ResponseFormatJSONSchema = {
                 "type": "json_schema",
@@ -62,44 +314,56 @@ class Summarizer:
 
             messages: list[ChatCompletionMessageParam] = [
                 cast(
-                    ChatCompletionSystemMessageParam,
+                    "ChatCompletionSystemMessageParam",
                     {"role": "system", "content": FIXED_SYSTEM_PROMPT},
                 ),
                 cast(
-                    ChatCompletionSystemMessageParam,
+                    "ChatCompletionSystemMessageParam",
                     {"role": "system", "content": prompt},
                 ),
                 cast(
-                    ChatCompletionUserMessageParam,
+                    "ChatCompletionUserMessageParam",
                     {"role": "user", "content": article_text},
                 ),
             ]
 
-            if self.is_openrouter:
-                completion: ChatCompletion = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    response_format=response_format,
-                    stream=False,
-                    extra_body={
-                        "provider": {"require_parameters": True},
-                        "plugins": [{"id": "response-healing"}],
-                    },
-                )
-            else:
-                completion = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    response_format=response_format,
-                    stream=False,
-                )
+            with tracing.span("llm.request", llm_endpoint_id=endpoint.id, model=endpoint.model) as request_span:
+                async with endpoint.semaphore:
+                    started_at = time.monotonic()
+                    if endpoint.is_openrouter:
+                        completion: ChatCompletion = await endpoint.get_client().chat.completions.create(
+                            model=endpoint.model,
+                            messages=messages,
+                            response_format=response_format,
+                            stream=False,
+                            extra_body={
+                                "provider": {"require_parameters": True},
+                                "plugins": [{"id": "response-healing"}],
+                            },
+                        )
+                    else:
+                        completion = await endpoint.get_client().chat.completions.create(
+                            model=endpoint.model,
+                            messages=messages,
+                            response_format=response_format,
+                            stream=False,
+                        )
+                    endpoint.latencies.record(time.monotonic() - started_at)
+                self._record_endpoint_outcome(endpoint, failed=False)
+                self._record_token_usage(endpoint, completion, request_span)
         except Exception as e:
-            logger.error("Unexpected error during LLM summarization", **log_context, error=str(e))
+            self._record_endpoint_outcome(endpoint, failed=True)
+            logger.error(
+                "Unexpected error during LLM summarization",
+                **log_context,
+                llm_endpoint_id=endpoint.id,
+                error=str(e),
+            )
             raise LLMServiceError(f"LLM service error during summarization: {e}") from e
 
         content = completion.choices[0].message.content
         if not content:
-            logger.error("LLM service returned empty structured output", **log_context)
+            logger.error("LLM service returned empty structured output", **log_context, llm_endpoint_id=endpoint.id)
             raise LLMServiceError("LLM service returned empty structured output")
 
         try:
@@ -108,6 +372,7 @@ class Summarizer:
             logger.error(
                 "LLM structured output failed schema validation",
                 **log_context,
+                llm_endpoint_id=endpoint.id,
                 content_preview=format_log_preview(content),
             )
             raise LLMServiceError("LLM structured output failed schema validation") from e
@@ -119,13 +384,14 @@ class Summarizer:
             logger.warning(
                 "Model indicated error",
                 **log_context,
+                llm_endpoint_id=endpoint.id,
                 summary_preview=format_log_preview(summary),
             )
-            raise LLMServiceError("LLM model indicated an error in its output")
+            raise LLMContentRejectedError("LLM model indicated an error in its output")
 
         if not summary or not summary.strip():
-            logger.error("LLM service returned empty summary markdown", **log_context)
-            raise LLMServiceError("LLM service returned an empty summary")
+            logger.error("LLM service returned empty summary markdown", **log_context, llm_endpoint_id=endpoint.id)
+            raise LLMContentRejectedError("LLM service returned an empty summary")
 
         logger.debug("Successfully generated summary", **log_context, summary_length=len(summary))
-        return summary
+        return SummaryResult(markdown=summary, model=endpoint.model)
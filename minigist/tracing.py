@@ -0,0 +1,120 @@
+"""Optional OpenTelemetry tracing of entries through the pipeline."""
+
+import contextvars
+import functools
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from .config import TracingConfig
+from .exceptions import ConfigError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+_tracer: Any = None
+_provider: Any = None
+_trace_file: Any = None
+
+
+def configure_tracing(config: TracingConfig) -> None:
+    """Install a tracer provider exporting spans to the configured destination."""
+    global _tracer, _provider, _trace_file
+
+    if not config.enabled:
+        return
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor
+    except ImportError as e:
+        logger.error("Tracing is enabled but OpenTelemetry is not installed")
+        raise ConfigError("Tracing requires the optional 'tracing' dependencies (pip install minigist[tracing])") from e
+
+    provider = TracerProvider(resource=Resource.create({"service.name": config.service_name}))
+
+    if config.exporter == "file":
+        if config.file_path is None:
+            raise ConfigError("Tracing with the file exporter requires tracing.file_path")
+        _trace_file = open(config.file_path, "a")  # noqa: SIM115
+        exporter = ConsoleSpanExporter(out=_trace_file, formatter=lambda span: span.to_json(indent=None) + "\n")
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    else:
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as e:
+            logger.error("Tracing with OTLP is enabled but the OTLP exporter is not installed")
+            raise ConfigError("OTLP tracing requires the optional 'tracing' dependencies") from e
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=config.endpoint)))
+
+    _provider = provider
+    _tracer = provider.get_tracer("minigist")
+    logger.info("Tracing enabled", exporter=config.exporter)
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and disable tracing."""
+    global _tracer, _provider, _trace_file
+
+    if _provider is not None:
+        _provider.shutdown()
+    if _trace_file is not None:
+        _trace_file.close()
+    _tracer = None
+    _provider = None
+    _trace_file = None
+
+
+def start_entry_span(log_context: dict[str, object], **attributes: object) -> Any:
+    """Start the root span of an entry; returns None when tracing is disabled."""
+    if _tracer is None:
+        return None
+
+    return _tracer.start_span("entry", attributes=_span_attributes({**log_context, **attributes}))
+
+
+def end_span(span: Any, error: BaseException | None = None) -> None:
+    """End a span, recording the error that terminated it, if any."""
+    if span is None:
+        return
+
+    if error is not None:
+        from opentelemetry.trace import Status, StatusCode
+
+        span.record_exception(error)
+        span.set_status(Status(StatusCode.ERROR, str(error)))
+    span.end()
+
+
+@contextmanager
+def span(name: str, parent: Any = None, **attributes: object) -> Iterator[Any]:
+    """Trace the enclosed block as a child of the parent or of the current span."""
+    if _tracer is None:
+        yield None
+        return
+
+    from opentelemetry import trace
+
+    context = trace.set_span_in_context(parent) if parent is not None else None
+    with _tracer.start_as_current_span(name, context=context, attributes=_span_attributes(attributes)) as current:
+        yield current
+
+
+def set_attributes(current: Any, **attributes: object) -> None:
+    """Attach attributes to a span if tracing is enabled."""
+    if current is not None:
+        current.set_attributes(_span_attributes(attributes))
+
+
+def bind_context[T](func: Callable[..., T], *args: object) -> Callable[[], T]:
+    """Bind a call to the current context so that spans propagate into executor threads."""
+    return functools.partial(contextvars.copy_context().run, func, *args)
+
+
+def _span_attributes(attributes: dict[str, object]) -> dict[str, Any]:
+    return {
+        key: value if isinstance(value, str | bool | int | float) else str(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
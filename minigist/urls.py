@@ -0,0 +1,86 @@
+"""URL normalization used to recognize the same article behind different links."""
+
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAMETERS = frozenset(
+    {
+        "_hsenc",
+        "_hsmi",
+        "amp",
+        "cmpid",
+        "dclid",
+        "fbclid",
+        "gclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "msclkid",
+        "outputtype",
+        "ref",
+        "ref_src",
+        "ref_url",
+        "share",
+        "smid",
+        "yclid",
+    }
+)
+TRACKING_PARAMETER_PREFIXES = ("utm_", "at_", "pk_")
+AMP_CACHE_PATH = re.compile(r"^/(?:c/)?(?:s/)?(?P<target>[^/]+\.[^/]+/.*)$")
+AMP_PATH_SUFFIX = re.compile(r"(?<=[^/])/amp/?$|\.amp(?=\.html?$|$)")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _is_tracking_parameter(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in TRACKING_PARAMETERS or lowered.startswith(TRACKING_PARAMETER_PREFIXES)
+
+
+def _unwrap_amp_cache(scheme: str, host: str, path: str) -> tuple[str, str, str]:
+    """Map Google AMP viewer and AMP cache URLs back to the publisher URL."""
+    if host.endswith(".cdn.ampproject.org"):
+        cache_path = path
+    elif host in {"google.com", "www.google.com"} and path.startswith("/amp/"):
+        cache_path = path[len("/amp") :]
+    else:
+        return scheme, host, path
+
+    match = AMP_CACHE_PATH.match(cache_path)
+    if not match:
+        return scheme, host, path
+
+    target_host, _, target_path = match.group("target").partition("/")
+    return "https", target_host.lower(), "/" + target_path
+
+
+def canonicalize_url(url: str) -> str:
+    """Return a normalized form of an article URL for duplicate detection.
+
+    Scheme and host are lowercased, default ports and fragments are dropped, tracking
+    parameters are removed, the remaining query is sorted, and AMP variants are mapped
+    to the regular article URL.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if not scheme or not host:
+        return url
+
+    scheme, host, path = _unwrap_amp_cache(scheme, host, parts.path or "/")
+    host = host.removeprefix("amp.")
+    path = AMP_PATH_SUFFIX.sub("", path) or "/"
+
+    netloc = host if port is None or DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _is_tracking_parameter(name)
+        )
+    )
+    return urlunsplit((scheme, netloc, path, query, ""))
@@ -1,9 +1,37 @@
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import mock_open
 
 import pytest
 import yaml
 
+from minigist.models import Entry
+
+
+def make_entry(
+    entry_id: int,
+    feed_id: int = 1,
+    url: str | None = None,
+    content: str = "",
+    published_at: datetime | None = None,
+    starred: bool = False,
+) -> Entry:
+    """Build a Miniflux entry for tests, with defaults for everything a test does not care about."""
+    now = datetime.now()
+    return Entry(
+        id=entry_id,
+        user_id=1,
+        feed_id=feed_id,
+        title=f"Entry {entry_id}",
+        url=url or f"https://example.com/{entry_id}",
+        content=content,
+        hash="hash",
+        published_at=published_at or now,
+        created_at=now,
+        status="unread",
+        starred=starred,
+    )
+
 
 @pytest.fixture
 def valid_config_dict():
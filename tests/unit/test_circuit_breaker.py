@@ -0,0 +1,44 @@
+from minigist.circuit_breaker import CircuitBreaker, HostCircuitBreakers
+
+
+def test_breaker_opens_after_threshold_within_window():
+    breaker = CircuitBreaker(failure_threshold=3, window_seconds=60, cooldown_seconds=300)
+
+    assert not breaker.record_failure(now=0)
+    assert not breaker.record_failure(now=100)
+    assert not breaker.record_failure(now=110)
+    assert breaker.record_failure(now=120)
+    assert breaker.is_open(now=200)
+    assert breaker.allows(now=420)
+
+
+def test_breaker_reopens_when_probe_fails_and_closes_on_success():
+    breaker = CircuitBreaker(failure_threshold=1, window_seconds=60, cooldown_seconds=300)
+    breaker.record_failure(now=0)
+
+    assert breaker.record_failure(now=301)
+    assert breaker.is_open(now=400)
+
+    breaker.record_success()
+    assert breaker.allows(now=400)
+    assert not breaker.failures
+
+
+def test_host_breakers_persist_open_state(tmp_path):
+    path = tmp_path / "state" / "breakers.json"
+    breakers = HostCircuitBreakers(failure_threshold=1, window_seconds=60, cooldown_seconds=300, path=path)
+    breakers.record_failure("down.example.com")
+    breakers.record_failure("flaky.example.com")
+    breakers.record_success("flaky.example.com")
+    breakers.close()
+
+    reloaded = HostCircuitBreakers(failure_threshold=1, window_seconds=60, cooldown_seconds=300, path=path)
+    assert not reloaded.allows("down.example.com")
+    assert reloaded.allows("flaky.example.com")
+
+
+def test_host_breakers_ignore_corrupt_state(tmp_path):
+    path = tmp_path / "breakers.json"
+    path.write_text("[1, 2")
+
+    assert HostCircuitBreakers(failure_threshold=1, window_seconds=60, cooldown_seconds=300, path=path).allows("a")
@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = {"apprise", "markdown", "miniflux", "nh3", "openai", "trafilatura"}
+
+
+def imported_modules(module: str) -> set[str]:
+    """Import a module in a fresh interpreter and return the names of all modules loaded as a result."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestCliImports:
+    def test_cli_does_not_import_heavy_dependencies(self):
+        top_level_modules = {name.split(".", 1)[0] for name in imported_modules("minigist.cli")}
+
+        assert not HEAVY_MODULES & top_level_modules
@@ -66,3 +66,37 @@ def test_load_app_config_config_error():
         pytest.raises(ConfigError, match="No valid config file found"),
     ):
         load_app_config(Path("some/path"))
+
+
+def test_load_app_config_fallback_endpoints(valid_config_dict, mock_config_path):
+    valid_config_dict["llm"]["fallbacks"] = [{"id": "backup", "model": "backup-model", "timeout_seconds": 10}]
+    valid_config_dict["targets"][0]["llm_endpoint_id"] = "backup"
+    with (
+        patch("minigist.config.find_config_file", return_value=mock_config_path),
+        patch("minigist.config.load_config_from_file", return_value=valid_config_dict),
+    ):
+        result = load_app_config(Path("some/path"))
+
+    assert result.llm.fallbacks[0].id == "backup"
+    assert result.llm.fallbacks[0].api_key is None
+    assert result.targets[0].llm_endpoint_id == "backup"
+
+
+def test_load_app_config_duplicate_endpoint_ids(valid_config_dict, mock_config_path):
+    valid_config_dict["llm"]["fallbacks"] = [{"id": "primary", "model": "backup-model"}]
+    with (
+        patch("minigist.config.find_config_file", return_value=mock_config_path),
+        patch("minigist.config.load_config_from_file", return_value=valid_config_dict),
+        pytest.raises(ConfigError, match="LLM endpoint IDs must be unique"),
+    ):
+        load_app_config(Path("some/path"))
+
+
+def test_load_app_config_unknown_target_endpoint(valid_config_dict, mock_config_path):
+    valid_config_dict["targets"][0]["llm_endpoint_id"] = "missing"
+    with (
+        patch("minigist.config.find_config_file", return_value=mock_config_path),
+        patch("minigist.config.load_config_from_file", return_value=valid_config_dict),
+        pytest.raises(ConfigError, match="unknown llm_endpoint_id"),
+    ):
+        load_app_config(Path("some/path"))
@@ -0,0 +1,34 @@
+import asyncio
+import os
+
+from minigist.cpu_pool import CPUPool
+from minigist.downloader import extract_article_text
+from minigist.pipeline.update_worker import render_entry_content
+
+ARTICLE_HTML = (
+    "<html><body><article><h1>Title</h1>"
+    + "<p>This paragraph is long enough to be kept by the extractor as article text.</p>" * 5
+    + "</article></body></html>"
+)
+
+
+def test_stages_run_in_worker_processes():
+    pool = CPUPool(workers=2)
+    try:
+        assert pool.run(os.getpid) != os.getpid()
+        assert "long enough to be kept" in (pool.run(extract_article_text, ARTICLE_HTML) or "")
+        rendered = asyncio.run(pool.run_async(render_entry_content, "**Summary**", "<p>Original</p>"))
+    finally:
+        pool.close()
+
+    assert "<strong>Summary</strong>" in rendered
+    assert "<p>Original</p>" in rendered
+
+
+def test_stages_run_in_process_without_workers():
+    pool = CPUPool()
+
+    assert pool.run(os.getpid) == os.getpid()
+    assert asyncio.run(pool.run_async(os.getpid)) == os.getpid()
+    assert extract_article_text("<html><body></body></html>") is None
+    pool.close()
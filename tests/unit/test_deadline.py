@@ -0,0 +1,32 @@
+import time
+
+from minigist.deadline import RunDeadline
+from minigist.metrics import PipelineMetrics
+
+
+def test_deadline_admits_before_any_latency_is_known():
+    deadline = RunDeadline(1, PipelineMetrics(), llm_concurrency=1)
+
+    assert deadline.admits(queued_summaries=100)
+
+
+def test_deadline_projects_queued_summaries_per_llm_slot():
+    metrics = PipelineMetrics()
+    metrics.observe_stage("fetch", 1)
+    metrics.observe_stage("llm", 10)
+    metrics.observe_stage("update", 1)
+    deadline = RunDeadline(60, metrics, llm_concurrency=2, started_at=time.monotonic())
+
+    assert deadline.admits(queued_summaries=6)
+    assert not deadline.admits(queued_summaries=10)
+
+
+def test_deadline_uses_recent_latencies():
+    metrics = PipelineMetrics()
+    for _ in range(100):
+        metrics.observe_stage("llm", 100)
+    for _ in range(50):
+        metrics.observe_stage("llm", 1)
+
+    assert metrics.recent_stage_latency("llm") == 1
+    assert RunDeadline(5, metrics, llm_concurrency=1).admits(queued_summaries=0)
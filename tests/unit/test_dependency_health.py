@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+from minigist.pipeline import DependencyHealth
+
+
+def _health(critical: bool = True, abort_event: asyncio.Event | None = None) -> DependencyHealth:
+    return DependencyHealth(
+        "llm",
+        critical=critical,
+        abort_event=abort_event or asyncio.Event(),
+        failure_threshold=2,
+        base_cooldown_seconds=0.05,
+        max_cooldown_seconds=0.2,
+        max_trips=3,
+    )
+
+
+def test_breaker_trips_after_consecutive_failures_only():
+    async def run() -> DependencyHealth:
+        health = _health()
+        health.record_failure()
+        health.record_success()
+        health.record_failure()
+        assert health.opened_until is None
+        health.record_failure()
+        return health
+
+    health = asyncio.run(run())
+
+    assert health.opened_until is not None
+    assert health.trips == 1
+
+
+def test_stage_pauses_for_cooldown_and_lets_one_probe_through():
+    async def run() -> tuple[float, list[bool]]:
+        health = _health()
+        health.record_failure()
+        health.record_failure()
+        passed_while_open: list[bool] = []
+
+        async def caller() -> None:
+            await health.wait_until_available()
+            passed_while_open.append(health.opened_until is not None)
+            if health.probing:
+                await asyncio.sleep(0.01)
+                health.record_success()
+
+        started_at = time.monotonic()
+        await asyncio.gather(caller(), caller())
+        return time.monotonic() - started_at, passed_while_open
+
+    elapsed, passed_while_open = asyncio.run(run())
+
+    assert elapsed >= 0.05
+    assert passed_while_open == [True, False]
+
+
+def test_critical_dependency_that_stays_down_aborts_the_run():
+    async def run(critical: bool) -> tuple[DependencyHealth, asyncio.Event]:
+        abort_event = asyncio.Event()
+        health = _health(critical=critical, abort_event=abort_event)
+        health.record_failure()
+        health.record_failure()
+        for _ in range(2):
+            await health.wait_until_available()
+            health.record_failure()
+        return health, abort_event
+
+    health, abort_event = asyncio.run(run(critical=True))
+    assert health.is_down
+    assert abort_event.is_set()
+
+    health, abort_event = asyncio.run(run(critical=False))
+    assert not health.is_down
+    assert not abort_event.is_set()
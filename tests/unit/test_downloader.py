@@ -1,7 +1,13 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
 import pytest
 
-from minigist.config import ScrapingConfig
-from minigist.downloader import Downloader
+from minigist.circuit_breaker import HostCircuitBreakers
+from minigist.config import HostCircuitBreakerConfig, HttpCacheConfig, ScrapingConfig
+from minigist.downloader import Downloader, looks_complete
+from minigist.exceptions import ArticleFetchError, HostUnavailableError
 
 
 class TestDownloaderShouldUsePure:
@@ -49,3 +55,98 @@ class TestDownloaderShouldUsePure:
         downloader = Downloader(scraping_config=config)
         assert not downloader._should_use_pure("https://example.com/article", log_context)
         assert config.pure_base_urls == []
+
+
+class TestDownloaderRequestHost:
+    def test_request_host_is_article_host_for_direct_fetches(self):
+        downloader = Downloader(scraping_config=ScrapingConfig(pure_api_token="test_token"))
+        assert downloader.request_host("https://News.Example.com/a") == "news.example.com"
+
+    def test_request_host_is_pure_host_when_pure_is_used(self):
+        config = ScrapingConfig(pure_api_token="test_token", pure_base_urls=["https://example.com/"])
+        downloader = Downloader(scraping_config=config)
+        assert downloader.request_host("https://example.com/a") == "pure.md"
+        assert downloader.request_host("https://other.org/a", force_use_pure=True) == "pure.md"
+
+
+class TestDownloaderHttpCache:
+    ARTICLE_HTML = "<html><body><article><p>" + "Cached article text. " * 40 + "</p></article></body></html>"
+
+    def test_revalidates_and_reuses_extracted_text(self, tmp_path, monkeypatch):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(200, text=self.ARTICLE_HTML, headers={"etag": '"v1"'})
+
+        config = ScrapingConfig(cache=HttpCacheConfig(enabled=True, path=tmp_path / "cache.sqlite3"))
+        downloader = Downloader(scraping_config=config)
+        downloader.http_session = httpx.Client(transport=httpx.MockTransport(handler))
+        extract = MagicMock(wraps=downloader._extract_text)
+        monkeypatch.setattr(downloader, "_extract_text", extract)
+
+        first = downloader.fetch_content("https://example.com/a", {})
+        second = downloader.fetch_content("https://example.com/a", {})
+
+        assert first == second
+        assert [request.headers.get("if-none-match") for request in requests] == [None, '"v1"']
+        assert extract.call_count == 1
+        downloader.close()
+
+
+class TestDownloaderCircuitBreaker:
+    def test_failing_host_is_skipped_and_state_persists(self, tmp_path):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(503)
+
+        breaker_path = tmp_path / "breakers.json"
+        config = ScrapingConfig(
+            circuit_breaker=HostCircuitBreakerConfig(enabled=True, failure_threshold=2, path=breaker_path)
+        )
+        downloader = Downloader(scraping_config=config)
+        downloader.http_session = httpx.Client(transport=httpx.MockTransport(handler))
+
+        for _ in range(2):
+            with pytest.raises(ArticleFetchError):
+                downloader.fetch_content("https://down.example.com/a", {})
+        with pytest.raises(HostUnavailableError):
+            downloader.fetch_content("https://down.example.com/b", {})
+        downloader.close()
+
+        assert len(requests) == 2
+        assert not HostCircuitBreakers(2, 60, 60, path=breaker_path).allows("down.example.com")
+
+
+class TestLooksComplete:
+    def test_short_or_truncated_text_is_incomplete(self):
+        assert not looks_complete("Too short", min_length=100)
+        assert not looks_complete("Long enough text. " * 10 + "Continue reading", min_length=100)
+        assert not looks_complete("Long enough text. " * 10 + "[…]", min_length=100)
+
+    def test_long_text_is_complete(self):
+        assert looks_complete("Long enough text. " * 10, min_length=100)
+
+
+class TestDownloaderReservePureRequest:
+    def test_optional_pure_request_is_skipped_when_rate_limit_is_exhausted(self, tmp_path):
+        config = ScrapingConfig(pure_base_urls=["https://example.com/"], pure_rate_limit_path=tmp_path / "limit.json")
+        downloader = Downloader(scraping_config=config)
+
+        async def reserve_all() -> list[bool]:
+            return [await downloader.reserve_pure_request("https://example.com/a", False, {}) for _ in range(7)]
+
+        assert asyncio.run(reserve_all()) == [True] * 6 + [False]
+        assert downloader.metrics.to_dict()["counters"]["pure_rate_limited_total"]
+
+    def test_pure_request_is_not_limited_with_api_token(self):
+        downloader = Downloader(scraping_config=ScrapingConfig(pure_api_token="test_token"))
+
+        async def reserve_all() -> list[bool]:
+            return [await downloader.reserve_pure_request("https://example.com/a", False, {}) for _ in range(10)]
+
+        assert all(asyncio.run(reserve_all()))
@@ -0,0 +1,441 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import urlparse
+
+import pytest
+
+from minigist.deadline import RunDeadline
+from minigist.exceptions import ArticleFetchError, ArticleTransportError, HostUnavailableError
+from minigist.fetch_methods import FetchMethodMemory
+from minigist.metrics import PipelineMetrics
+from minigist.models import Entry
+from minigist.pipeline import DependencyHealth, FeedTarget, FetchWorker, HostScheduler, PrioritizedItem
+from tests.conftest import make_entry
+
+
+def _worker(feed_target_map: dict[int, FeedTarget], downloader: MagicMock | None = None) -> FetchWorker:
+    downloader = downloader or MagicMock()
+    downloader.uses_pure.return_value = False
+    return FetchWorker(
+        downloader=downloader,
+        total_considered_entries=0,
+        use_targets=True,
+        feed_target_map=feed_target_map,
+        default_prompt_id="default",
+        host_scheduler=HostScheduler(per_host_concurrency=1, per_host_delay_seconds=0, timeout_seconds=5),
+        record_failure=MagicMock(),
+        abort_event=asyncio.Event(),
+        metrics=PipelineMetrics(),
+    )
+
+
+def test_group_duplicates_merges_same_article_with_same_target():
+    target = FeedTarget(prompt_id="default", use_pure=False)
+    worker = _worker({1: target, 2: target})
+    entries = [
+        make_entry(1, 1, "https://example.com/story?utm_source=feed-a"),
+        make_entry(2, 2, "https://example.com/story?utm_source=feed-b"),
+        make_entry(3, 1, "https://example.com/other"),
+    ]
+
+    groups = worker._group_duplicates(entries)
+
+    assert [(entry.id, [duplicate.id for duplicate in duplicates]) for entry, duplicates in groups] == [
+        (1, [2]),
+        (3, []),
+    ]
+    assert worker.duplicates_merged == 1
+
+
+def test_group_duplicates_keeps_entries_with_different_prompts_apart():
+    worker = _worker(
+        {
+            1: FeedTarget(prompt_id="short", use_pure=False),
+            2: FeedTarget(prompt_id="long", use_pure=False),
+        }
+    )
+    entries = [make_entry(1, 1, "https://example.com/story"), make_entry(2, 2, "https://example.com/story")]
+
+    assert len(worker._group_duplicates(entries)) == 2
+
+
+def test_group_duplicates_merges_entries_of_targets_that_differ_only_in_scheduling():
+    worker = _worker(
+        {
+            1: FeedTarget(prompt_id="default", use_pure=False, weight=1.0),
+            2: FeedTarget(prompt_id="default", use_pure=False, weight=3.0),
+        }
+    )
+    entries = [make_entry(1, 1, "https://example.com/story"), make_entry(2, 2, "https://example.com/story")]
+
+    groups = worker._group_duplicates(entries)
+
+    assert [(entry.id, [duplicate.id for duplicate in duplicates]) for entry, duplicates in groups] == [(1, [2])]
+
+
+def test_group_duplicates_never_merges_entries_without_target():
+    worker = _worker({})
+    entries = [make_entry(1, 1, "https://example.com/story"), make_entry(2, 1, "https://example.com/story")]
+
+    assert len(worker._group_duplicates(entries)) == 2
+
+
+def _load_article_text(worker: FetchWorker, target: FeedTarget, entry: Entry) -> str:
+    async def main() -> str:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return await worker._load_article_text(asyncio.get_running_loop(), entry, target, {}, executor, None)
+
+    return asyncio.run(main())
+
+
+def test_auto_content_source_uses_complete_feed_text_without_fetching():
+    downloader = MagicMock()
+    downloader.extract_feed_content.return_value = "Full feed text. " * 100
+    worker = _worker({}, downloader)
+    target = FeedTarget(prompt_id="default", use_pure=False, content_source="auto")
+
+    text = _load_article_text(worker, target, make_entry(1, 1, "https://example.com/story"))
+
+    assert text.startswith("Full feed text.")
+    downloader.fetch_content.assert_not_called()
+
+
+def test_auto_content_source_falls_back_to_web_for_teasers():
+    downloader = MagicMock()
+    downloader.extract_feed_content.return_value = "A short teaser. Read more"
+    downloader.fetch_content.return_value = "Fetched page text"
+    worker = _worker({}, downloader)
+    target = FeedTarget(prompt_id="default", use_pure=False, content_source="auto")
+
+    text = _load_article_text(worker, target, make_entry(1, 1, "https://example.com/story"))
+
+    assert text == "Fetched page text"
+
+
+def test_feed_content_source_never_fetches():
+    downloader = MagicMock()
+    downloader.extract_feed_content.side_effect = ArticleFetchError("no content")
+    worker = _worker({}, downloader)
+    target = FeedTarget(prompt_id="default", use_pure=False, content_source="feed")
+
+    with pytest.raises(ArticleFetchError):
+        _load_article_text(worker, target, make_entry(1, 1, "https://example.com/story"))
+    downloader.fetch_content.assert_not_called()
+
+
+def test_fetch_worker_defers_entries_after_deadline():
+    metrics = PipelineMetrics()
+    metrics.observe_stage("llm", 60)
+    downloader = MagicMock()
+    downloader.request_host.return_value = "example.com"
+    worker = _worker({1: FeedTarget(prompt_id="default", use_pure=False)}, downloader)
+    worker.metrics = metrics
+    worker.deadline = RunDeadline(1, metrics, llm_concurrency=1)
+    entries = [make_entry(1, 1, "https://example.com/a"), make_entry(2, 1, "https://example.com/b")]
+    in_queue: asyncio.PriorityQueue[PrioritizedItem] = asyncio.PriorityQueue()
+
+    async def run() -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await worker.run(asyncio.get_running_loop(), entries, in_queue, executor, 1, 1)
+
+    asyncio.run(run())
+
+    assert worker.deferred == 2
+    assert in_queue.qsize() == 1
+    downloader.fetch_content.assert_not_called()
+
+
+def _strategy_downloader(direct_delay: float = 0, direct_fails: bool = False) -> MagicMock:
+    def fetch_content(url, log_context, force_use_pure, timeout, use_pure):
+        if use_pure:
+            return "pure.md text"
+        time.sleep(direct_delay)
+        if direct_fails:
+            raise ArticleFetchError("extraction failed")
+        return "direct text"
+
+    downloader = MagicMock()
+    downloader.request_host.side_effect = lambda url, use_pure=False: "pure.md" if use_pure else "example.com"
+    downloader.reserve_pure_request = AsyncMock(return_value=True)
+    downloader.fetch_content.side_effect = fetch_content
+    return downloader
+
+
+def test_fallback_strategy_tries_pure_after_direct_fetch_fails(tmp_path):
+    downloader = _strategy_downloader(direct_fails=True)
+    worker = _worker({}, downloader)
+    worker.strategy = "fallback"
+    worker.fetch_methods = FetchMethodMemory(tmp_path / "methods.json")
+
+    text = _load_article_text(
+        worker, FeedTarget(prompt_id="default", use_pure=False), make_entry(1, 1, "https://example.com/a")
+    )
+
+    assert text == "pure.md text"
+    assert worker.fetch_methods.preferred("example.com") == "pure"
+
+
+def test_fallback_strategy_starts_with_the_method_that_last_succeeded(tmp_path):
+    downloader = _strategy_downloader()
+    worker = _worker({}, downloader)
+    worker.strategy = "fallback"
+    worker.fetch_methods = FetchMethodMemory(tmp_path / "methods.json")
+    worker.fetch_methods.record_success("example.com", "pure")
+
+    text = _load_article_text(
+        worker, FeedTarget(prompt_id="default", use_pure=False), make_entry(1, 1, "https://example.com/a")
+    )
+
+    assert text == "pure.md text"
+    assert downloader.fetch_content.call_count == 1
+
+
+def test_race_strategy_keeps_the_first_article_text():
+    downloader = _strategy_downloader(direct_delay=0.5)
+    worker = _worker({}, downloader)
+    worker.strategy = "race"
+
+    text = _load_article_text(
+        worker, FeedTarget(prompt_id="default", use_pure=False), make_entry(1, 1, "https://example.com/a")
+    )
+
+    assert text == "pure.md text"
+
+
+def test_fetch_method_memory_persists_across_runs(tmp_path):
+    path = tmp_path / "state" / "methods.json"
+    memory = FetchMethodMemory(path)
+    memory.record_success("example.com", "pure")
+    memory.close()
+
+    assert FetchMethodMemory(path).preferred("example.com") == "pure"
+
+
+def test_fetch_worker_defers_entries_of_unavailable_hosts():
+    downloader = MagicMock()
+    downloader.request_host.return_value = "down.example.com"
+    downloader.fetch_content.side_effect = HostUnavailableError("Circuit breaker is open for down.example.com")
+    record_failure = MagicMock()
+    worker = _worker({1: FeedTarget(prompt_id="default", use_pure=False)}, downloader)
+    worker.record_failure = record_failure
+    in_queue: asyncio.PriorityQueue[PrioritizedItem] = asyncio.PriorityQueue()
+
+    async def run() -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await worker.run(
+                asyncio.get_running_loop(), [make_entry(1, 1, "https://down.example.com/a")], in_queue, executor, 1, 1
+            )
+
+    asyncio.run(run())
+
+    assert worker.deferred == 1
+    record_failure.assert_not_called()
+
+
+def test_entries_waiting_for_a_busy_host_do_not_hold_fetch_slots():
+    finished_at: dict[str, list[float]] = {}
+    started = time.monotonic()
+
+    def fetch_content(url, log_context, force_use_pure, timeout, use_pure):
+        host = urlparse(url).hostname or ""
+        time.sleep(0.2 if host == "slow.example.com" else 0.01)
+        finished_at.setdefault(host, []).append(time.monotonic() - started)
+        return "Article text"
+
+    downloader = MagicMock()
+    downloader.uses_pure.return_value = False
+    downloader.request_host.side_effect = lambda url, force_use_pure=False, use_pure=None: urlparse(url).hostname
+    downloader.fetch_content.side_effect = fetch_content
+    worker = _worker({1: FeedTarget(prompt_id="default", use_pure=False)}, downloader)
+    hosts = ["slow.example.com", "a.example.com", "b.example.com"]
+    entries = [make_entry(index, 1, f"https://{hosts[index % 3]}/{index}") for index in range(24)]
+    in_queue: asyncio.PriorityQueue[PrioritizedItem] = asyncio.PriorityQueue()
+
+    async def run() -> None:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            await worker.run(asyncio.get_running_loop(), entries, in_queue, executor, 1, 4)
+
+    asyncio.run(run())
+
+    assert in_queue.qsize() == 25
+    assert max(finished_at["a.example.com"] + finished_at["b.example.com"]) < 0.5
+    assert max(finished_at["slow.example.com"]) >= 1.6
+
+
+def test_direct_fetches_do_not_wait_behind_pure_rate_limiting():
+    finished_at: dict[str, list[float]] = {}
+    started = time.monotonic()
+
+    async def reserve_pure_request(url, force_use_pure, log_context):
+        await asyncio.sleep(0.3)
+        return True
+
+    def fetch_content(url, log_context, force_use_pure, timeout, use_pure):
+        finished_at.setdefault("pure" if use_pure else "direct", []).append(time.monotonic() - started)
+        return "Article text"
+
+    downloader = MagicMock()
+    downloader.uses_pure.side_effect = lambda url, force_use_pure=False: force_use_pure
+    downloader.request_host.side_effect = lambda url, force_use_pure=False, use_pure=None: (
+        "pure.md" if force_use_pure or use_pure else urlparse(url).hostname
+    )
+    downloader.reserve_pure_request = AsyncMock(side_effect=reserve_pure_request)
+    downloader.fetch_content.side_effect = fetch_content
+    worker = _worker(
+        {1: FeedTarget(prompt_id="default", use_pure=True), 2: FeedTarget(prompt_id="default", use_pure=False)},
+        downloader,
+    )
+    entries = [make_entry(1, 1, "https://a.example.com/1"), make_entry(2, 1, "https://a.example.com/2")] + [
+        make_entry(index, 2, f"https://{host}.example.com/{index}") for index, host in enumerate("bcd", 3)
+    ]
+    in_queue: asyncio.PriorityQueue[PrioritizedItem] = asyncio.PriorityQueue()
+
+    async def run() -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await worker.run(asyncio.get_running_loop(), entries, in_queue, executor, 1, 1)
+
+    asyncio.run(run())
+
+    assert len(finished_at["direct"]) == 3
+    assert max(finished_at["direct"]) < 0.25
+    assert min(finished_at["pure"]) >= 0.3
+
+
+@pytest.mark.parametrize(
+    ("error", "urls", "trips_breaker"),
+    [
+        (ArticleFetchError, [f"https://junk{index}.example.com/story" for index in range(6)], False),
+        (ArticleTransportError, [f"https://down.example.com/{index}" for index in range(6)], False),
+        (ArticleTransportError, [f"https://down{index}.example.com/story" for index in range(6)], True),
+    ],
+)
+def test_scraping_breaker_counts_transport_failures_on_distinct_hosts(
+    error: type[ArticleFetchError], urls: list[str], trips_breaker: bool
+):
+    def fetch_content(url, log_context, force_use_pure, timeout, use_pure):
+        if "good" in url:
+            return "Article text"
+        raise error(f"Failed to fetch {url}")
+
+    downloader = MagicMock()
+    downloader.request_host.side_effect = lambda url, force_use_pure=False, use_pure=None: urlparse(url).hostname
+    downloader.fetch_content.side_effect = fetch_content
+    worker = _worker({1: FeedTarget(prompt_id="default", use_pure=False)}, downloader)
+    entries = [make_entry(0, 1, "https://good.example.com/story")]
+    entries += [make_entry(index, 1, url) for index, url in enumerate(urls, 1)]
+    in_queue: asyncio.PriorityQueue[PrioritizedItem] = asyncio.PriorityQueue()
+
+    async def run() -> DependencyHealth:
+        health = DependencyHealth(
+            "scraping", critical=False, abort_event=worker.abort_event, failure_threshold=3, base_cooldown_seconds=0.01
+        )
+        worker.health = health
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await worker.run(asyncio.get_running_loop(), entries, in_queue, executor, 1, 1)
+        return health
+
+    health = asyncio.run(run())
+
+    assert (health.trips > 0) == trips_breaker
+    assert in_queue.qsize() == 2
+
+
+def test_fetches_start_in_priority_order_across_hosts():
+    started: list[str] = []
+
+    def fetch_content(url, log_context, force_use_pure, timeout, use_pure):
+        started.append(url)
+        return "Article text"
+
+    downloader = MagicMock()
+    downloader.request_host.side_effect = lambda url, force_use_pure=False, use_pure=None: urlparse(url).hostname
+    downloader.fetch_content.side_effect = fetch_content
+    worker = _worker({1: FeedTarget(prompt_id="default", use_pure=False)}, downloader)
+    urls = ["https://a.example.com/1", "https://a.example.com/2", "https://b.example.com/3", "https://c.example.com/4"]
+    entries = [make_entry(index, 1, url) for index, url in enumerate(urls)]
+    in_queue: asyncio.PriorityQueue[PrioritizedItem] = asyncio.PriorityQueue()
+
+    async def run() -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await worker.run(asyncio.get_running_loop(), entries, in_queue, executor, 1, 1)
+
+    asyncio.run(run())
+
+    assert started == urls
+
+
+def test_entries_summarized_from_feed_content_do_not_wait_for_a_busy_host():
+    extracted_at: list[float] = []
+    started = time.monotonic()
+
+    def fetch_content(url, log_context, force_use_pure, timeout, use_pure):
+        time.sleep(0.3)
+        return "Article text"
+
+    def extract_feed_content(content, url, log_context):
+        extracted_at.append(time.monotonic() - started)
+        return "Full feed text. " * 100
+
+    downloader = MagicMock()
+    downloader.request_host.side_effect = lambda url, force_use_pure=False, use_pure=None: urlparse(url).hostname
+    downloader.fetch_content.side_effect = fetch_content
+    downloader.extract_feed_content.side_effect = extract_feed_content
+    worker = _worker(
+        {
+            1: FeedTarget(prompt_id="default", use_pure=False),
+            2: FeedTarget(prompt_id="default", use_pure=False, content_source="feed"),
+        },
+        downloader,
+    )
+    entries = [make_entry(1, 1, "https://example.com/slow")]
+    entries += [make_entry(index, 2, f"https://example.com/{index}") for index in range(2, 6)]
+    in_queue: asyncio.PriorityQueue[PrioritizedItem] = asyncio.PriorityQueue()
+
+    async def run() -> None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            await worker.run(asyncio.get_running_loop(), entries, in_queue, executor, 1, 2)
+
+    asyncio.run(run())
+
+    assert in_queue.qsize() == 6
+    assert max(extracted_at) < 0.2
+
+
+def test_feed_entries_needing_a_download_give_up_their_fetch_slot_while_the_host_is_busy():
+    finished_at: dict[str, float] = {}
+    started = time.monotonic()
+
+    def fetch_content(url, log_context, force_use_pure, timeout, use_pure):
+        time.sleep(0.3 if "slow" in url else 0.01)
+        finished_at[url] = time.monotonic() - started
+        return "Article text"
+
+    downloader = MagicMock()
+    downloader.request_host.side_effect = lambda url, force_use_pure=False, use_pure=None: urlparse(url).hostname
+    downloader.fetch_content.side_effect = fetch_content
+    downloader.extract_feed_content.return_value = "A short teaser. Read more"
+    worker = _worker(
+        {
+            1: FeedTarget(prompt_id="default", use_pure=False),
+            2: FeedTarget(prompt_id="default", use_pure=False, content_source="auto"),
+        },
+        downloader,
+    )
+    entries = [
+        make_entry(1, 1, "https://a.example.com/slow"),
+        make_entry(2, 2, "https://a.example.com/teaser"),
+        make_entry(3, 1, "https://b.example.com/story"),
+    ]
+    in_queue: asyncio.PriorityQueue[PrioritizedItem] = asyncio.PriorityQueue()
+
+    async def run() -> None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            await worker.run(asyncio.get_running_loop(), entries, in_queue, executor, 1, 2)
+
+    asyncio.run(run())
+
+    assert in_queue.qsize() == 4
+    assert finished_at["https://b.example.com/story"] < 0.2
+    assert finished_at["https://a.example.com/teaser"] >= 0.3
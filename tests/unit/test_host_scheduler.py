@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+from minigist.pipeline.host_scheduler import HostScheduler
+
+
+def test_slot_limits_concurrency_per_host_but_not_across_hosts():
+    scheduler = HostScheduler(per_host_concurrency=1, per_host_delay_seconds=0, timeout_seconds=5)
+    active: dict[str, int] = {"slow": 0, "fast": 0}
+    peak: dict[str, int] = {"slow": 0, "fast": 0}
+
+    async def fetch(host: str) -> None:
+        async with scheduler.slot(host):
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+
+    async def main() -> float:
+        started_at = time.monotonic()
+        await asyncio.gather(*(fetch("slow") for _ in range(3)), *(fetch("fast") for _ in range(3)))
+        return time.monotonic() - started_at
+
+    elapsed = asyncio.run(main())
+
+    assert peak == {"slow": 1, "fast": 1}
+    assert elapsed < 0.06
+
+
+def test_slot_enforces_politeness_delay():
+    scheduler = HostScheduler(per_host_concurrency=2, per_host_delay_seconds=0.05, timeout_seconds=5)
+    started: list[float] = []
+
+    async def fetch() -> None:
+        async with scheduler.slot("example.com"):
+            started.append(time.monotonic())
+
+    async def main() -> None:
+        await asyncio.gather(fetch(), fetch())
+
+    asyncio.run(main())
+
+    assert started[1] - started[0] >= 0.045
+
+
+def test_timeout_adapts_to_observed_latency():
+    scheduler = HostScheduler(per_host_concurrency=4, per_host_delay_seconds=0, timeout_seconds=10)
+
+    async def main() -> None:
+        for _ in range(3):
+            async with scheduler.slot("fast.example"):
+                pass
+
+    assert scheduler.timeout_for("fast.example") == 10
+    asyncio.run(main())
+
+    assert scheduler.timeout_for("fast.example") == 1.0
+    assert scheduler.timeout_for("unknown.example") == 10
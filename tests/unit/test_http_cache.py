@@ -0,0 +1,79 @@
+import random
+import time
+
+import httpx
+
+from minigist.http_cache import HttpCache, freshness_lifetime
+
+
+def test_freshness_lifetime_honors_cache_control():
+    assert freshness_lifetime(httpx.Headers({"cache-control": "no-store, max-age=60"})) is None
+    assert freshness_lifetime(httpx.Headers({"cache-control": "no-cache"})) == 0
+    assert freshness_lifetime(httpx.Headers({"cache-control": "public, max-age=60", "age": "10"})) == 50
+
+
+def test_freshness_lifetime_uses_expires_and_last_modified_heuristic():
+    expires = httpx.Headers(
+        {
+            "date": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "expires": "Mon, 01 Jan 2024 00:02:00 GMT",
+        }
+    )
+    heuristic = httpx.Headers(
+        {
+            "date": "Mon, 01 Jan 2024 10:00:00 GMT",
+            "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+    )
+
+    assert freshness_lifetime(expires) == 120
+    assert freshness_lifetime(heuristic) == 3600
+    assert freshness_lifetime(httpx.Headers()) == 0
+
+
+def test_store_and_revalidate_response(tmp_path):
+    cache = HttpCache(tmp_path / "cache.sqlite3", max_size_bytes=1_000_000)
+    cache.store_response("https://example.com/a", "<p>Body</p>", httpx.Headers({"etag": '"v1"'}))
+
+    cached = cache.get_response("https://example.com/a")
+
+    assert cached is not None
+    assert cached.body == "<p>Body</p>"
+    assert not cached.is_fresh()
+    assert cached.validators() == {"If-None-Match": '"v1"'}
+
+    cache.refresh_response(cached, httpx.Headers({"cache-control": "max-age=300"}))
+    refreshed = cache.get_response("https://example.com/a")
+
+    assert refreshed is not None
+    assert refreshed.is_fresh()
+    cache.close()
+
+
+def test_responses_without_validators_or_freshness_are_not_stored(tmp_path):
+    cache = HttpCache(tmp_path / "cache.sqlite3", max_size_bytes=1_000_000)
+    cache.store_response("https://example.com/a", "<p>Body</p>", httpx.Headers())
+    cache.store_response("https://example.com/b", "<p>Body</p>", httpx.Headers({"cache-control": "no-store"}))
+
+    assert cache.get_response("https://example.com/a") is None
+    assert cache.get_response("https://example.com/b") is None
+    cache.close()
+
+
+def test_eviction_drops_least_recently_used_rows(tmp_path):
+    cache = HttpCache(tmp_path / "cache.sqlite3", max_size_bytes=2_500)
+    headers = httpx.Headers({"cache-control": "max-age=60"})
+    bodies = {url: random.Random(url).randbytes(1_000).hex() for url in ("a", "b", "c")}
+
+    cache.store_response("a", bodies["a"], headers)
+    time.sleep(0.01)
+    cache.store_extracted_text("b", "digest", bodies["b"])
+    time.sleep(0.01)
+    cache.get_response("a")
+    time.sleep(0.01)
+    cache.store_response("c", bodies["c"], headers)
+
+    assert cache.get_response("a") is not None
+    assert cache.get_extracted_text("b", "digest") is None
+    assert cache.get_response("c") is not None
+    cache.close()
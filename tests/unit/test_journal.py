@@ -0,0 +1,70 @@
+import sqlite3
+
+from minigist.journal import EntryJournal, JournaledSummary
+
+
+def test_pending_summaries_track_latest_stage(tmp_path):
+    journal = EntryJournal(tmp_path / "journal.sqlite3")
+    journal.record_fetched(1)
+    journal.record_summarized(1, "First", "model-a", "hash-a")
+    journal.record_fetched(2)
+    journal.record_summarized(2, "Second", None, "hash-a")
+    journal.record_updated(2)
+    journal.record_fetched(3)
+
+    assert journal.pending_summaries() == {
+        1: JournaledSummary(entry_id=1, summary="First", model="model-a", prompt_hash="hash-a")
+    }
+    journal.close()
+
+
+def test_pending_summaries_survive_reopen(tmp_path):
+    path = tmp_path / "state" / "journal.sqlite3"
+    journal = EntryJournal(path)
+    journal.record_summarized(5, "Kept", "model-a", "hash-a")
+    journal.close()
+
+    reopened = EntryJournal(path)
+
+    assert reopened.pending_summaries()[5].summary == "Kept"
+    assert reopened._connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    reopened.close()
+
+
+def test_prune_drops_finished_and_expired_entries(tmp_path):
+    path = tmp_path / "journal.sqlite3"
+    journal = EntryJournal(path)
+    journal.record_summarized(1, "Done", None, "hash-a")
+    journal.record_updated(1)
+    journal.record_summarized(2, "Pending", None, "hash-a")
+    journal.record_summarized(3, "Stale", None, "hash-a")
+    journal._connection.execute("UPDATE entry_events SET recorded_at = 0 WHERE entry_id = 3")
+
+    journal.prune(max_age_seconds=60)
+
+    remaining = {row[0] for row in sqlite3.connect(path).execute("SELECT entry_id FROM entry_events")}
+    assert remaining == {2}
+    journal.close()
+
+
+def test_journal_without_prompt_hash_column_is_migrated(tmp_path):
+    path = tmp_path / "journal.sqlite3"
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE entry_events (seq INTEGER PRIMARY KEY AUTOINCREMENT, entry_id INTEGER NOT NULL, "
+        "stage TEXT NOT NULL, summary TEXT, model TEXT, recorded_at REAL NOT NULL)"
+    )
+    connection.execute(
+        "INSERT INTO entry_events (entry_id, stage, summary, model, recorded_at) "
+        "VALUES (1, 'summarized', 'Old', NULL, 0)"
+    )
+    connection.commit()
+    connection.close()
+
+    journal = EntryJournal(path)
+    journal.record_summarized(2, "New", None, "hash-a")
+
+    pending = journal.pending_summaries()
+    assert pending[1].prompt_hash is None
+    assert pending[2].prompt_hash == "hash-a"
+    journal.close()
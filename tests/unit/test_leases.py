@@ -0,0 +1,43 @@
+import time
+
+from minigist.leases import SQLiteLeaseBackend, new_lease_owner
+
+
+def test_instances_claim_disjoint_batches(tmp_path):
+    first = SQLiteLeaseBackend(tmp_path / "leases.sqlite3")
+    second = SQLiteLeaseBackend(tmp_path / "leases.sqlite3")
+    entry_ids = list(range(1, 11))
+
+    claimed_first = first.claim(entry_ids, "first", ttl_seconds=60, limit=4)
+    claimed_second = second.claim(entry_ids, "second", ttl_seconds=60)
+
+    assert claimed_first == [1, 2, 3, 4]
+    assert claimed_second == [5, 6, 7, 8, 9, 10]
+    first.close()
+    second.close()
+
+
+def test_expired_and_released_leases_can_be_claimed_again(tmp_path):
+    backend = SQLiteLeaseBackend(tmp_path / "leases.sqlite3")
+    backend.claim([1], "crashed", ttl_seconds=0.01)
+    backend.claim([2, 3], "finished", ttl_seconds=60)
+    backend.release([3], "finished")
+    time.sleep(0.02)
+
+    assert backend.claim([1, 2, 3], "next", ttl_seconds=60) == [1, 3]
+    backend.close()
+
+
+def test_renew_keeps_leases_from_expiring(tmp_path):
+    backend = SQLiteLeaseBackend(tmp_path / "leases.sqlite3")
+    backend.claim([1], "slow", ttl_seconds=0.01)
+    backend.renew("slow", ttl_seconds=60)
+    time.sleep(0.02)
+
+    assert backend.claim([1], "other", ttl_seconds=60) == []
+    assert backend.claim([1], "slow", ttl_seconds=60) == [1]
+    backend.close()
+
+
+def test_lease_owners_are_unique_per_run():
+    assert new_lease_owner() != new_lease_owner()
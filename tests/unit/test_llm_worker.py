@@ -0,0 +1,38 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from minigist.exceptions import LLMContentRejectedError, LLMServiceError
+from minigist.metrics import PipelineMetrics
+from minigist.pipeline import LLMWorker
+
+
+def _worker(error: LLMServiceError) -> tuple[LLMWorker, AsyncMock]:
+    summarizer = MagicMock()
+    generate_summary = AsyncMock(side_effect=error)
+    summarizer.generate_summary = generate_summary
+    worker = LLMWorker(
+        summarizer=summarizer,
+        prompt_lookup={"default": "Prompt"},
+        record_failure=MagicMock(),
+        abort_event=asyncio.Event(),
+        metrics=PipelineMetrics(),
+    )
+    return worker, generate_summary
+
+
+def test_rejected_content_is_not_retried():
+    worker, generate_summary = _worker(LLMContentRejectedError("LLM model indicated an error in its output"))
+
+    with pytest.raises(LLMContentRejectedError):
+        asyncio.run(worker._retry_generate_summary("Text", "default", None, {}))
+    assert generate_summary.await_count == 1
+
+
+def test_service_errors_are_retried():
+    worker, generate_summary = _worker(LLMServiceError("provider down"))
+
+    with pytest.raises(LLMServiceError):
+        asyncio.run(worker._retry_generate_summary("Text", "default", None, {}))
+    assert generate_summary.await_count == 3
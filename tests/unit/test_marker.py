@@ -0,0 +1,50 @@
+import nh3
+
+from minigist.constants import WATERMARK_DETECTOR
+from minigist.marker import SummaryMarker, is_summarized, parse_marker
+from minigist.pipeline.update_worker import render_entry_content
+
+# Roughly the allowlist Miniflux applies to entry content: no comments, links limited to http(s) hrefs.
+MINIFLUX_TAGS = {"a", "p", "em", "strong", "hr", "ul", "ol", "li"}
+MINIFLUX_ATTRIBUTES = {"a": {"href"}}
+
+
+def _sanitize_like_miniflux(content: str) -> str:
+    return nh3.clean(
+        content,
+        tags=MINIFLUX_TAGS,
+        attributes=MINIFLUX_ATTRIBUTES,
+        url_schemes={"http", "https"},
+        link_rel="noopener noreferrer",
+        strip_comments=True,
+    )
+
+
+def test_marker_round_trips_through_rendered_content():
+    marker = SummaryMarker("0123456789abcdef", model="vendor/model name --v2", created_at=1_700_000_000)
+    content = render_entry_content("A summary.", "<p>Original</p>", marker)
+
+    assert parse_marker(content) == marker
+    assert is_summarized(content)
+
+
+def test_marker_survives_miniflux_sanitizing():
+    marker = SummaryMarker("0123456789abcdef", model="vendor/model (preview)", created_at=1_700_000_000)
+    content = _sanitize_like_miniflux(render_entry_content("A *summary*.", "<p>Original</p>", marker))
+
+    assert parse_marker(content) == marker
+
+
+def test_legacy_comment_marker_is_still_read():
+    content = "<!-- minigist:v1 prompt=0123456789abcdef model=vendor%2Fmodel at=1700000000 --><p>Summary</p>"
+
+    assert parse_marker(content) == SummaryMarker("0123456789abcdef", "vendor/model", 1_700_000_000, version=1)
+    assert is_summarized(content)
+
+
+def test_content_without_a_readable_marker():
+    assert parse_marker("<p>Article</p>") is None
+    assert parse_marker("<!-- minigist:v1 model=x -->") is None
+    assert parse_marker(render_entry_content("A summary.", "<p>Original</p>")) is None
+    assert not is_summarized("<p>Article</p>")
+    assert is_summarized(f"<p>{WATERMARK_DETECTOR}</p>")
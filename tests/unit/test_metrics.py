@@ -0,0 +1,52 @@
+import json
+
+from minigist.metrics import Histogram, PipelineMetrics
+
+
+class TestHistogram:
+    def test_quantile_without_observations(self):
+        histogram = Histogram(buckets=(1.0, 2.0))
+        assert histogram.quantile(0.5) is None
+
+    def test_quantile_interpolates_within_bucket(self):
+        histogram = Histogram(buckets=(1.0, 2.0, 4.0))
+        for value in (0.5, 1.5, 1.5, 3.0):
+            histogram.observe(value)
+
+        assert histogram.bucket_counts == [1, 3, 4]
+        assert histogram.quantile(0.5) == 1.5
+        assert histogram.quantile(1.0) == 4.0
+
+
+class TestPipelineMetrics:
+    def test_render_prometheus(self):
+        metrics = PipelineMetrics()
+        metrics.observe_stage("llm", 0.2)
+        metrics.record_retry("generate_summary")
+
+        rendered = metrics.render_prometheus()
+
+        assert "# TYPE minigist_retries_total counter" in rendered
+        assert 'minigist_retries_total{operation="generate_summary"} 1' in rendered
+        assert 'minigist_stage_duration_seconds_bucket{stage="llm",le="0.25"} 1' in rendered
+        assert 'minigist_stage_duration_seconds_bucket{stage="llm",le="+Inf"} 1' in rendered
+        assert 'minigist_stage_duration_seconds_count{stage="llm"} 1' in rendered
+
+    def test_queue_depth_tracks_maximum(self):
+        metrics = PipelineMetrics()
+        metrics.observe_queue_depth("in", 3)
+        metrics.observe_queue_depth("in", 1)
+
+        snapshot = metrics.to_dict()
+
+        assert snapshot["gauges"]["queue_depth_max"] == [{"labels": {"queue": "in"}, "value": 3}]
+
+    def test_write_json(self, tmp_path):
+        metrics = PipelineMetrics()
+        metrics.observe_stage("fetch", 1.0)
+        path = tmp_path / "metrics.json"
+
+        metrics.write_json(path)
+
+        data = json.loads(path.read_text())
+        assert data["histograms"]["stage_duration_seconds"][0]["count"] == 1
@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from minigist.config import FetchConfig, MinifluxConfig
+from minigist.exceptions import MinifluxApiError
+from minigist.miniflux_client import MinifluxClient
+
+ENTRY_PAYLOAD = {
+    "id": 7,
+    "user_id": 1,
+    "feed_id": 3,
+    "title": "Example",
+    "url": "https://example.com/article",
+    "content": "<p>Body</p>",
+    "hash": "abc",
+    "published_at": "2024-01-01T00:00:00Z",
+    "created_at": "2024-01-01T00:00:00Z",
+    "status": "unread",
+    "feed": {"id": 3, "title": "Example Feed", "site_url": "https://example.com"},
+    "enclosures": [],
+    "tags": ["news"],
+}
+
+
+def _make_client(handler, concurrency: int = 4) -> MinifluxClient:
+    client = MinifluxClient(
+        MinifluxConfig(url="http://miniflux.example.com", api_key="key", concurrency=concurrency)  # type: ignore[arg-type]
+    )
+    client.http_client = httpx.AsyncClient(
+        base_url="http://miniflux.example.com/v1",
+        headers={"X-Auth-Token": "key"},
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def test_get_entries_parses_response_bytes_and_ignores_unused_fields():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=json.dumps({"total": 1, "entries": [ENTRY_PAYLOAD]}).encode())
+
+    client = _make_client(handler)
+    entries = asyncio.run(client.get_entries(feed_ids=[3], fetch_config=FetchConfig(limit=None)))
+
+    assert [entry.id for entry in entries] == [7]
+    assert entries[0].content == "<p>Body</p>"
+    assert requests[0].url.path == "/v1/feeds/3/entries"
+    assert requests[0].headers["X-Auth-Token"] == "key"
+    assert "limit" not in requests[0].url.params
+    assert requests[0].url.params["status"] == "unread"
+
+
+def test_get_feeds_parses_top_level_list():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/feeds"
+        payload = [{"id": 1, "title": "Feed", "category": {"id": 2, "title": "News"}, "site_url": "x"}]
+        return httpx.Response(200, content=json.dumps(payload).encode())
+
+    feeds = asyncio.run(_make_client(handler).get_feeds())
+
+    assert feeds[0].category is not None
+    assert feeds[0].category.id == 2
+
+
+def test_get_entries_queries_feeds_concurrently_and_keeps_feed_order():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        feed_id = int(request.url.path.split("/")[3])
+        entry = {**ENTRY_PAYLOAD, "id": feed_id * 10, "feed_id": feed_id}
+        return httpx.Response(200, content=json.dumps({"total": 1, "entries": [entry]}).encode())
+
+    client = _make_client(handler)
+    entries = asyncio.run(client.get_entries(feed_ids=[1, 2, 3], fetch_config=FetchConfig()))
+
+    assert [entry.feed_id for entry in entries] == [1, 2, 3]
+    assert max_in_flight > 1
+
+
+def test_get_entries_keeps_feed_requests_within_the_connection_pool():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, content=json.dumps({"total": 0, "entries": []}).encode())
+
+    client = _make_client(handler, concurrency=2)
+    asyncio.run(client.get_entries(feed_ids=list(range(1, 11)), fetch_config=FetchConfig()))
+
+    assert max_in_flight == 2
+
+
+def test_update_entry_puts_content():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201, json={"id": 7})
+
+    asyncio.run(_make_client(handler).update_entry(7, "<p>Summary</p>", log_context={}))
+
+    assert requests[0].method == "PUT"
+    assert requests[0].url.path == "/v1/entries/7"
+    assert json.loads(requests[0].content) == {"content": "<p>Summary</p>"}
+
+
+def test_invalid_payload_raises_api_error():
+    client = _make_client(lambda request: httpx.Response(200, content=b"{not json"))
+
+    async def call_once(action, action_name):
+        return await action()
+
+    client._call_with_retry = call_once  # type: ignore[method-assign]
+
+    with pytest.raises(MinifluxApiError):
+        asyncio.run(client.get_feeds())
@@ -0,0 +1,64 @@
+import random
+
+from minigist.near_duplicates import NearDuplicateIndex, hamming_distance, prompt_key, simhash
+
+VOCABULARY = [f"word{index}" for index in range(500)]
+
+
+def _article(seed: int, length: int = 1_000) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCABULARY) for _ in range(length))
+
+
+def _near_copy(text: str) -> str:
+    words = text.split()
+    words[10] = "Reuters"
+    words.insert(200, "(AP)")
+    return " ".join(words)
+
+
+def test_simhash_is_close_for_near_copies_and_far_for_different_texts():
+    original = simhash(_article(1))
+    near_copy = simhash(_near_copy(_article(1)))
+    unrelated = simhash(_article(2))
+
+    assert original is not None and near_copy is not None and unrelated is not None
+    assert hamming_distance(original, near_copy) <= 6
+    assert hamming_distance(original, unrelated) > 10
+
+
+def test_simhash_skips_short_texts():
+    assert simhash("Too short to fingerprint.") is None
+
+
+def test_index_reuses_summary_for_same_prompt_only(tmp_path):
+    index = NearDuplicateIndex(tmp_path / "fingerprints.sqlite3", max_distance=6)
+    fingerprint = simhash(_article(1))
+    near_copy = simhash(_near_copy(_article(1)))
+    assert fingerprint is not None and near_copy is not None
+
+    index.add(fingerprint, prompt_key("Summarize."), "Summary", "model-a")
+    match = index.lookup(near_copy, prompt_key("Summarize."))
+
+    assert match is not None
+    assert match.summary == "Summary"
+    assert match.model == "model-a"
+    assert index.lookup(near_copy, prompt_key("Summarize differently.")) is None
+    assert (index.lookups, index.hits) == (2, 1)
+    index.close()
+
+
+def test_index_persists_fingerprints(tmp_path):
+    path = tmp_path / "fingerprints.sqlite3"
+    fingerprint = (1 << 63) | 0xABCDEF
+    index = NearDuplicateIndex(path, max_distance=3)
+    index.add(fingerprint, "key", "Summary", "model-a")
+    index.close()
+
+    reopened = NearDuplicateIndex(path, max_distance=3)
+    match = reopened.lookup(fingerprint ^ 0b101, "key")
+
+    assert match is not None
+    assert match.distance == 2
+    assert reopened.lookup(fingerprint ^ 0b1111, "key") is None
+    reopened.close()
@@ -1,13 +1,19 @@
-from datetime import datetime
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from minigist.config import TargetConfig
 from minigist.constants import WATERMARK_DETECTOR
 from minigist.exceptions import ConfigError
+from minigist.journal import EntryJournal
+from minigist.marker import SummaryMarker
 from minigist.models import Category, Entry, Feed
+from minigist.near_duplicates import prompt_key
+from minigist.pipeline import FeedTarget
+from minigist.pipeline.update_worker import render_entry_content
 from minigist.processor import Processor
+from tests.conftest import make_entry
 
 
 @pytest.fixture
@@ -17,21 +23,36 @@ def mock_app_config():
     config.miniflux = MagicMock()
     config.miniflux.url = "http://miniflux.example.com"
     config.miniflux.api_key = "miniflux_api_key"
+    config.miniflux.timeout_seconds = 2
+    config.miniflux.concurrency = 4
+    config.miniflux.http2 = False
 
     config.llm = MagicMock()
     config.llm.model = "test-llm-model"
     config.llm.api_key = "test-llm-api-key"
     config.llm.base_url = "http://llm.example.com/v1"
+    config.llm.timeout_seconds = 60
+    config.llm.concurrency = 5
+    config.llm.fallbacks = []
 
     config.scraping = MagicMock()
     config.scraping.pure_api_token = "test_pure_token"
     config.scraping.pure_base_urls = []
+    config.scraping.strategy = "single"
+    config.scraping.circuit_breaker.enabled = False
+    config.scraping.cache.enabled = False
 
     config.fetch = MagicMock()
     config.fetch.limit = 100
 
     config.notifications = MagicMock()
     config.notifications.urls = []
+    config.tracing.enabled = False
+    config.journal.enabled = False
+    config.near_duplicates.enabled = False
+    config.run.max_duration_seconds = None
+    config.run.cpu_workers = None
+    config.coordination.enabled = False
     config.default_prompt_id = None
     config.prompts = [MagicMock()]
     config.prompts[0].id = "default"
@@ -41,6 +62,7 @@ def mock_app_config():
     config.targets[0].feed_ids = [1, 3]
     config.targets[0].category_ids = []
     config.targets[0].use_pure = False
+    config.targets[0].llm_endpoint_id = None
     return config
 
 
@@ -50,30 +72,13 @@ def processor_instance(mock_app_config):
     processor.client = MagicMock()  # type: ignore[assignment]
     processor.summarizer = MagicMock()
     processor.downloader = MagicMock()
-    processor.feed_target_map = {1: ("default", False), 2: ("default", True)}
+    processor.feed_target_map = {
+        1: FeedTarget(prompt_id="default", use_pure=False),
+        2: FeedTarget(prompt_id="default", use_pure=True),
+    }
     return processor
 
 
-def create_mock_entry(entry_id: int, content: str) -> Entry:
-    return Entry(
-        id=entry_id,
-        user_id=1,
-        feed_id=1,
-        title=f"Test Entry {entry_id}",
-        url=f"http://example.com/{entry_id}",
-        comments_url="",
-        author="Test Author",
-        content=content,
-        hash="testhash",
-        published_at=datetime.now(),
-        created_at=datetime.now(),
-        status="unread",
-        share_code="",
-        starred=False,
-        reading_time=0,
-    )
-
-
 class TestProcessorFilterUnsummarizedEntries:
     def test_filter_no_entries(self, processor_instance: Processor):
         entries: list[Entry] = []
@@ -82,8 +87,8 @@ class TestProcessorFilterUnsummarizedEntries:
 
     def test_filter_all_unsummarized(self, processor_instance: Processor):
         entries = [
-            create_mock_entry(1, "Content without watermark."),
-            create_mock_entry(2, "Another fresh article."),
+            make_entry(1, content="Content without watermark."),
+            make_entry(2, content="Another fresh article."),
         ]
         filtered = processor_instance._filter_unsummarized_entries(entries)
         assert len(filtered) == 2
@@ -92,18 +97,18 @@ class TestProcessorFilterUnsummarizedEntries:
 
     def test_filter_all_summarized(self, processor_instance: Processor):
         entries = [
-            create_mock_entry(1, f"Content with {WATERMARK_DETECTOR}."),
-            create_mock_entry(2, f"Already processed. {WATERMARK_DETECTOR} here."),
+            make_entry(1, content=f"Content with {WATERMARK_DETECTOR}."),
+            make_entry(2, content=f"Already processed. {WATERMARK_DETECTOR} here."),
         ]
         filtered = processor_instance._filter_unsummarized_entries(entries)
         assert len(filtered) == 0
 
     def test_filter_mixed_entries(self, processor_instance: Processor):
         entries = [
-            create_mock_entry(1, "Needs summarization."),
-            create_mock_entry(2, f"This one has the {WATERMARK_DETECTOR}."),
-            create_mock_entry(3, "Another to process."),
-            create_mock_entry(4, f"{WATERMARK_DETECTOR} is present."),
+            make_entry(1, content="Needs summarization."),
+            make_entry(2, content=f"This one has the {WATERMARK_DETECTOR}."),
+            make_entry(3, content="Another to process."),
+            make_entry(4, content=f"{WATERMARK_DETECTOR} is present."),
         ]
         filtered = processor_instance._filter_unsummarized_entries(entries)
         assert len(filtered) == 2
@@ -111,31 +116,55 @@ class TestProcessorFilterUnsummarizedEntries:
         assert filtered[1].id == 3
 
     def test_filter_entry_with_watermark_substring_but_not_exact(self, processor_instance: Processor):
-        entries = [create_mock_entry(1, "Content that mentions 'Summarized by minigi' but not the full detector.")]
+        entries = [make_entry(1, content="Content that mentions 'Summarized by minigi' but not the full detector.")]
         filtered = processor_instance._filter_unsummarized_entries(entries)
         assert len(filtered) == 1
         assert filtered[0].id == 1
 
 
+class TestProcessorFilterStaleEntries:
+    def test_refresh_keeps_only_entries_summarized_with_another_prompt(self, processor_instance: Processor):
+        current = SummaryMarker(prompt_key("Test prompt"), model="test-llm-model")
+        outdated = SummaryMarker(prompt_key("Old prompt"), model="test-llm-model")
+        entries = [
+            make_entry(1, content=render_entry_content("Summary.", "<p>Current</p>", current)),
+            make_entry(2, content=render_entry_content("Summary.", "<p>Outdated</p>", outdated)),
+            make_entry(3, content=render_entry_content("Summary.", "<p>Unmarked</p>")),
+            make_entry(4, content="<p>Never summarized</p>"),
+        ]
+        processor_instance.refresh = True
+
+        filtered = processor_instance._filter_unsummarized_entries(entries)
+
+        assert [(entry.id, entry.content) for entry in filtered] == [(2, "<p>Outdated</p>")]
+
+        processor_instance.include_unmarked = True
+        filtered = processor_instance._filter_unsummarized_entries(entries)
+
+        assert [entry.id for entry in filtered] == [2, 3]
+
+
 class TestProcessorBuildFeedTargetMap:
     def test_build_feed_target_map_resolves_feeds_and_categories(self, processor_instance: Processor):
         feed1 = Feed(id=1, title="A", category=Category(id=10, title="Cat 10"))
         feed2 = Feed(id=2, title="B", category=Category(id=20, title="Cat 20"))
         processor_instance.client = MagicMock()  # type: ignore[assignment]
+        processor_instance.client.get_feeds = AsyncMock()
         processor_instance.client.get_feeds.return_value = [feed1, feed2]
         processor_instance.config.targets = [
             TargetConfig(prompt_id="default", feed_ids=[1], category_ids=None, use_pure=False),
             TargetConfig(prompt_id="default", feed_ids=None, category_ids=[20], use_pure=True),
         ]
 
-        feed_target_map = processor_instance._build_feed_target_map()
+        feed_target_map = asyncio.run(processor_instance._build_feed_target_map())
 
-        assert feed_target_map[1] == ("default", False)
-        assert feed_target_map[2] == ("default", True)
+        assert feed_target_map[1] == FeedTarget(prompt_id="default", use_pure=False)
+        assert feed_target_map[2] == FeedTarget(prompt_id="default", use_pure=True)
 
     def test_build_feed_target_map_conflicting_feed_assignment(self, processor_instance: Processor):
         feed1 = Feed(id=1, title="A", category=None)
         processor_instance.client = MagicMock()  # type: ignore[assignment]
+        processor_instance.client.get_feeds = AsyncMock()
         processor_instance.client.get_feeds.return_value = [feed1]
         processor_instance.config.targets = [
             TargetConfig(prompt_id="default", feed_ids=[1], category_ids=None, use_pure=False),
@@ -143,10 +172,50 @@ class TestProcessorBuildFeedTargetMap:
         ]
 
         with pytest.raises(ConfigError):
-            processor_instance._build_feed_target_map()
+            asyncio.run(processor_instance._build_feed_target_map())
 
     def test_filter_entry_content_is_empty(self, processor_instance: Processor):
-        entries = [create_mock_entry(1, "")]
+        entries = [make_entry(1, content="")]
         filtered = processor_instance._filter_unsummarized_entries(entries)
         assert len(filtered) == 1
         assert filtered[0].id == 1
+
+
+class TestProcessorResumeFromJournal:
+    def test_journaled_summaries_skip_fetch_and_llm(self, processor_instance: Processor, tmp_path):
+        journal = EntryJournal(tmp_path / "journal.sqlite3")
+        journal.record_fetched(1)
+        journal.record_summarized(1, "Journaled summary", "test-llm-model", prompt_key("Test prompt"))
+        processor_instance.journal = journal
+        entries = [make_entry(1, content="Original"), make_entry(2, content="Original")]
+
+        resumed, remaining = processor_instance._split_resumable_entries(entries)
+
+        assert [item.entry.id for item in resumed] == [1]
+        assert resumed[0].summary == "Journaled summary"
+        assert resumed[0].model == "test-llm-model"
+        assert resumed[0].prompt_hash == prompt_key("Test prompt")
+        assert [entry.id for entry in remaining] == [2]
+        journal.close()
+
+    def test_journaled_summaries_from_another_prompt_are_summarized_again(
+        self, processor_instance: Processor, tmp_path
+    ):
+        journal = EntryJournal(tmp_path / "journal.sqlite3")
+        journal.record_summarized(1, "Old prompt summary", "test-llm-model", prompt_key("Previous prompt"))
+        processor_instance.journal = journal
+        entries = [make_entry(1, content="Original")]
+
+        resumed, remaining = processor_instance._split_resumable_entries(entries)
+
+        assert resumed == []
+        assert remaining == entries
+        journal.close()
+
+    def test_without_journal_all_entries_remain(self, processor_instance: Processor):
+        entries = [make_entry(1, content="Original")]
+
+        resumed, remaining = processor_instance._split_resumable_entries(entries)
+
+        assert resumed == []
+        assert remaining == entries
@@ -0,0 +1,38 @@
+import logging
+
+from minigist.profiling import EventLoopBlockingCollector
+
+
+def create_slow_callback_record(handle: str, duration: float) -> logging.LogRecord:
+    return logging.LogRecord(
+        "asyncio", logging.WARNING, __file__, 1, "Executing %s took %.3f seconds", (handle, duration), None
+    )
+
+
+class TestEventLoopBlockingCollector:
+    def test_attributes_episode_to_worker(self):
+        collector = EventLoopBlockingCollector()
+        handle = "<Task pending name='Task-3' coro=<UpdateWorker.run() running at update_worker.py:97>>"
+
+        collector.emit(create_slow_callback_record(handle, 0.25))
+
+        assert collector.episodes[0]["worker"] == "UpdateWorker"
+        assert collector.episodes[0]["coroutine"] == "UpdateWorker.run"
+        assert collector.summary() == {"UpdateWorker": {"count": 1, "total_seconds": 0.25}}
+
+    def test_unattributed_episode(self):
+        collector = EventLoopBlockingCollector()
+
+        collector.emit(create_slow_callback_record("<Handle BaseSelectorEventLoop._read_from_self()>", 0.2))
+
+        assert collector.episodes[0]["worker"] is None
+        assert collector.summary() == {"other": {"count": 1, "total_seconds": 0.2}}
+
+    def test_ignores_other_asyncio_warnings(self):
+        collector = EventLoopBlockingCollector()
+
+        collector.emit(
+            logging.LogRecord("asyncio", logging.WARNING, __file__, 1, "Unclosed client session", None, None)
+        )
+
+        assert collector.episodes == []
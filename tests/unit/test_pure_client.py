@@ -1,3 +1,7 @@
+import httpx
+import pytest
+
+from minigist.exceptions import ArticleTransportError
 from minigist.pure_client import DEFAULT_PUREMD_API_BASE_URL, PureMDClient
 
 
@@ -33,3 +37,28 @@ class TestPureMDClientPrepareRequestUrl:
         target_url = "https://news.com/story.html"
         expected = custom_base + "/" + target_url
         assert client._prepare_request_url(target_url) == expected
+
+
+class TestPureMDClientFetchMarkdownContent:
+    @staticmethod
+    def _client(handler) -> PureMDClient:
+        client = PureMDClient(api_token="test_token")
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_missing_article_returns_none(self):
+        client = self._client(lambda request: httpx.Response(404))
+        assert client.fetch_markdown_content("https://example.com/article") is None
+
+    def test_server_error_is_a_transport_error(self):
+        client = self._client(lambda request: httpx.Response(503))
+        with pytest.raises(ArticleTransportError):
+            client.fetch_markdown_content("https://example.com/article")
+
+    def test_connection_error_is_a_transport_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        client = self._client(handler)
+        with pytest.raises(ArticleTransportError):
+            client.fetch_markdown_content("https://example.com/article")
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from minigist.rate_limiter import TokenBucket
+
+
+def test_token_bucket_allows_burst_then_reports_wait():
+    bucket = TokenBucket(capacity=2, refill_per_second=0.5)
+
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    assert bucket.take() == pytest.approx(2, abs=0.1)
+
+
+def test_token_bucket_state_is_shared_through_file(tmp_path):
+    path = tmp_path / "state" / "bucket.json"
+    first = TokenBucket(capacity=2, refill_per_second=0.01, state_path=path)
+    second = TokenBucket(capacity=2, refill_per_second=0.01, state_path=path)
+
+    assert first.take() == 0
+    assert second.take() == 0
+    assert first.take() > 0
+    assert path.exists()
+
+
+def test_token_bucket_try_acquire_does_not_wait():
+    bucket = TokenBucket(capacity=1, refill_per_second=0.001)
+
+    async def run() -> list[bool]:
+        return [await bucket.try_acquire(), await bucket.try_acquire()]
+
+    assert asyncio.run(run()) == [True, False]
+
+
+def test_token_bucket_recovers_from_corrupt_state_file(tmp_path):
+    path = tmp_path / "bucket.json"
+    path.write_text("not json")
+
+    assert TokenBucket(capacity=1, refill_per_second=1, state_path=path).take() == 0
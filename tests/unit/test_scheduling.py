@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+
+from minigist.models import Entry
+from minigist.scheduling import prioritize_entries
+from tests.conftest import make_entry
+
+BASE_TIME = datetime(2025, 1, 1)
+
+
+def _hours_ago(hours: int) -> datetime:
+    return BASE_TIME - timedelta(hours=hours)
+
+
+def _by_feed(entry: Entry) -> int:
+    return entry.feed_id
+
+
+def test_prioritize_entries_interleaves_feeds_newest_first():
+    entries = [
+        make_entry(1, feed_id=1, published_at=_hours_ago(3)),
+        make_entry(2, feed_id=1, published_at=_hours_ago(1)),
+        make_entry(3, feed_id=1, published_at=_hours_ago(2)),
+        make_entry(4, feed_id=2, published_at=_hours_ago(5)),
+    ]
+
+    ordered = prioritize_entries(entries, lambda entry: None, lambda group: 1.0)
+
+    assert [entry.id for entry in ordered] == [2, 4, 3, 1]
+
+
+def test_prioritize_entries_shares_turns_by_weight():
+    entries = [make_entry(i, feed_id=1, published_at=_hours_ago(i)) for i in range(6)]
+    entries += [make_entry(100 + i, feed_id=2, published_at=_hours_ago(i)) for i in range(6)]
+    weights = {1: 2.0, 2: 1.0}
+
+    ordered = prioritize_entries(entries, _by_feed, weights.__getitem__)
+
+    first_six = [entry.feed_id for entry in ordered[:6]]
+    assert first_six.count(1) == 4
+    assert first_six.count(2) == 2
+    assert len(ordered) == len(entries)
+
+
+def test_prioritize_entries_puts_starred_entries_first():
+    entries = [
+        make_entry(1, feed_id=1, published_at=_hours_ago(0)),
+        make_entry(2, feed_id=2, published_at=_hours_ago(9), starred=True),
+        make_entry(3, feed_id=1, published_at=_hours_ago(1)),
+    ]
+
+    ordered = prioritize_entries(entries, _by_feed, lambda group: 1.0)
+
+    assert ordered[0].id == 2
@@ -0,0 +1,66 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from minigist.exceptions import MinifluxApiError
+from minigist.models import Entry
+from minigist.pipeline.update_worker import render_entry_content
+from minigist.strip import StripCheckpoint, SummaryStripper, split_summary
+from tests.conftest import make_entry
+
+ORIGINAL_CONTENT = "<p>Original <em>article</em> content.</p>\n<hr>\n<p>With a rule of its own.</p>"
+
+
+def _client(entries: list[Entry], failing_ids: frozenset[int] = frozenset()) -> MagicMock:
+    async def get_entry_page(after_entry_id, limit, feed_id=None, filters=None):
+        return [entry for entry in entries if entry.id > after_entry_id][:limit]
+
+    async def update_entry(entry_id, content, log_context):
+        if entry_id in failing_ids:
+            raise MinifluxApiError(f"Failed to update entry ID {entry_id}")
+
+    client = MagicMock()
+    client.get_entry_page = AsyncMock(side_effect=get_entry_page)
+    client.update_entry = AsyncMock(side_effect=update_entry)
+    return client
+
+
+def test_split_summary_restores_rendered_content():
+    rendered = render_entry_content("A **short** summary.", ORIGINAL_CONTENT)
+
+    assert split_summary(rendered) == ORIGINAL_CONTENT
+    assert split_summary(ORIGINAL_CONTENT) is None
+    assert split_summary("<p>Summarized by minigist</p>") is None
+
+
+def test_stripper_updates_summarized_entries_and_checkpoints(tmp_path):
+    summarized = render_entry_content("Summary.", ORIGINAL_CONTENT)
+    entries = [
+        make_entry(entry_id, content=summarized if entry_id % 2 else ORIGINAL_CONTENT) for entry_id in range(1, 8)
+    ]
+    client = _client(entries)
+    checkpoint = StripCheckpoint(tmp_path / "checkpoint.json", {"status": None})
+
+    stats = asyncio.run(SummaryStripper(client, concurrency=2, checkpoint=checkpoint, page_size=3).run())
+
+    assert stats.scanned == 7
+    assert stats.stripped == 4
+    assert {call.args[0] for call in client.update_entry.await_args_list} == {1, 3, 5, 7}
+    assert all(call.args[1] == ORIGINAL_CONTENT for call in client.update_entry.await_args_list)
+    assert StripCheckpoint(tmp_path / "checkpoint.json", {"status": None}).position("all") == 7
+    assert StripCheckpoint(tmp_path / "checkpoint.json", {"status": "read"}).position("all") == 0
+
+
+def test_checkpoint_stops_before_failed_updates(tmp_path):
+    summarized = render_entry_content("Summary.", ORIGINAL_CONTENT)
+    entries = [make_entry(entry_id, content=summarized) for entry_id in range(1, 8)]
+    checkpoint = StripCheckpoint(tmp_path / "checkpoint.json", {})
+
+    stats = asyncio.run(
+        SummaryStripper(
+            _client(entries, failing_ids=frozenset({5})), concurrency=2, checkpoint=checkpoint, page_size=3
+        ).run()
+    )
+
+    assert stats.stripped == 6
+    assert stats.failed == 1
+    assert StripCheckpoint(tmp_path / "checkpoint.json", {}).position("all") == 3
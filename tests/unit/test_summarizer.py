@@ -0,0 +1,171 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from minigist.config import HedgingConfig, LLMConfig, LLMEndpointConfig
+from minigist.constants import LLM_ENDPOINT_FAILURE_THRESHOLD
+from minigist.exceptions import LLMContentRejectedError, LLMServiceError
+from minigist.summarizer import Summarizer, SummaryOutput
+
+
+def create_completion(summary: str) -> MagicMock:
+    completion = MagicMock()
+    completion.choices[0].message.content = SummaryOutput(summary_markdown=summary, error=False).model_dump_json()
+    return completion
+
+
+@pytest.fixture
+def summarizer() -> Summarizer:
+    config = LLMConfig(
+        api_key="test-key",
+        model="primary-model",
+        base_url="https://api.test.com",
+        fallbacks=[LLMEndpointConfig(id="backup", model="backup-model")],
+    )
+    return Summarizer(config)
+
+
+class TestSummarizerEndpointChain:
+    def test_resolve_chain_prefers_target_endpoint(self, summarizer: Summarizer):
+        chain = summarizer._resolve_endpoint_chain("backup")
+        assert [endpoint.id for endpoint in chain] == ["backup", "primary"]
+
+    def test_resolve_chain_unknown_endpoint(self, summarizer: Summarizer):
+        with pytest.raises(LLMServiceError):
+            summarizer._resolve_endpoint_chain("missing")
+
+    def test_generate_summary_fails_over(self, summarizer: Summarizer):
+        primary, backup = summarizer.endpoints
+        primary.client = MagicMock()
+        primary.client.chat.completions.create = AsyncMock(side_effect=RuntimeError("provider down"))
+        backup.client = MagicMock()
+        backup.client.chat.completions.create = AsyncMock(return_value=create_completion("Backup summary"))
+
+        result = asyncio.run(summarizer.generate_summary("Article text", "Prompt", log_context={}))
+
+        assert result.markdown == "Backup summary"
+        assert result.model == "backup-model"
+
+    def test_generate_summary_raises_when_all_endpoints_fail(self, summarizer: Summarizer):
+        for endpoint in summarizer.endpoints:
+            endpoint.client = MagicMock()
+            endpoint.client.chat.completions.create = AsyncMock(side_effect=RuntimeError("provider down"))
+
+        with pytest.raises(LLMServiceError):
+            asyncio.run(summarizer.generate_summary("Article text", "Prompt", log_context={}))
+
+    def test_generate_summary_does_not_fail_over_on_rejected_content(self, summarizer: Summarizer):
+        rejection = MagicMock()
+        rejection.choices[0].message.content = SummaryOutput(summary_markdown="", error=True).model_dump_json()
+        primary, backup = summarizer.endpoints
+        primary.client = MagicMock()
+        primary.client.chat.completions.create = AsyncMock(return_value=rejection)
+        backup.client = MagicMock()
+        backup.client.chat.completions.create = AsyncMock(return_value=create_completion("Backup summary"))
+
+        with pytest.raises(LLMContentRejectedError):
+            asyncio.run(summarizer.generate_summary("Not an article", "Prompt", log_context={}))
+        backup.client.chat.completions.create.assert_not_called()
+
+    def test_endpoint_clients_leave_retries_to_the_llm_worker(self, summarizer: Summarizer):
+        assert all(endpoint.client_kwargs["max_retries"] == 0 for endpoint in summarizer.endpoints)
+
+    def test_repeatedly_failing_endpoint_is_tried_last(self, summarizer: Summarizer):
+        primary, backup = summarizer.endpoints
+        primary.client = MagicMock()
+        primary.client.chat.completions.create = AsyncMock(side_effect=RuntimeError("provider down"))
+        backup.client = MagicMock()
+        backup.client.chat.completions.create = AsyncMock(return_value=create_completion("Backup summary"))
+
+        async def summarize_entries() -> None:
+            for _ in range(5):
+                result = await summarizer.generate_summary("Article text", "Prompt", log_context={})
+                assert result.markdown == "Backup summary"
+
+        asyncio.run(summarize_entries())
+
+        assert primary.client.chat.completions.create.await_count == LLM_ENDPOINT_FAILURE_THRESHOLD
+        assert [endpoint.id for endpoint in summarizer._resolve_endpoint_chain(None)] == ["backup", "primary"]
+
+
+class TestSummarizerHedging:
+    @pytest.fixture
+    def hedging_summarizer(self) -> Summarizer:
+        config = LLMConfig(
+            api_key="test-key",
+            model="primary-model",
+            base_url="https://api.test.com",
+            fallbacks=[LLMEndpointConfig(id="backup", model="backup-model")],
+            hedging=HedgingConfig(enabled=True, percentile=0.5, min_samples=1, max_hedges_per_run=1),
+        )
+        return Summarizer(config)
+
+    def test_hedge_wins_when_primary_is_slow(self, hedging_summarizer: Summarizer):
+        async def slow_completion(**kwargs):
+            await asyncio.sleep(1)
+            return create_completion("Slow summary")
+
+        primary, backup = hedging_summarizer.endpoints
+        primary.latencies.record(0.01)
+        primary.client = MagicMock()
+        primary.client.chat.completions.create = AsyncMock(side_effect=slow_completion)
+        backup.client = MagicMock()
+        backup.client.chat.completions.create = AsyncMock(return_value=create_completion("Fast summary"))
+
+        result = asyncio.run(hedging_summarizer.generate_summary("Article text", "Prompt", log_context={}))
+
+        assert result.model == "backup-model"
+        assert hedging_summarizer.hedges_issued == 1
+        assert hedging_summarizer.hedge_wins == 1
+
+    def test_no_hedge_without_latency_samples(self, hedging_summarizer: Summarizer):
+        primary, backup = hedging_summarizer.endpoints
+        primary.client = MagicMock()
+        primary.client.chat.completions.create = AsyncMock(return_value=create_completion("Primary summary"))
+        backup.client = MagicMock()
+        backup.client.chat.completions.create = AsyncMock()
+
+        result = asyncio.run(hedging_summarizer.generate_summary("Article text", "Prompt", log_context={}))
+
+        assert result.model == "primary-model"
+        assert hedging_summarizer.hedges_issued == 0
+        backup.client.chat.completions.create.assert_not_called()
+
+    def test_hedge_budget_is_capped(self, hedging_summarizer: Summarizer):
+        primary, _ = hedging_summarizer.endpoints
+        primary.latencies.record(0.01)
+        hedging_summarizer.hedges_issued = 1
+
+        assert hedging_summarizer._hedge_delay(primary) is None
+
+    def test_failed_hedge_endpoint_is_not_called_again(self):
+        config = LLMConfig(
+            api_key="test-key",
+            model="primary-model",
+            base_url="https://api.test.com",
+            fallbacks=[
+                LLMEndpointConfig(id="backup", model="backup-model"),
+                LLMEndpointConfig(id="last", model="last-model"),
+            ],
+            hedging=HedgingConfig(enabled=True, percentile=0.5, min_samples=1, max_hedges_per_run=1),
+        )
+        summarizer = Summarizer(config)
+
+        async def slow_failure(**kwargs):
+            await asyncio.sleep(0.1)
+            raise RuntimeError("provider down")
+
+        primary, backup, last = summarizer.endpoints
+        primary.latencies.record(0.01)
+        primary.client = MagicMock()
+        primary.client.chat.completions.create = AsyncMock(side_effect=slow_failure)
+        backup.client = MagicMock()
+        backup.client.chat.completions.create = AsyncMock(side_effect=RuntimeError("provider down"))
+        last.client = MagicMock()
+        last.client.chat.completions.create = AsyncMock(return_value=create_completion("Last summary"))
+
+        result = asyncio.run(summarizer.generate_summary("Article text", "Prompt", log_context={}))
+
+        assert result.model == "last-model"
+        assert backup.client.chat.completions.create.await_count == 1
@@ -0,0 +1,45 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from minigist import tracing
+from minigist.config import TracingConfig
+
+
+class TestTracingDisabled:
+    def test_helpers_are_noops(self):
+        entry_span = tracing.start_entry_span({"miniflux_entry_id": 1})
+
+        with tracing.span("fetch", parent=entry_span) as current:
+            tracing.set_attributes(current, tokens=1)
+
+        tracing.end_span(entry_span)
+        assert entry_span is None
+        assert current is None
+
+
+class TestTracingFileExporter:
+    def test_child_spans_share_entry_trace(self, tmp_path):
+        pytest.importorskip("opentelemetry.sdk")
+        trace_file = tmp_path / "spans.jsonl"
+        tracing.configure_tracing(TracingConfig(enabled=True, exporter="file", file_path=trace_file))
+
+        def extract() -> None:
+            with tracing.span("extract"):
+                pass
+
+        try:
+            entry_span = tracing.start_entry_span({"miniflux_entry_id": 1})
+            with tracing.span("fetch", parent=entry_span), ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(tracing.bind_context(extract)).result()
+            tracing.end_span(entry_span)
+        finally:
+            tracing.shutdown_tracing()
+
+        spans = {span["name"]: span for span in map(json.loads, trace_file.read_text().splitlines())}
+        entry_context = spans["entry"]["context"]
+        assert spans["entry"]["attributes"]["miniflux_entry_id"] == 1
+        assert spans["fetch"]["parent_id"] == entry_context["span_id"]
+        assert spans["fetch"]["context"]["trace_id"] == entry_context["trace_id"]
+        assert spans["extract"]["parent_id"] == spans["fetch"]["context"]["span_id"]
@@ -0,0 +1,34 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from minigist.metrics import PipelineMetrics
+from minigist.pipeline import OutQueueItem, UpdateWorker
+from minigist.processing_counts import ProcessingCounts
+from tests.conftest import make_entry
+
+
+def test_unexpected_update_errors_count_as_failures():
+    miniflux_client = MagicMock()
+    miniflux_client.update_entry = AsyncMock(side_effect=[RuntimeError("unexpected"), None])
+    record_failure = MagicMock()
+    worker = UpdateWorker(
+        miniflux_client=miniflux_client,
+        record_failure=record_failure,
+        abort_event=asyncio.Event(),
+        metrics=PipelineMetrics(),
+    )
+    counts = ProcessingCounts()
+
+    async def run() -> None:
+        out_queue: asyncio.Queue[OutQueueItem | None] = asyncio.Queue()
+        for entry_id in (1, 2):
+            out_queue.put_nowait(
+                OutQueueItem(entry=make_entry(entry_id), summary="Summary", log_context={}, error=None)
+            )
+        out_queue.put_nowait(None)
+        await worker.run(out_queue, llm_concurrency=1, update_concurrency=1, counts=counts)
+
+    asyncio.run(run())
+
+    record_failure.assert_called_once()
+    assert counts.processed_entry_ids == {2}
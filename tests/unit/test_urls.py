@@ -0,0 +1,27 @@
+import pytest
+
+from minigist.urls import canonicalize_url
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://Example.com:443/a?utm_source=rss&b=2&a=1#comments", "https://example.com/a?a=1&b=2"),
+        ("https://example.com/a?ref=hn&fbclid=abc&gclid=x", "https://example.com/a"),
+        ("https://example.com/news/story/amp/", "https://example.com/news/story"),
+        ("https://example.com/news/story.amp.html", "https://example.com/news/story.html"),
+        ("https://amp.example.com/news/story", "https://example.com/news/story"),
+        ("https://www.google.com/amp/s/example.com/news/story", "https://example.com/news/story"),
+        ("https://example-com.cdn.ampproject.org/c/s/example.com/news/story", "https://example.com/news/story"),
+        ("http://example.com:8080/a", "http://example.com:8080/a"),
+        ("https://example.com/amplifier?page=2", "https://example.com/amplifier?page=2"),
+        ("https://example.com/amp", "https://example.com/amp"),
+    ],
+)
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_canonicalize_url_leaves_unparseable_urls_untouched():
+    assert canonicalize_url("not a url") == "not a url"
+    assert canonicalize_url("https://example.com:notaport/") == "https://example.com:notaport/"